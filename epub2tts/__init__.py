@@ -9,9 +9,6 @@ from .core.config import Config
 from .core.exceptions import EPUB2TTSError, FileError, TTSEngineError, WhisperError
 from .core.logger import setup_logger, get_logger
 
-# Setup default logger
-logger = setup_logger()
-
 # Version info
 __all__ = [
     'Config',
@@ -4,21 +4,129 @@ Command-line interface for EPUB2TTS
 
 import os
 import sys
+import time
+import shlex
 import logging
 import argparse
+import functools
 from pathlib import Path
 
 from . import __version__
-from .core.logger import setup_logger
+from .core.logger import setup_logger, get_logger
 from .core.config import Config
 from .core.ebook import Ebook
-from .core.tts_engines import get_tts_engine, list_engines, list_voices
-from .converters.book_converter import BookConverter
-from .whisper.transcriber import WhisperTranscriber
 from .core.exceptions import EPUB2TTSError
 
 # Setup logger
-logger = setup_logger()
+logger = get_logger(__name__)
+
+# Loaded TTS engines and Whisper transcribers, kept for the process lifetime
+_ENGINE_CACHE = {}
+_TRANSCRIBER_CACHE = {}
+
+@functools.lru_cache(maxsize=None)
+def _load_whisper():
+    """
+    Import Whisper transcriber on first use, so commands that don't need it
+    skip the import
+    
+    Returns:
+        type: WhisperTranscriber class
+    """
+    from .whisper.transcriber import WhisperTranscriber
+    return WhisperTranscriber
+
+def _get_cached_engine(engine, config):
+    """
+    Get TTS engine, reusing an already loaded instance if possible
+    
+    Args:
+        engine (str): TTS engine name
+        config (Config): Configuration
+        
+    Returns:
+        TTSEngine: TTS engine instance
+    """
+    key = (
+        engine,
+        config.get('voice'),
+        config.get('language'),
+        config.get('voice_sample'),
+        config.get('tts_precision'),
+        config.get('tts_compile'),
+    )
+    
+    if key not in _ENGINE_CACHE:
+        from .core.tts_engines import get_tts_engine
+        _ENGINE_CACHE[key] = get_tts_engine(engine, config)
+    else:
+        logger.debug(f"Reusing loaded TTS engine: {engine}")
+    
+    return _ENGINE_CACHE[key]
+
+def _get_cached_transcriber(model, language):
+    """
+    Get Whisper transcriber, reusing an already loaded model if possible
+    
+    Args:
+        model (str): Whisper model name
+        language (str): Language code
+        
+    Returns:
+        WhisperTranscriber: Transcriber instance
+    """
+    key = (model, language)
+    
+    if key not in _TRANSCRIBER_CACHE:
+        _TRANSCRIBER_CACHE[key] = _load_whisper()(model, language)
+    else:
+        logger.debug(f"Reusing loaded Whisper model: {model}")
+    
+    return _TRANSCRIBER_CACHE[key]
+
+def _make_progress_callback(min_interval=0.1, step=10):
+    """
+    Create a throttled progress callback that writes to stdout
+    
+    On a terminal, progress is redrawn at most every min_interval seconds.
+    Otherwise one line is written per step percent.
+    
+    Args:
+        min_interval (float): Minimum seconds between terminal updates
+        step (int): Percent between updates when stdout is not a terminal
+        
+    Returns:
+        callable: Progress callback function
+    """
+    is_tty = sys.stdout.isatty()
+    state = {'last_time': 0.0, 'last_step': -1}
+    
+    def progress_callback(progress):
+        if is_tty:
+            now = time.monotonic()
+            if now - state['last_time'] < min_interval and progress < 99.9:
+                return
+            state['last_time'] = now
+            sys.stdout.write(f"\rProgress: {progress:.1f}%")
+        else:
+            current_step = int(progress // step)
+            if current_step <= state['last_step']:
+                return
+            state['last_step'] = current_step
+            sys.stdout.write(f"Progress: {current_step * step}%\n")
+        
+        sys.stdout.flush()
+    
+    return progress_callback
+
+def clear_caches():
+    """Release all cached TTS engines, TTS models, synthesized phrases and Whisper transcribers"""
+    from .core.tts_engines import clear_model_cache, clear_phrase_cache
+    
+    _ENGINE_CACHE.clear()
+    _TRANSCRIBER_CACHE.clear()
+    clear_model_cache()
+    clear_phrase_cache()
 
 def convert_command(args):
     """
@@ -42,24 +150,39 @@ def convert_command(args):
         config.set('max_workers', args.processes)
         config.set('keep_temp_files', args.keep_temp)
         
+        if args.cache_type:
+            config.set('tts_cache', args.cache_type)
+        
+        if args.cache_dir:
+            config.set('tts_cache_dir', args.cache_dir)
+        
+        if args.cache_size:
+            config.set('tts_cache_size_mb', args.cache_size)
+        
         if args.voice_sample:
             config.set('voice_sample', args.voice_sample)
         
+        if args.precision:
+            config.set('tts_precision', args.precision)
+        
+        if args.compile:
+            config.set('tts_compile', True)
+        
         # Load ebook
         logger.info(f"Loading ebook: {args.input_file}")
         ebook = Ebook(args.input_file)
         
         # Get TTS engine
         logger.info(f"Initializing TTS engine: {args.engine}")
-        tts_engine = get_tts_engine(args.engine, config)
+        tts_engine = _get_cached_engine(args.engine, config)
         
         # Create converter
+        from .converters.book_converter import BookConverter
+        
         converter = BookConverter(ebook, tts_engine, config)
         
         # Define progress callback
-        def progress_callback(progress):
-            sys.stdout.write(f"\rProgress: {progress:.1f}%")
-            sys.stdout.flush()
+        progress_callback = _make_progress_callback()
         
         # Define status callback
         def status_callback(status):
@@ -67,11 +190,9 @@ def convert_command(args):
         
         # Convert book
         if args.text_only:
-            # Extract text only
-            text = ebook.get_full_text()
-            
+            # Extract text only, writing one chapter at a time
             with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(text)
+                ebook.write_full_text(f)
             
             print(f"Text extracted to {args.output}")
         else:
@@ -107,11 +228,9 @@ def extract_command(args):
         logger.info(f"Loading ebook: {args.input_file}")
         ebook = Ebook(args.input_file)
         
-        # Extract text
-        text = ebook.get_full_text()
-        
+        # Extract text, writing one chapter at a time
         with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(text)
+            ebook.write_full_text(f)
         
         print(f"Text extracted to {args.output}")
         return 0
@@ -139,7 +258,7 @@ def transcribe_command(args):
     try:
         # Initialize transcriber
         logger.info(f"Initializing Whisper transcriber with model: {args.model}")
-        transcriber = WhisperTranscriber(args.model, args.language)
+        transcriber = _get_cached_transcriber(args.model, args.language)
         
         # Transcribe audio
         logger.info(f"Transcribing audio: {args.audio_file}")
@@ -176,7 +295,7 @@ def record_command(args):
         # Initialize transcriber
         if args.transcribe:
             logger.info(f"Initializing Whisper transcriber with model: {args.model}")
-            transcriber = WhisperTranscriber(args.model, args.language)
+            transcriber = _get_cached_transcriber(args.model, args.language)
             
             # Record and transcribe
             logger.info(f"Recording and transcribing audio for {args.duration} seconds")
@@ -220,13 +339,17 @@ def list_command(args):
     try:
         if args.what == "engines":
             # List TTS engines
+            from .core.tts_engines import list_engines
+            
             engines = list_engines()
             print("Available TTS engines:")
             for engine in engines:
                 print(f"- {engine}")
         
         elif args.what == "voices":
-            # List voices for TTS engine
+            # List voices for TTS engine, cached by the engines module
+            from .core.tts_engines import list_voices
+            
             voices = list_voices(args.engine)
             print(f"Available voices for {args.engine}:")
             for voice in voices:
@@ -235,7 +358,7 @@ def list_command(args):
         elif args.what == "models":
             # List Whisper models
             try:
-                transcriber = WhisperTranscriber()
+                transcriber = _get_cached_transcriber("base", None)
                 models = transcriber.list_models()
                 print("Available Whisper models:")
                 for model in models:
@@ -286,8 +409,89 @@ def gui_command(args):
         print(f"Unexpected error: {str(e)}")
         return 1
 
-def main():
-    """Main entry point for command-line interface"""
+def serve_command(args, parser):
+    """
+    Handle serve command
+    
+    Reads one command line per line from stdin and runs it in this process,
+    so loaded TTS engines and Whisper models are reused between requests,
+    unless --unload asks for them to be released after each one.
+    
+    Args:
+        args: Command-line arguments
+        parser: Argument parser used to parse each request
+        
+    Returns:
+        int: Exit code
+    """
+    logger.info("Serving commands from stdin")
+    exit_code = 0
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        
+        try:
+            request_args = parser.parse_args(shlex.split(line))
+        except SystemExit:
+            # argparse already printed the usage error
+            exit_code = 1
+            continue
+        
+        if request_args.command in (None, 'serve', 'gui'):
+            print(f"Error: Command not supported in serve mode: {request_args.command}")
+            exit_code = 1
+            continue
+        
+        result = run_command(request_args, parser)
+        if result:
+            exit_code = result
+        
+        if args.unload:
+            clear_caches()
+        
+        sys.stdout.flush()
+    
+    return exit_code
+
+def run_command(args, parser):
+    """
+    Run parsed command
+    
+    Args:
+        args: Command-line arguments
+        parser: Argument parser
+        
+    Returns:
+        int: Exit code
+    """
+    if args.command == 'convert':
+        return convert_command(args)
+    elif args.command == 'extract':
+        return extract_command(args)
+    elif args.command == 'transcribe':
+        return transcribe_command(args)
+    elif args.command == 'record':
+        return record_command(args)
+    elif args.command == 'list':
+        return list_command(args)
+    elif args.command == 'gui':
+        return gui_command(args)
+    elif args.command == 'serve':
+        return serve_command(args, parser)
+    else:
+        # No command specified, show help
+        parser.print_help()
+        return 0
+
+def build_parser():
+    """
+    Build command-line argument parser
+    
+    Returns:
+        argparse.ArgumentParser: Argument parser
+    """
     parser = argparse.ArgumentParser(
         description=f"EPUB2TTS v{__version__} - Convert ebooks to audiobooks"
     )
@@ -317,10 +521,23 @@ def main():
     convert_parser.add_argument('-v', '--voice', help="Voice to use")
     convert_parser.add_argument('-l', '--language', default='en', help="Language code (default: en)")
     convert_parser.add_argument('-s', '--voice-sample', help="Voice sample file for XTTS")
+    convert_parser.add_argument(
+        '--precision',
+        choices=['fp32', 'fp16', 'bf16', 'int8'],
+        help="Model precision for local neural engines such as XTTS (default: fp32)"
+    )
+    convert_parser.add_argument(
+        '--compile',
+        action='store_true',
+        help="Compile local neural engines such as XTTS with torch.compile"
+    )
     convert_parser.add_argument('-c', '--chunk-size', type=int, default=2000, help="Text chunk size (default: 2000)")
-    convert_parser.add_argument('-p', '--processes', type=int, default=4, help="Number of processes (default: 4)")
+    convert_parser.add_argument('-p', '--processes', type=int, help="Number of parallel workers (default: engine-specific)")
     convert_parser.add_argument('-t', '--text-only', action='store_true', help="Extract text only")
     convert_parser.add_argument('-k', '--keep-temp', action='store_true', help="Keep temporary files")
+    convert_parser.add_argument('--cache-type', choices=['none', 'disk'], help="Cache synthesized audio (default: none)")
+    convert_parser.add_argument('--cache-dir', help="TTS cache directory (default: ~/.cache/epub2tts/tts)")
+    convert_parser.add_argument('--cache-size', type=int, help="Maximum TTS cache size in MB (default: 1024)")
     
     # Extract command
     extract_parser = subparsers.add_parser('extract', help="Extract text from ebook")
@@ -351,30 +568,25 @@ def main():
     # GUI command
     gui_parser = subparsers.add_parser('gui', help="Start graphical user interface")
     
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help="Read commands from stdin and run them in one process")
+    serve_parser.add_argument('--unload', action='store_true', help="Release TTS engines and Whisper models after each command instead of reusing them")
+    
+    return parser
+
+def main():
+    """Main entry point for command-line interface"""
+    parser = build_parser()
+    
     # Parse arguments
     args = parser.parse_args()
     
     # Set logging level
     if args.verbose:
-        logger.setLevel(logging.DEBUG)
+        setup_logger(level=logging.DEBUG)
     
     # Handle commands
-    if args.command == 'convert':
-        return convert_command(args)
-    elif args.command == 'extract':
-        return extract_command(args)
-    elif args.command == 'transcribe':
-        return transcribe_command(args)
-    elif args.command == 'record':
-        return record_command(args)
-    elif args.command == 'list':
-        return list_command(args)
-    elif args.command == 'gui':
-        return gui_command(args)
-    else:
-        # No command specified, show help
-        parser.print_help()
-        return 0
+    return run_command(args, parser)
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -6,7 +6,9 @@ import os
 import logging
 from pathlib import Path
 from ..core.exceptions import ConversionError
-from ..core.audio_utils import convert_audio_format, split_audio_file
+from ..core.audio_utils import (
+    convert_audio_format, convert_audio_format_batch, split_audio_file, combine_and_split
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,54 @@ class AudioConverter:
             logger.error(f"Error converting audio file: {str(e)}")
             raise ConversionError(f"Error converting audio file: {str(e)}")
     
+    def convert_formats(self, input_files, output_dir=None, format=None, max_workers=None):
+        """
+        Convert several audio files to a different format in parallel
+        
+        Args:
+            input_files (list): Input file paths
+            output_dir (str, optional): Output directory (default: next to
+                each input file)
+            format (str, optional): Output format
+            max_workers (int, optional): Number of parallel conversions
+                (default: max_workers setting, or the number of CPUs)
+            
+        Returns:
+            list: Output file paths of the successful conversions
+            
+        Raises:
+            ConversionError: If FFmpeg is not available
+        """
+        try:
+            # Determine output format
+            if not format:
+                format = self.output_format
+            
+            # Determine output files
+            pairs = []
+            for input_file in input_files:
+                input_path = Path(input_file)
+                if output_dir:
+                    output_file = os.path.join(output_dir, f"{input_path.stem}.{format}")
+                else:
+                    output_file = str(input_path.with_suffix(f".{format}"))
+                pairs.append((input_file, output_file))
+            
+            # Convert audio files, each FFmpeg process limited to its share of the CPUs
+            output_files = convert_audio_format_batch(
+                pairs, 
+                format=format, 
+                bitrate=f"{self.output_quality}k", 
+                max_workers=max_workers or self.config.get('max_workers')
+            )
+            
+            logger.info(f"Converted {len(output_files)}/{len(pairs)} audio files")
+            return output_files
+        
+        except Exception as e:
+            logger.error(f"Error converting audio files: {str(e)}")
+            raise ConversionError(f"Error converting audio files: {str(e)}")
+    
     def split_audio(self, input_file, output_dir=None, segment_length=300, format=None):
         """
         Split audio file into segments
@@ -113,4 +163,44 @@ class AudioConverter:
         except Exception as e:
             logger.error(f"Error splitting audio file: {str(e)}")
             raise ConversionError(f"Error splitting audio file: {str(e)}")
-
+    
+    def combine_and_split(self, audio_files, output_dir, segment_length=300, format=None,
+                          output_name="audiobook"):
+        """
+        Combine audio files and split the result into segments, without
+        writing the combined file
+        
+        Args:
+            audio_files (list): List of audio file paths
+            output_dir (str): Output directory
+            segment_length (int): Segment length in seconds
+            format (str, optional): Output format
+            output_name (str): Segment file name prefix
+            
+        Returns:
+            list: List of output file paths
+            
+        Raises:
+            ConversionError: If audio files cannot be combined and split
+        """
+        try:
+            # Determine output format
+            if not format:
+                format = self.output_format
+            
+            # Combine and split audio files
+            output_files = combine_and_split(
+                audio_files, 
+                output_dir, 
+                segment_length=segment_length, 
+                format=format, 
+                bitrate=f"{self.output_quality}k", 
+                output_name=output_name
+            )
+            
+            logger.info(f"Combined {len(audio_files)} audio files into {len(output_files)} segments")
+            return output_files
+        
+        except Exception as e:
+            logger.error(f"Error combining and splitting audio files: {str(e)}")
+            raise ConversionError(f"Error combining and splitting audio files: {str(e)}")
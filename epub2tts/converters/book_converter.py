@@ -3,19 +3,168 @@ Book converter for EPUB2TTS
 """
 
 import os
+import asyncio
 import logging
+import shutil
 import tempfile
+import threading
+import collections
+import multiprocessing
 import concurrent.futures
 from pathlib import Path
 from ..core.exceptions import ConversionError
 from ..core.text_utils import split_text_into_chunks
 from ..core.audio_utils import combine_audio_files
+from ..core.tts_cache import get_or_synthesize, get_or_synthesize_many, get_or_synthesize_async, prune_cache
 
 logger = logging.getLogger(__name__)
 
+# TTS engine and cache settings of a process pool worker
+_worker_state = {}
+
+def _synthesize(tts_engine, text, output_file, cache_type=None, cache_dir=None):
+    """
+    Save text to audio file, using the TTS cache if enabled
+    
+    Args:
+        tts_engine: TTS engine object
+        text (str): Text to speak
+        output_file (str): Output file path
+        cache_type (str, optional): TTS cache type (none, disk)
+        cache_dir (str, optional): TTS cache directory
+    """
+    if cache_type == 'disk':
+        get_or_synthesize(tts_engine, text, output_file, cache_dir)
+    else:
+        tts_engine.save_to_file(text, output_file)
+
+def _synthesize_many(tts_engine, texts, output_files, cache_type=None, cache_dir=None):
+    """
+    Save texts to audio files in one engine call, using the TTS cache if enabled
+    
+    Args:
+        tts_engine: TTS engine object
+        texts (list): Texts to speak
+        output_files (list): Output file paths, one per text
+        cache_type (str, optional): TTS cache type (none, disk)
+        cache_dir (str, optional): TTS cache directory
+    """
+    if cache_type == 'disk':
+        get_or_synthesize_many(tts_engine, texts, output_files, cache_dir)
+    else:
+        tts_engine.save_many_to_files(texts, output_files)
+
+async def _synthesize_async(tts_engine, text, output_file, cache_type=None, cache_dir=None):
+    """
+    Save text to audio file asynchronously, using the TTS cache if enabled
+    
+    Args:
+        tts_engine: TTS engine object
+        text (str): Text to speak
+        output_file (str): Output file path
+        cache_type (str, optional): TTS cache type (none, disk)
+        cache_dir (str, optional): TTS cache directory
+    """
+    if cache_type == 'disk':
+        await get_or_synthesize_async(tts_engine, text, output_file, cache_dir)
+    else:
+        await tts_engine.save_to_file_async(text, output_file)
+
+def _load_engine_in_worker(engine_name, config, cache_type, cache_dir, max_workers):
+    """
+    Load TTS engine once per process pool worker
+    
+    Args:
+        engine_name (str): TTS engine name
+        config (dict): TTS engine configuration
+        cache_type (str): TTS cache type (none, disk)
+        cache_dir (str): TTS cache directory
+        max_workers (int): Number of workers in the pool
+    """
+    from ..core.tts_engines import get_tts_engine
+    
+    # Give each worker its share of the cores, torch would otherwise start
+    # one thread per core in every worker
+    try:
+        import torch
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // max_workers))
+    except ImportError:
+        pass
+    
+    _worker_state['engine'] = get_tts_engine(engine_name, config)
+    _worker_state['engine'].warmup()
+    _worker_state['cache_type'] = cache_type
+    _worker_state['cache_dir'] = cache_dir
+
+def _process_chunk_in_worker(chunk, chunk_index, temp_dir, output_format):
+    """
+    Process text chunk in a process pool worker
+    
+    Args:
+        chunk (str): Text chunk
+        chunk_index (int): Chunk index
+        temp_dir (str): Temporary directory
+        output_format (str): Output format
+        
+    Returns:
+        str: Chunk file path
+    """
+    try:
+        chunk_file = os.path.join(temp_dir, f"chunk_{chunk_index}.{output_format}")
+        
+        _synthesize(
+            _worker_state['engine'],
+            chunk,
+            chunk_file,
+            _worker_state['cache_type'],
+            _worker_state['cache_dir']
+        )
+        
+        return chunk_file
+    
+    except Exception as e:
+        logger.error(f"Error processing chunk {chunk_index}: {str(e)}")
+        return None
+
+def _process_batch_in_worker(batch, start_index, temp_dir, output_format):
+    """
+    Process batch of text chunks in a process pool worker
+    
+    Args:
+        batch (list): Text chunks
+        start_index (int): Chunk index of the first chunk in the batch
+        temp_dir (str): Temporary directory
+        output_format (str): Output format
+        
+    Returns:
+        list: Chunk file paths, None for every chunk if the batch failed
+    """
+    try:
+        chunk_files = [
+            os.path.join(temp_dir, f"chunk_{start_index + i}.{output_format}")
+            for i in range(len(batch))
+        ]
+        
+        _synthesize_many(
+            _worker_state['engine'],
+            batch,
+            chunk_files,
+            _worker_state['cache_type'],
+            _worker_state['cache_dir']
+        )
+        
+        return chunk_files
+    
+    except Exception as e:
+        logger.error(f"Error processing chunks {start_index}-{start_index + len(batch) - 1}: {str(e)}")
+        return [None] * len(batch)
+
 class BookConverter:
     """Converter for books to audio"""
     
+    # Maximum number of chapters synthesized but not yet combined
+    MAX_PENDING_COMBINES = 2
+    
     def __init__(self, ebook, tts_engine, config=None):
         """
         Initialize book converter
@@ -29,13 +178,121 @@ class BookConverter:
         self.tts_engine = tts_engine
         self.config = config or {}
         self.chunk_size = self.config.get('chunk_size', 2000)
-        self.max_workers = self.config.get('max_workers', 4)
+        self.max_workers = self.config.get('max_workers') or getattr(tts_engine, 'default_max_workers', 4)
+        self.batch_size = self.config.get('tts_batch_size', 8)
         self.temp_dir = self.config.get('temp_dir', None)
         self.keep_temp_files = self.config.get('keep_temp_files', False)
         self.output_format = self.config.get('output_format', 'mp3')
         self.output_quality = self.config.get('output_quality', 192)
+        self.cache_type = self.config.get('tts_cache', 'none')
+        self.cache_dir = self.config.get('tts_cache_dir', None)
+        self.cache_size_mb = self.config.get('tts_cache_size_mb', 1024)
+        
+        # CPU-bound engines need processes to get around the GIL
+        self.use_processes = getattr(tts_engine, 'parallelism_mode', 'thread') == 'process'
+        
+        # Chapters synthesized at once. CPU-bound engines already fill the cores
+        # with chunks, and their in-process model can't be shared across threads.
+        self.chapter_workers = 1 if self.use_processes else self.config.get('chapter_workers', 2)
+        
+        # Worker pool shared by all chapters, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
+        # Set by cancel(), checked between chapters and chunks
+        self._cancelled = threading.Event()
+    
+    def __enter__(self):
+        """Enter context manager"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context manager, shutting down the worker pool"""
+        self.close()
+    
+    def _get_executor(self):
+        """
+        Get the worker pool, creating it on first use
+        
+        Returns:
+            concurrent.futures.Executor: Thread or process pool executor
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                if self.use_processes:
+                    # Each worker process loads the TTS engine once. Workers are
+                    # spawned rather than forked, so they don't inherit CUDA
+                    # state, models or held locks from the parent.
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_load_engine_in_worker,
+                        initargs=(
+                            self.tts_engine.name, self.tts_engine.config,
+                            self.cache_type, self.cache_dir, self.max_workers
+                        )
+                    )
+                else:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="epub2tts-tts"
+                    )
+            
+            return self._executor
+    
+    def cancel(self):
+        """
+        Stop the conversion at the next chapter or chunk
+        
+        Chunks already being synthesized are finished, the rest are skipped
+        and convert_book() raises ConversionError.
+        """
+        self._cancelled.set()
+    
+    def _check_cancelled(self):
+        """
+        Raise if the conversion was cancelled
+        
+        Raises:
+            ConversionError: If cancel() was called
+        """
+        if self._cancelled.is_set():
+            raise ConversionError("Conversion cancelled")
+    
+    def _cancel_futures(self, futures):
+        """
+        Cancel chunk tasks that haven't started if the conversion was cancelled
+        
+        Args:
+            futures (list): Chunk task futures
+            
+        Raises:
+            ConversionError: If cancel() was called
+        """
+        if self._cancelled.is_set():
+            for future in futures:
+                future.cancel()
+            self._check_cancelled()
+    
+    def close(self):
+        """Shut down the worker pool"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+    
+    def _synthesize(self, text, output_file):
+        """
+        Save text to audio file, using the TTS cache if enabled
+        
+        Args:
+            text (str): Text to speak
+            output_file (str): Output file path
+        """
+        _synthesize(self.tts_engine, text, output_file, self.cache_type, self.cache_dir)
     
-    def convert_chapter(self, chapter_index, output_file=None, progress_callback=None):
+    def convert_chapter(self, chapter_index, output_file=None, progress_callback=None,
+                        chapter_text=None, chapter_title=None, *, temp_dir=None):
         """
         Convert chapter to audio
         
@@ -43,6 +300,10 @@ class BookConverter:
             chapter_index (int): Chapter index
             output_file (str, optional): Output file path
             progress_callback (callable, optional): Progress callback function
+            chapter_text (str, optional): Chapter text, looked up if not given
+            chapter_title (str, optional): Chapter title, looked up if not given
+            temp_dir (str, optional): Temporary directory of the conversion,
+                created if not given
             
         Returns:
             str: Output file path
@@ -50,22 +311,64 @@ class BookConverter:
         Raises:
             ConversionError: If chapter cannot be converted
         """
+        # Create temporary directory if needed
+        if not temp_dir:
+            temp_dir = self.temp_dir
+        if not temp_dir:
+            temp_dir = tempfile.mkdtemp(prefix="epub2tts_")
+        else:
+            os.makedirs(temp_dir, exist_ok=True)
+        
+        synthesized = self._synthesize_chapter(
+            chapter_index,
+            temp_dir,
+            output_file,
+            progress_callback,
+            chapter_text=chapter_text,
+            chapter_title=chapter_title
+        )
+        
+        if not synthesized:
+            return None
+        
+        return self._combine_chapter(chapter_index, *synthesized)
+    
+    def _synthesize_chapter(self, chapter_index, temp_dir, output_file=None, progress_callback=None,
+                            in_memory=False, chapter_text=None, chapter_title=None):
+        """
+        Synthesize chapter text chunks to audio files
+        
+        Args:
+            chapter_index (int): Chapter index
+            temp_dir (str): Temporary directory of the conversion
+            output_file (str, optional): Output file path
+            progress_callback (callable, optional): Progress callback function
+            in_memory (bool): Return single-chunk chapters as audio bytes
+                instead of writing them to the output file
+            chapter_text (str, optional): Chapter text, looked up if not given
+            chapter_title (str, optional): Chapter title, looked up if not given
+            
+        Returns:
+            tuple: (output file path or audio bytes, chunk file paths), or None
+                if the chapter has no audio. Chunk file paths are None if the
+                chapter was synthesized directly.
+            
+        Raises:
+            ConversionError: If chapter cannot be synthesized
+        """
         try:
+            self._check_cancelled()
+            
             # Get chapter text
-            chapter_text = self.ebook.get_chapter_text(chapter_index)
-            chapter_title = self.ebook.get_chapter_title(chapter_index)
+            if chapter_text is None:
+                chapter_text = self.ebook.get_chapter_text(chapter_index)
+            if chapter_title is None:
+                chapter_title = self.ebook.get_chapter_title(chapter_index)
             
             if not chapter_text:
                 logger.warning(f"Chapter {chapter_index} is empty")
                 return None
             
-            # Create temporary directory if needed
-            temp_dir = self.temp_dir
-            if not temp_dir:
-                temp_dir = tempfile.mkdtemp(prefix="epub2tts_")
-            else:
-                os.makedirs(temp_dir, exist_ok=True)
-            
             # Determine output file
             if not output_file:
                 output_file = os.path.join(
@@ -77,8 +380,8 @@ class BookConverter:
             output_dir = os.path.dirname(os.path.abspath(output_file))
             os.makedirs(output_dir, exist_ok=True)
             
-            # Split text into chunks
-            chunks = split_text_into_chunks(chapter_text, self.chunk_size)
+            # Split text into chunks, the processors already cleaned it
+            chunks = split_text_into_chunks(chapter_text, self.chunk_size, already_clean=True)
             
             if not chunks:
                 logger.warning(f"No text chunks in chapter {chapter_index}")
@@ -87,44 +390,58 @@ class BookConverter:
             # Process chunks
             if len(chunks) == 1:
                 # Single chunk, process directly
-                self.tts_engine.save_to_file(chunks[0], output_file)
+                if in_memory and self.cache_type != 'disk':
+                    # Keep short chapters in memory until the book is combined
+                    output_file = self.tts_engine.save_to_bytes(chunks[0], self.output_format)
+                else:
+                    self._synthesize(chunks[0], output_file)
                 
                 if progress_callback:
                     progress_callback(1, 1)
                 
-                logger.info(f"Converted chapter {chapter_index} to {output_file}")
-                return output_file
+                return output_file, None
+            
+            # Chunk files of each chapter get their own subdirectory
+            chunk_dir = os.path.join(temp_dir, f"ch_{chapter_index:04d}")
+            os.makedirs(chunk_dir, exist_ok=True)
             
             # Multiple chunks, process in parallel
-            chunk_files = []
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit tasks
-                future_to_chunk = {
-                    executor.submit(
-                        self._process_chunk, 
-                        chunk, 
-                        i, 
-                        temp_dir
-                    ): i for i, chunk in enumerate(chunks)
-                }
-                
-                # Process results
-                for i, future in enumerate(concurrent.futures.as_completed(future_to_chunk)):
-                    chunk_index = future_to_chunk[future]
-                    
-                    try:
-                        chunk_file = future.result()
-                        if chunk_file:
-                            chunk_files.append(chunk_file)
-                        
-                        if progress_callback:
-                            progress_callback(i + 1, len(chunks))
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing chunk {chunk_index}: {str(e)}")
+            if getattr(self.tts_engine, 'supports_async', False):
+                # Network-bound engines keep many requests in flight on one event loop
+                chunk_files = asyncio.run(
+                    self._process_chunks_async(chunks, chunk_dir, progress_callback)
+                )
+            else:
+                chunk_files = self._process_chunks_parallel(chunks, chunk_dir, progress_callback)
+            
+            if not chunk_files:
+                logger.warning(f"No audio chunks generated for chapter {chapter_index}")
+                return None
+            
+            return output_file, chunk_files
+        
+        except Exception as e:
+            logger.error(f"Error converting chapter {chapter_index}: {str(e)}")
+            raise ConversionError(f"Error converting chapter {chapter_index}: {str(e)}")
+    
+    def _combine_chapter(self, chapter_index, output_file, chunk_files):
+        """
+        Combine synthesized chunk files into chapter audio file
+        
+        Args:
+            chapter_index (int): Chapter index
+            output_file (str or bytes): Output file path, or audio bytes of a
+                chapter synthesized in memory
+            chunk_files (list): Chunk file paths, or None if the chapter was
+                synthesized directly
             
-            # Combine chunk files
+        Returns:
+            str or bytes: Output file path or audio bytes
+            
+        Raises:
+            ConversionError: If chunk files cannot be combined
+        """
+        try:
             if chunk_files:
                 combine_audio_files(
                     chunk_files, 
@@ -135,22 +452,154 @@ class BookConverter:
                 
                 # Clean up chunk files
                 if not self.keep_temp_files:
-                    for chunk_file in chunk_files:
-                        try:
-                            os.unlink(chunk_file)
-                        except Exception as e:
-                            logger.warning(f"Error removing chunk file {chunk_file}: {str(e)}")
-                
+                    chunk_dir = os.path.dirname(chunk_files[0])
+                    try:
+                        shutil.rmtree(chunk_dir)
+                    except Exception as e:
+                        logger.warning(f"Error removing chunk directory {chunk_dir}: {str(e)}")
+            
+            if isinstance(output_file, bytes):
+                logger.info(f"Converted chapter {chapter_index} in memory")
+            else:
                 logger.info(f"Converted chapter {chapter_index} to {output_file}")
-                return output_file
             
-            logger.warning(f"No audio chunks generated for chapter {chapter_index}")
-            return None
+            return output_file
         
         except Exception as e:
             logger.error(f"Error converting chapter {chapter_index}: {str(e)}")
             raise ConversionError(f"Error converting chapter {chapter_index}: {str(e)}")
     
+    def _process_chunks_parallel(self, chunks, temp_dir, progress_callback=None):
+        """
+        Process text chunks in a thread or process pool
+        
+        Args:
+            chunks (list): Text chunks
+            temp_dir (str): Temporary directory
+            progress_callback (callable, optional): Progress callback function
+            
+        Returns:
+            list: Chunk file paths
+        """
+        # Engines that support batching get several chunks per task
+        if getattr(self.tts_engine, 'supports_batching', False) and self.batch_size > 1:
+            return self._process_batches(chunks, temp_dir, progress_callback)
+        
+        # Indexed by chunk so the audio keeps text order, whatever order chunks finish in
+        chunk_files = [None] * len(chunks)
+        executor = self._get_executor()
+        
+        # Submit tasks, tagging each future with its chunk index
+        futures = []
+        for i, chunk in enumerate(chunks):
+            if self.use_processes:
+                future = executor.submit(_process_chunk_in_worker, chunk, i, temp_dir, self.output_format)
+            else:
+                future = executor.submit(self._process_chunk, chunk, i, temp_dir)
+            
+            future.chunk_index = i
+            futures.append(future)
+        
+        # Process results
+        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+            self._cancel_futures(futures)
+            chunk_index = future.chunk_index
+            
+            try:
+                chunk_files[chunk_index] = future.result()
+                
+                if progress_callback:
+                    progress_callback(i + 1, len(chunks))
+            
+            except Exception as e:
+                logger.error(f"Error processing chunk {chunk_index}: {str(e)}")
+        
+        return [chunk_file for chunk_file in chunk_files if chunk_file]
+    
+    def _process_batches(self, chunks, temp_dir, progress_callback=None):
+        """
+        Process text chunks in batches of tts_batch_size
+        
+        Args:
+            chunks (list): Text chunks
+            temp_dir (str): Temporary directory
+            progress_callback (callable, optional): Progress callback function
+            
+        Returns:
+            list: Chunk file paths
+        """
+        chunk_files = [None] * len(chunks)
+        completed = 0
+        executor = self._get_executor()
+        
+        # Submit tasks, tagging each future with the index of its first chunk
+        futures = []
+        for start in range(0, len(chunks), self.batch_size):
+            batch = chunks[start:start + self.batch_size]
+            
+            if self.use_processes:
+                future = executor.submit(_process_batch_in_worker, batch, start, temp_dir, self.output_format)
+            else:
+                future = executor.submit(self._process_batch, batch, start, temp_dir)
+            
+            future.chunk_index = start
+            futures.append(future)
+        
+        # Process results
+        for future in concurrent.futures.as_completed(futures):
+            self._cancel_futures(futures)
+            start = future.chunk_index
+            
+            try:
+                batch_files = future.result()
+                chunk_files[start:start + len(batch_files)] = batch_files
+                completed += len(batch_files)
+                
+                if progress_callback:
+                    progress_callback(completed, len(chunks))
+            
+            except Exception as e:
+                logger.error(f"Error processing chunks starting at {start}: {str(e)}")
+        
+        return [chunk_file for chunk_file in chunk_files if chunk_file]
+    
+    async def _process_chunks_async(self, chunks, temp_dir, progress_callback=None):
+        """
+        Process text chunks concurrently with the engine's async API
+        
+        Args:
+            chunks (list): Text chunks
+            temp_dir (str): Temporary directory
+            progress_callback (callable, optional): Progress callback function
+            
+        Returns:
+            list: Chunk file paths
+        """
+        # Limit in-flight requests for backpressure
+        semaphore = asyncio.Semaphore(self.max_workers * 4)
+        completed = 0
+        
+        async def process(chunk, chunk_index):
+            nonlocal completed
+            
+            async with semaphore:
+                # Skip chunks that hadn't started when the conversion was cancelled
+                if self._cancelled.is_set():
+                    return None
+                chunk_file = await self._process_chunk_async(chunk, chunk_index, temp_dir)
+            
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(chunks))
+            
+            return chunk_file
+        
+        chunk_files = await asyncio.gather(
+            *(process(chunk, i) for i, chunk in enumerate(chunks))
+        )
+        self._check_cancelled()
+        return [chunk_file for chunk_file in chunk_files if chunk_file]
+    
     def _process_chunk(self, chunk, chunk_index, temp_dir):
         """
         Process text chunk
@@ -163,12 +612,79 @@ class BookConverter:
         Returns:
             str: Chunk file path
         """
+        # Skip chunks that hadn't started when the conversion was cancelled
+        if self._cancelled.is_set():
+            return None
+        
         try:
             # Create chunk file path
             chunk_file = os.path.join(temp_dir, f"chunk_{chunk_index}.{self.output_format}")
             
             # Generate speech
-            self.tts_engine.save_to_file(chunk, chunk_file)
+            self._synthesize(chunk, chunk_file)
+            
+            return chunk_file
+        
+        except Exception as e:
+            logger.error(f"Error processing chunk {chunk_index}: {str(e)}")
+            return None
+    
+    def _process_batch(self, batch, start_index, temp_dir):
+        """
+        Process batch of text chunks
+        
+        Args:
+            batch (list): Text chunks
+            start_index (int): Chunk index of the first chunk in the batch
+            temp_dir (str): Temporary directory
+            
+        Returns:
+            list: Chunk file paths, None for every chunk if the batch failed
+        """
+        # Skip batches that hadn't started when the conversion was cancelled
+        if self._cancelled.is_set():
+            return [None] * len(batch)
+        
+        try:
+            # Create chunk file paths
+            chunk_files = [
+                os.path.join(temp_dir, f"chunk_{start_index + i}.{self.output_format}")
+                for i in range(len(batch))
+            ]
+            
+            # Generate speech
+            _synthesize_many(self.tts_engine, batch, chunk_files, self.cache_type, self.cache_dir)
+            
+            return chunk_files
+        
+        except Exception as e:
+            logger.error(f"Error processing chunks {start_index}-{start_index + len(batch) - 1}: {str(e)}")
+            return [None] * len(batch)
+    
+    async def _process_chunk_async(self, chunk, chunk_index, temp_dir):
+        """
+        Process text chunk asynchronously
+        
+        Args:
+            chunk (str): Text chunk
+            chunk_index (int): Chunk index
+            temp_dir (str): Temporary directory
+            
+        Returns:
+            str: Chunk file path
+        """
+        try:
+            # Create chunk file path
+            chunk_file = os.path.join(temp_dir, f"chunk_{chunk_index}.{self.output_format}")
+            
+            # Generate speech
+            await _synthesize_async(
+                self.tts_engine,
+                chunk,
+                chunk_file,
+                self.cache_type,
+                self.cache_dir
+            )
             
             return chunk_file
         
@@ -191,18 +707,24 @@ class BookConverter:
         Raises:
             ConversionError: If book cannot be converted
         """
+        # Create temporary directory if needed, shared by all chapters
+        temp_dir = self.temp_dir
+        if not temp_dir:
+            temp_dir = tempfile.mkdtemp(prefix="epub2tts_")
+        else:
+            os.makedirs(temp_dir, exist_ok=True)
+        
         try:
-            # Create temporary directory if needed
-            temp_dir = self.temp_dir
-            if not temp_dir:
-                temp_dir = tempfile.mkdtemp(prefix="epub2tts_")
-            else:
-                os.makedirs(temp_dir, exist_ok=True)
-            
             # Create output directory if it doesn't exist
             output_dir = os.path.dirname(os.path.abspath(output_file))
             os.makedirs(output_dir, exist_ok=True)
             
+            # Build engine kernels before the first chunk rather than during it.
+            # Worker processes warm up their own engines, and the model is
+            # never loaded in this process.
+            if not self.use_processes:
+                self.tts_engine.warmup()
+            
             # Get chapters
             chapters = self.ebook.get_chapters()
             
@@ -212,53 +734,96 @@ class BookConverter:
                     status_callback("No chapters found in book")
                 return None
             
-            # Convert chapters
-            chapter_files = []
+            # Progress of each chapter, shared by the chapter workers
+            chapter_progress_values = [0.0] * len(chapters)
+            progress_lock = threading.Lock()
             
-            for i, chapter in enumerate(chapters):
+            def synthesize_chapter(i, chapter_title, chapter_text):
                 if status_callback:
                     status_callback(f"Converting chapter {i + 1}/{len(chapters)}")
                 
                 # Define chapter progress callback
                 def chapter_progress(current, total):
                     if progress_callback:
-                        # Calculate overall progress
-                        overall_progress = (i + current / total) / len(chapters) * 100
+                        # Calculate overall progress across chapters in flight
+                        with progress_lock:
+                            chapter_progress_values[i] = current / total
+                            overall_progress = sum(chapter_progress_values) / len(chapters) * 100
                         progress_callback(overall_progress)
                 
-                # Convert chapter
-                chapter_file = self.convert_chapter(i, progress_callback=chapter_progress)
+                return self._synthesize_chapter(
+                    i,
+                    temp_dir,
+                    progress_callback=chapter_progress,
+                    in_memory=True,
+                    chapter_text=chapter_text,
+                    chapter_title=chapter_title
+                )
+            
+            # Synthesize several chapters at once, and combine chapter N while
+            # later chapters are synthesized
+            chapter_files = []
+            synthesizing = collections.deque()
+            combining = collections.deque()
+            
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.chapter_workers,
+                thread_name_prefix="epub2tts-chapter"
+            ) as chapter_executor, concurrent.futures.ThreadPoolExecutor(max_workers=1) as combine_executor:
                 
-                if chapter_file:
-                    chapter_files.append(chapter_file)
+                def collect(max_synthesizing):
+                    # Hand synthesized chapters to the combiner in chapter order
+                    while len(synthesizing) > max_synthesizing:
+                        i, future = synthesizing.popleft()
+                        synthesized = future.result()
+                        
+                        if synthesized:
+                            combining.append(combine_executor.submit(self._combine_chapter, i, *synthesized))
+                        
+                        # Bound the number of chapters waiting to be combined
+                        while len(combining) > self.MAX_PENDING_COMBINES:
+                            chapter_files.append(combining.popleft().result())
+                
+                for i, chapter_title, chapter_text in self.ebook.iter_chapters():
+                    self._check_cancelled()
+                    synthesizing.append(
+                        (i, chapter_executor.submit(synthesize_chapter, i, chapter_title, chapter_text))
+                    )
+                    
+                    # Bound the number of chapter texts held in memory
+                    collect(self.chapter_workers)
+                
+                collect(0)
+                
+                while combining:
+                    chapter_files.append(combining.popleft().result())
             
             # Combine chapter files
             if chapter_files:
                 if status_callback:
                     status_callback("Combining audio files...")
                 
+                # Chapters were already encoded in the output format, so
+                # stream-copy them instead of encoding a second time
                 combine_audio_files(
                     chapter_files, 
                     output_file, 
                     format=self.output_format, 
-                    bitrate=f"{self.output_quality}k"
+                    bitrate=f"{self.output_quality}k",
+                    copy_codec=True
                 )
                 
                 # Clean up chapter files
                 if not self.keep_temp_files:
                     for chapter_file in chapter_files:
+                        if isinstance(chapter_file, bytes):
+                            continue
+                        
                         try:
                             os.unlink(chapter_file)
                         except Exception as e:
                             logger.warning(f"Error removing chapter file {chapter_file}: {str(e)}")
                 
-                # Clean up temporary directory
-                if not self.keep_temp_files and not self.temp_dir:
-                    try:
-                        os.rmdir(temp_dir)
-                    except Exception as e:
-                        logger.warning(f"Error removing temporary directory {temp_dir}: {str(e)}")
-                
                 if status_callback:
                     status_callback(f"Book converted to {output_file}")
                 
@@ -277,4 +842,15 @@ class BookConverter:
                 status_callback(f"Error: {str(e)}")
             
             raise ConversionError(f"Error converting book: {str(e)}")
+        
+        finally:
+            self.close()
+            
+            # Keep the TTS cache within its size limit
+            if self.cache_type == 'disk':
+                prune_cache(self.cache_dir, self.cache_size_mb)
+            
+            # Clean up temporary directory, including files left by failed chapters
+            if not self.keep_temp_files and not self.temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
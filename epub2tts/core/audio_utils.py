@@ -3,41 +3,489 @@ Audio processing utilities for EPUB2TTS
 """
 
 import os
+import sys
+import shutil
+import asyncio
 import subprocess
 import logging
 import tempfile
+import functools
+import threading
+import collections
+import concurrent.futures
 from pathlib import Path
 from .exceptions import ProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Size of the buffer reused for copying audio where sendfile isn't available
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def get_spool_dir():
+    """
+    Get directory for short-lived audio files, preferring tmpfs
+    
+    Returns:
+        str: /dev/shm if available, otherwise None (system temp directory)
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+@functools.lru_cache(maxsize=None)
+def get_program_path(program="ffmpeg"):
+    """
+    Resolve the absolute path of an FFmpeg program once per run
+    
+    Args:
+        program (str): Program name (ffmpeg, ffprobe)
+        
+    Returns:
+        str: Absolute program path, or the bare name if it is not on PATH
+    """
+    return shutil.which(program) or program
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg():
     """
     Check if FFmpeg is installed
     
+    The result is cached, since it does not change during a run.
+    
     Returns:
         bool: True if FFmpeg is installed, False otherwise
     """
     try:
         subprocess.run(
-            ["ffmpeg", "-version"], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
+            [get_program_path("ffmpeg"), "-version"], 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.DEVNULL,
             check=True
         )
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
         return False
 
-def combine_audio_files(audio_files, output_file, format="mp3", bitrate="192k"):
+# Number of trailing FFmpeg stderr lines kept for error messages
+FFMPEG_STDERR_LINES = 64
+
+# Size of the blocks FFmpeg's stderr is read in by asyncio subprocesses
+FFMPEG_STDERR_READ_SIZE = 4096
+
+# Limit FFmpeg's stderr to errors. Its progress stats are separated by
+# carriage returns only, so they would arrive as one unbounded line.
+FFMPEG_LOG_ARGS = ("-nostats", "-v", "error")
+
+def _run_ffmpeg(cmd, input=None):
     """
-    Combine multiple audio files into one
+    Run an FFmpeg command, keeping only the tail of its stderr
+    
+    stdout is discarded. stderr is read line by line into a bounded buffer,
+    and echoed to the debug log when debug logging is enabled.
+    
+    Args:
+        cmd (list): FFmpeg command
+        input (bytes, optional): Data to write to FFmpeg's stdin
+        
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg exits with an error, with
+            the tail of its stderr as the stderr attribute
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_LINES)
+    
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    ) as proc:
+        # Feed stdin from a thread so a full stderr pipe can't deadlock FFmpeg
+        writer = None
+        if input is not None:
+            def write_input():
+                try:
+                    proc.stdin.write(input)
+                    proc.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass
+            
+            writer = threading.Thread(target=write_input, daemon=True)
+            writer.start()
+        
+        for line in proc.stderr:
+            stderr_tail.append(line)
+            if debug:
+                logger.debug(line.decode('utf-8', errors='replace').rstrip())
+        
+        if writer:
+            writer.join()
+        
+        returncode = proc.wait()
+    
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=b"".join(stderr_tail))
+
+async def _run_ffmpeg_async(cmd):
+    """
+    Run an FFmpeg command as an asyncio subprocess, keeping only the tail of
+    its stderr
+    
+    Args:
+        cmd (list): FFmpeg command
+        
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg exits with an error, with
+            the tail of its stderr as the stderr attribute
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_LINES)
+    
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    
+    try:
+        # Read fixed-size blocks, readline() fails on lines over the
+        # stream's 64 KiB limit
+        while True:
+            data = await proc.stderr.read(FFMPEG_STDERR_READ_SIZE)
+            if not data:
+                break
+            stderr_tail.append(data)
+            if debug:
+                logger.debug(data.decode('utf-8', errors='replace').rstrip())
+        
+        returncode = await proc.wait()
+    
+    finally:
+        # Don't leave FFmpeg running unread if reading failed or was cancelled
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=b"".join(stderr_tail))
+
+# FFmpeg codec names of the audio formats that can be stream-copied
+STREAM_COPY_CODECS = {
+    "mp3": "mp3",
+    "m4a": "aac",
+    "aac": "aac",
+    "ogg": "vorbis",
+    "flac": "flac",
+}
+
+def get_audio_params(audio_file):
+    """
+    Get codec parameters of audio file
+    
+    Args:
+        audio_file (str): Audio file path
+        
+    Returns:
+        tuple: (codec name, sample rate, channels), or None if the file cannot be probed
+    """
+    cmd = [
+        get_program_path("ffprobe"),
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name,sample_rate,channels",
+        "-of", "csv=p=0",
+        audio_file
+    ]
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+    
+    params = result.stdout.decode('utf-8', errors='replace').strip().split(',')
+    if len(params) != 3:
+        return None
+    
+    return tuple(params)
+
+def can_stream_copy(audio_files, format="mp3"):
+    """
+    Check if audio files can be concatenated without re-encoding
     
     Args:
         audio_files (list): List of audio file paths
+        format (str): Output format (mp3, wav, etc.)
+        
+    Returns:
+        bool: True if all files use the output codec with the same parameters
+    """
+    codec = STREAM_COPY_CODECS.get(format)
+    if not codec:
+        return False
+    
+    first_params = None
+    for audio_file in audio_files:
+        params = get_audio_params(audio_file)
+        if not params or params[0] != codec:
+            return False
+        
+        if first_params is None:
+            first_params = params
+        elif params != first_params:
+            return False
+    
+    return True
+
+# MPEG audio layer III bitrates (kbps) by bitrate index, for MPEG-1 and MPEG-2/2.5
+MP3_BITRATES = {
+    "1": [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    "2": [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+# MPEG audio sample rates (Hz) by version bits and sample rate index
+MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],  # MPEG-1
+    2: [22050, 24000, 16000],  # MPEG-2
+    0: [11025, 12000, 8000],   # MPEG-2.5
+}
+
+def _parse_mp3_frame_header(header):
+    """
+    Parse MPEG audio layer III frame header
+    
+    Args:
+        header (bytes): First 4 bytes of the frame
+        
+    Returns:
+        tuple: (frame length, bitrate, sample rate, side info length), or None
+            if header is not a valid layer III frame header
+    """
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+    mono = (header[3] >> 6) == 0x03
+    
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    
+    mpeg1 = version == 3
+    bitrate = MP3_BITRATES["1" if mpeg1 else "2"][bitrate_index]
+    sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+    frame_length = (144000 if mpeg1 else 72000) * bitrate // sample_rate + padding
+    
+    if mpeg1:
+        side_info_length = 17 if mono else 32
+    else:
+        side_info_length = 9 if mono else 17
+    
+    return frame_length, bitrate, sample_rate, side_info_length
+
+def _get_mp3_audio_range(f):
+    """
+    Get byte range of the audio frames in constant bitrate MP3 file,
+    excluding ID3 tags and the Info header frame
+    
+    Args:
+        f: MP3 file opened in binary mode
+        
+    Returns:
+        tuple: (start offset, end offset, bitrate, sample rate), or None if
+            the file is not a constant bitrate layer III file
+    """
+    size = os.fstat(f.fileno()).st_size
+    start = 0
+    end = size
+    
+    # Skip ID3v2 tag
+    f.seek(0)
+    header = f.read(10)
+    if header[:3] == b"ID3" and len(header) == 10:
+        tag_size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        start = 10 + tag_size + (10 if header[5] & 0x10 else 0)
+    
+    # Exclude ID3v1 tag
+    if size >= 128:
+        f.seek(size - 128)
+        if f.read(3) == b"TAG":
+            end = size - 128
+    
+    f.seek(start)
+    frame = f.read(4 + 32 + 4)
+    params = _parse_mp3_frame_header(frame)
+    if not params:
+        return None
+    
+    frame_length, bitrate, sample_rate, side_info_length = params
+    
+    # Xing and VBRI header frames mark variable bitrate files
+    tag = frame[4 + side_info_length:8 + side_info_length]
+    if tag == b"Xing" or frame[36:40] == b"VBRI":
+        return None
+    
+    # Skip the Info header frame, its frame count only describes this file
+    if tag == b"Info":
+        start += frame_length
+    
+    return start, end, bitrate, sample_rate
+
+def _copy_file_range(in_file, out_file, start, end, buffer=None):
+    """
+    Copy byte range between files, zero-copy where the platform allows
+    
+    Args:
+        in_file: Input file opened in binary mode
+        out_file: Output file opened in binary mode
+        start (int): Start offset in the input file
+        end (int): End offset in the input file
+        buffer (memoryview, optional): Writable buffer to copy through when
+            sendfile isn't available, so copies of many files share it
+    """
+    in_fd = in_file.fileno()
+    
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(in_fd, start, end - start, os.POSIX_FADV_SEQUENTIAL)
+    
+    offset = start
+    
+    # sendfile only accepts regular file outputs on Linux
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        out_file.flush()
+        while offset < end:
+            sent = os.sendfile(out_file.fileno(), in_fd, offset, end - offset)
+            if sent == 0:
+                break
+            offset += sent
+    else:
+        if buffer is None:
+            buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+        
+        in_file.seek(offset)
+        while offset < end:
+            length = in_file.readinto(buffer[:min(len(buffer), end - offset)])
+            if not length:
+                break
+            out_file.write(buffer[:length])
+            offset += length
+    
+    # The input is read once, so don't let it crowd the page cache
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+def concat_mp3_files(audio_files, output_file):
+    """
+    Concatenate MP3 files by appending their audio frames
+    
+    Only constant bitrate files with the same bitrate and sample rate are
+    concatenated, so the result stays a valid constant bitrate stream.
+    
+    Args:
+        audio_files (list): List of MP3 file paths
+        output_file (str): Output file path
+        
+    Returns:
+        bool: True if the files were concatenated, False if they are not
+            uniform constant bitrate MP3 files
+    """
+    ranges = []
+    first_params = None
+    
+    for audio_file in audio_files:
+        with open(audio_file, 'rb') as f:
+            audio_range = _get_mp3_audio_range(f)
+        
+        if not audio_range:
+            return False
+        
+        if first_params is None:
+            first_params = audio_range[2:]
+        elif audio_range[2:] != first_params:
+            return False
+        
+        ranges.append(audio_range[:2])
+    
+    buffer = None
+    if not (hasattr(os, "sendfile") and sys.platform.startswith("linux")):
+        buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+    
+    with open(output_file, 'wb') as out_file:
+        for audio_file, (start, end) in zip(audio_files, ranges):
+            with open(audio_file, 'rb') as f:
+                _copy_file_range(f, out_file, start, end, buffer)
+    
+    return True
+
+def _spool_audio_bytes(audio_files, format="mp3"):
+    """
+    Write in-memory audio entries to files so FFmpeg can read them
+    
+    Args:
+        audio_files (list): List of audio file paths or in-memory audio bytes
+        format (str): Audio format (mp3, wav, etc.)
+        
+    Returns:
+        tuple: (list of audio file paths, spool directory to remove afterwards
+            or None if nothing was spooled)
+    """
+    if not any(isinstance(audio_file, (bytes, bytearray)) for audio_file in audio_files):
+        return audio_files, None
+    
+    spool_dir = tempfile.mkdtemp(prefix="epub2tts_", dir=get_spool_dir())
+    spooled_files = []
+    
+    for i, audio_file in enumerate(audio_files):
+        if isinstance(audio_file, (bytes, bytearray)):
+            spooled_file = os.path.join(spool_dir, f"audio_{i}.{format}")
+            with open(spooled_file, 'wb') as f:
+                f.write(audio_file)
+            audio_file = spooled_file
+        spooled_files.append(audio_file)
+    
+    return spooled_files, spool_dir
+
+def _make_concat_list(audio_files):
+    """
+    Build an FFmpeg concat demuxer list for audio files
+    
+    Args:
+        audio_files (list): List of audio file paths
+        
+    Returns:
+        bytes: Concat list to feed to FFmpeg on stdin
+    """
+    # Resolve relative paths against the working directory looked up once
+    cwd = os.getcwd()
+    
+    # Paths in a list read from stdin would be resolved against "pipe:", so
+    # they are given the file protocol. Quotes in paths are closed, escaped
+    # and reopened, as the concat demuxer expects.
+    lines = (
+        "file 'file:" + os.path.join(cwd, audio_file).replace("'", "'\\''") + "'"
+        for audio_file in audio_files
+    )
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+def combine_audio_files(audio_files, output_file, format="mp3", bitrate="192k", copy_codec=False):
+    """
+    Combine multiple audio files into one
+    
+    Args:
+        audio_files (iterable): Audio file paths or in-memory audio bytes
         output_file (str): Output file path
         format (str): Output format (mp3, wav, etc.)
         bitrate (str): Output bitrate (e.g., "192k")
+        copy_codec (bool): Stream-copy instead of re-encoding if all files
+            already use the output codec with matching parameters
         
     Returns:
         bool: True if successful, False otherwise
@@ -45,6 +493,8 @@ def combine_audio_files(audio_files, output_file, format="mp3", bitrate="192k"):
     Raises:
         ProcessingError: If audio files cannot be combined
     """
+    audio_files = list(audio_files)
+    
     if not audio_files:
         logger.warning("No audio files to combine")
         return False
@@ -53,40 +503,49 @@ def combine_audio_files(audio_files, output_file, format="mp3", bitrate="192k"):
     if not check_ffmpeg():
         raise ProcessingError("FFmpeg is not installed. Please install FFmpeg to combine audio files.")
     
+    spool_dir = None
+    
     try:
-        # Create temporary file list
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            file_list = f.name
-            for audio_file in audio_files:
-                f.write(f"file '{os.path.abspath(audio_file)}'\n")
+        # Spool in-memory audio to tmpfs so FFmpeg can read it
+        audio_files, spool_dir = _spool_audio_bytes(audio_files, format)
         
         # Create output directory if it doesn't exist
         output_dir = os.path.dirname(os.path.abspath(output_file))
-        os.makedirs(output_dir, exist_ok=True)
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
         
-        # Combine audio files using FFmpeg
+        stream_copy = copy_codec and can_stream_copy(audio_files, format)
+        
+        # Uniform constant bitrate MP3 frames can be appended without FFmpeg
+        if stream_copy and format == "mp3" and concat_mp3_files(audio_files, output_file):
+            logger.info(f"Concatenated {len(audio_files)} MP3 files into {output_file}")
+            return True
+        
+        # Combine audio files using FFmpeg, reading the file list from stdin
         cmd = [
-            "ffmpeg",
+            get_program_path("ffmpeg"),
+            *FFMPEG_LOG_ARGS,
             "-y",  # Overwrite output file if it exists
             "-f", "concat",
             "-safe", "0",
-            "-i", file_list,
-            "-c:a", "libmp3lame" if format == "mp3" else "copy",
-            "-b:a", bitrate,
-            output_file
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
         ]
         
-        logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
+        if stream_copy:
+            # Same codec and parameters, so just remux the frames
+            cmd.extend(["-c", "copy"])
+        else:
+            cmd.extend([
+                "-c:a", "libmp3lame" if format == "mp3" else "copy",
+                "-b:a", bitrate,
+            ])
         
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True
-        )
+        cmd.append(output_file)
+        
+        logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
         
-        # Remove temporary file list
-        os.unlink(file_list)
+        _run_ffmpeg(cmd, input=_make_concat_list(audio_files))
         
         logger.info(f"Combined {len(audio_files)} audio files into {output_file}")
         return True
@@ -98,6 +557,46 @@ def combine_audio_files(audio_files, output_file, format="mp3", bitrate="192k"):
     except Exception as e:
         logger.error(f"Error combining audio files: {str(e)}")
         raise ProcessingError(f"Failed to combine audio files: {str(e)}")
+    
+    finally:
+        if spool_dir:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+def _read_segment_list(segment_list, output_dir):
+    """
+    Read the segment files written by FFmpeg's segment muxer
+    
+    Args:
+        segment_list (str): Flat segment list written by FFmpeg
+        output_dir (str): Directory the segments were written to
+        
+    Returns:
+        list: List of segment file paths in order
+    """
+    with open(segment_list, 'r', encoding='utf-8') as f:
+        return [
+            os.path.join(output_dir, os.path.basename(line.strip()))
+            for line in f
+            if line.strip()
+        ]
+
+def _scan_segments(output_dir, prefix, suffix):
+    """
+    Find segment files by scanning the output directory
+    
+    Args:
+        output_dir (str): Directory the segments were written to
+        prefix (str): Segment file name prefix
+        suffix (str): Segment file name suffix
+        
+    Returns:
+        list: List of segment file paths in order
+    """
+    with os.scandir(output_dir) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+        )
 
 def split_audio_file(input_file, output_dir, segment_length=300, format="mp3", bitrate="192k"):
     """
@@ -120,6 +619,8 @@ def split_audio_file(input_file, output_dir, segment_length=300, format="mp3", b
     if not check_ffmpeg():
         raise ProcessingError("FFmpeg is not installed. Please install FFmpeg to split audio files.")
     
+    segment_list = None
+    
     try:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -127,13 +628,20 @@ def split_audio_file(input_file, output_dir, segment_length=300, format="mp3", b
         # Get input file name without extension
         input_name = Path(input_file).stem
         
+        # Have FFmpeg list the segments it writes
+        fd, segment_list = tempfile.mkstemp(suffix='.txt', dir=get_spool_dir())
+        os.close(fd)
+        
         # Split audio file using FFmpeg
         cmd = [
-            "ffmpeg",
+            get_program_path("ffmpeg"),
+            *FFMPEG_LOG_ARGS,
             "-y",  # Overwrite output files if they exist
             "-i", input_file,
             "-f", "segment",
             "-segment_time", str(segment_length),
+            "-segment_list", segment_list,
+            "-segment_list_type", "flat",
             "-c:a", "libmp3lame" if format == "mp3" else "copy",
             "-b:a", bitrate,
             "-map", "0:a",
@@ -142,19 +650,12 @@ def split_audio_file(input_file, output_dir, segment_length=300, format="mp3", b
         
         logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
         
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True
-        )
+        _run_ffmpeg(cmd)
         
-        # Get list of output files
-        output_files = sorted([
-            os.path.join(output_dir, f) 
-            for f in os.listdir(output_dir) 
-            if f.startswith(f"{input_name}_") and f.endswith(f".{format}")
-        ])
+        # Get list of output files, scanning the directory if FFmpeg left no list
+        output_files = _read_segment_list(segment_list, output_dir)
+        if not output_files:
+            output_files = _scan_segments(output_dir, f"{input_name}_", f".{format}")
         
         logger.info(f"Split audio file {input_file} into {len(output_files)} segments")
         return output_files
@@ -166,8 +667,143 @@ def split_audio_file(input_file, output_dir, segment_length=300, format="mp3", b
     except Exception as e:
         logger.error(f"Error splitting audio file: {str(e)}")
         raise ProcessingError(f"Failed to split audio file: {str(e)}")
+    
+    finally:
+        if segment_list and os.path.exists(segment_list):
+            os.unlink(segment_list)
+
+def combine_and_split(audio_files, output_dir, segment_length=300, format="mp3", bitrate="192k",
+                      output_name="audiobook", copy_codec=True):
+    """
+    Combine multiple audio files and split the result into segments in one
+    FFmpeg pass, without writing the combined file
+    
+    Args:
+        audio_files (iterable): Audio file paths or in-memory audio bytes
+        output_dir (str): Output directory
+        segment_length (int): Segment length in seconds
+        format (str): Output format (mp3, wav, etc.)
+        bitrate (str): Output bitrate (e.g., "192k")
+        output_name (str): Segment file name prefix
+        copy_codec (bool): Stream-copy instead of re-encoding if all files
+            already use the output codec with matching parameters
+        
+    Returns:
+        list: List of output file paths
+        
+    Raises:
+        ProcessingError: If audio files cannot be combined and split
+    """
+    audio_files = list(audio_files)
+    
+    if not audio_files:
+        logger.warning("No audio files to combine")
+        return []
+    
+    # Check if FFmpeg is installed
+    if not check_ffmpeg():
+        raise ProcessingError("FFmpeg is not installed. Please install FFmpeg to combine and split audio files.")
+    
+    spool_dir = None
+    segment_list = None
+    
+    try:
+        # Spool in-memory audio to tmpfs so FFmpeg can read it
+        audio_files, spool_dir = _spool_audio_bytes(audio_files, format)
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Have FFmpeg list the segments it writes
+        fd, segment_list = tempfile.mkstemp(suffix='.txt', dir=get_spool_dir())
+        os.close(fd)
+        
+        # Feed the concat demuxer straight into the segment muxer, reading
+        # the file list from stdin
+        cmd = [
+            get_program_path("ffmpeg"),
+            *FFMPEG_LOG_ARGS,
+            "-y",  # Overwrite output files if they exist
+            "-f", "concat",
+            "-safe", "0",
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
+            "-map", "0:a",
+        ]
+        
+        if copy_codec and can_stream_copy(audio_files, format):
+            # Same codec and parameters, so just remux the frames
+            cmd.extend(["-c:a", "copy"])
+        else:
+            cmd.extend([
+                "-c:a", "libmp3lame" if format == "mp3" else "copy",
+                "-b:a", bitrate,
+            ])
+        
+        cmd.extend([
+            "-f", "segment",
+            "-segment_time", str(segment_length),
+            "-segment_list", segment_list,
+            "-segment_list_type", "flat",
+            f"{output_dir}/{output_name}_%03d.{format}"
+        ])
+        
+        logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
+        
+        _run_ffmpeg(cmd, input=_make_concat_list(audio_files))
+        
+        # Get list of output files, scanning the directory if FFmpeg left no list
+        output_files = _read_segment_list(segment_list, output_dir)
+        if not output_files:
+            output_files = _scan_segments(output_dir, f"{output_name}_", f".{format}")
+        
+        logger.info(f"Combined {len(audio_files)} audio files into {len(output_files)} segments")
+        return output_files
+    
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFmpeg error: {e.stderr.decode('utf-8', errors='replace')}")
+        raise ProcessingError(f"Failed to combine and split audio files: {str(e)}")
+    
+    except Exception as e:
+        logger.error(f"Error combining and splitting audio files: {str(e)}")
+        raise ProcessingError(f"Failed to combine and split audio files: {str(e)}")
+    
+    finally:
+        if segment_list and os.path.exists(segment_list):
+            os.unlink(segment_list)
+        if spool_dir:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+def _make_convert_cmd(input_file, output_file, format="mp3", bitrate="192k", threads=None):
+    """
+    Build the FFmpeg command converting an audio file
+    
+    Args:
+        input_file (str): Input file path
+        output_file (str): Output file path
+        format (str): Output format (mp3, wav, etc.)
+        bitrate (str): Output bitrate (e.g., "192k")
+        threads (int, optional): Maximum number of FFmpeg threads
+        
+    Returns:
+        list: FFmpeg command
+    """
+    cmd = [
+        get_program_path("ffmpeg"),
+        *FFMPEG_LOG_ARGS,
+        "-y",  # Overwrite output file if it exists
+        "-i", input_file,
+        "-c:a", "libmp3lame" if format == "mp3" else "copy",
+        "-b:a", bitrate,
+    ]
+    
+    if threads:
+        cmd.extend(["-threads", str(threads)])
+    
+    cmd.append(output_file)
+    return cmd
 
-def convert_audio_format(input_file, output_file, format="mp3", bitrate="192k"):
+def convert_audio_format(input_file, output_file, format="mp3", bitrate="192k", threads=None):
     """
     Convert audio file to different format
     
@@ -176,6 +812,7 @@ def convert_audio_format(input_file, output_file, format="mp3", bitrate="192k"):
         output_file (str): Output file path
         format (str): Output format (mp3, wav, etc.)
         bitrate (str): Output bitrate (e.g., "192k")
+        threads (int, optional): Maximum number of FFmpeg threads
         
     Returns:
         bool: True if successful, False otherwise
@@ -193,23 +830,11 @@ def convert_audio_format(input_file, output_file, format="mp3", bitrate="192k"):
         os.makedirs(output_dir, exist_ok=True)
         
         # Convert audio file using FFmpeg
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output file if it exists
-            "-i", input_file,
-            "-c:a", "libmp3lame" if format == "mp3" else "copy",
-            "-b:a", bitrate,
-            output_file
-        ]
+        cmd = _make_convert_cmd(input_file, output_file, format, bitrate, threads)
         
         logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
         
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True
-        )
+        _run_ffmpeg(cmd)
         
         logger.info(f"Converted audio file {input_file} to {output_file}")
         return True
@@ -222,6 +847,97 @@ def convert_audio_format(input_file, output_file, format="mp3", bitrate="192k"):
         logger.error(f"Error converting audio file: {str(e)}")
         raise ProcessingError(f"Failed to convert audio file: {str(e)}")
 
+async def convert_many(pairs, format="mp3", bitrate="192k", concurrency=None):
+    """
+    Convert several audio files concurrently from a single thread, with
+    asyncio driving one FFmpeg subprocess per file
+    
+    Args:
+        pairs (list): List of (input file path, output file path) tuples
+        format (str): Output format (mp3, wav, etc.)
+        bitrate (str): Output bitrate (e.g., "192k")
+        concurrency (int, optional): Number of FFmpeg processes running at
+            once (default: number of CPUs)
+        
+    Returns:
+        list: Output file paths of the successful conversions
+    """
+    cpu_count = os.cpu_count() or 1
+    concurrency = concurrency or cpu_count
+    
+    # Split the CPUs between the FFmpeg processes instead of oversubscribing
+    threads = max(1, cpu_count // concurrency)
+    
+    # Create output directories once, rather than once per file
+    for output_dir in {os.path.dirname(os.path.abspath(output_file)) for _, output_file in pairs}:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def convert(input_file, output_file):
+        async with semaphore:
+            try:
+                cmd = _make_convert_cmd(input_file, output_file, format, bitrate, threads)
+                logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
+                
+                await _run_ffmpeg_async(cmd)
+                return output_file
+            
+            except subprocess.CalledProcessError as e:
+                logger.error(f"FFmpeg error converting to {output_file}: {e.stderr.decode('utf-8', errors='replace')}")
+            
+            except Exception as e:
+                logger.error(f"Error converting to {output_file}: {str(e)}")
+            
+            return None
+    
+    results = await asyncio.gather(*(
+        convert(input_file, output_file) for input_file, output_file in pairs
+    ))
+    
+    return [output_file for output_file in results if output_file]
+
+def convert_audio_format_batch(pairs, format="mp3", bitrate="192k", max_workers=None):
+    """
+    Convert several audio files in parallel, one FFmpeg process per file
+    
+    The conversions are driven by convert_many() on an event loop of their
+    own. Called from a running event loop, that loop runs in a helper thread.
+    
+    Args:
+        pairs (list): List of (input file path, output file path) tuples
+        format (str): Output format (mp3, wav, etc.)
+        bitrate (str): Output bitrate (e.g., "192k")
+        max_workers (int, optional): Number of parallel conversions
+            (default: number of CPUs)
+        
+    Returns:
+        list: Output file paths of the successful conversions
+        
+    Raises:
+        ProcessingError: If FFmpeg is not installed
+    """
+    if not pairs:
+        return []
+    
+    # Check if FFmpeg is installed
+    if not check_ffmpeg():
+        raise ProcessingError("FFmpeg is not installed. Please install FFmpeg to convert audio files.")
+    
+    coro = convert_many(pairs, format, bitrate, max_workers)
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        output_files = asyncio.run(coro)
+    else:
+        # The running loop can't be blocked on, so use a fresh one
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            output_files = executor.submit(asyncio.run, coro).result()
+    
+    logger.info(f"Converted {len(output_files)}/{len(pairs)} audio files")
+    return output_files
+
 def record_audio(output_file, duration=5, format="wav", sample_rate=44100):
     """
     Record audio from microphone
@@ -241,7 +957,6 @@ def record_audio(output_file, duration=5, format="wav", sample_rate=44100):
     try:
         import sounddevice as sd
         import soundfile as sf
-        import numpy as np
     except ImportError:
         raise ProcessingError("sounddevice and soundfile are required for audio recording. Please install them with 'pip install sounddevice soundfile'.")
     
@@ -250,18 +965,18 @@ def record_audio(output_file, duration=5, format="wav", sample_rate=44100):
         output_dir = os.path.dirname(os.path.abspath(output_file))
         os.makedirs(output_dir, exist_ok=True)
         
-        # Record audio
+        # Record audio as 16-bit PCM, half the size of float32 samples
         logger.info(f"Recording audio for {duration} seconds...")
         recording = sd.rec(
             int(duration * sample_rate),
             samplerate=sample_rate,
             channels=1,
-            dtype='float32'
+            dtype='int16'
         )
         sd.wait()
         
-        # Save recording
-        sf.write(output_file, recording, sample_rate)
+        # Save recording, without a sample conversion for WAV
+        sf.write(output_file, recording, sample_rate, subtype='PCM_16' if format == "wav" else None)
         
         logger.info(f"Audio recorded to {output_file}")
         return True
@@ -10,6 +10,40 @@ from .exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional, fall back to the standard library if it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data):
+    """
+    Serialize data to indented JSON
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode('utf-8')
+
+def _loads(data):
+    """
+    Deserialize JSON
+    
+    Args:
+        data (bytes): UTF-8 encoded JSON
+        
+    Returns:
+        Deserialized data
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class Config:
     """Configuration manager for EPUB2TTS"""
     
@@ -29,12 +63,21 @@ class Config:
             'volume': 100,  # Default volume (0-100)
             'pitch': 0,  # Default pitch adjustment
             'pause_length': 500,  # Default pause length between sentences (ms)
+            'tts_precision': 'fp32',  # Model precision for local neural engines (fp32, fp16, bf16, int8)
+            'tts_compile': False,  # Whether to torch.compile local neural engines
+            'tts_half_precision': True,  # Whether to run fp32 local neural engines under FP16 autocast on CUDA
+            'tts_rate_limit': None,  # Max requests per second for online engines (None = engine default)
             
             # Processing settings
             'chunk_size': 2000,  # Default chunk size for text processing
-            'max_workers': 4,  # Default number of worker processes
+            'max_workers': None,  # Number of parallel TTS workers (None = engine default)
+            'tts_batch_size': 8,  # Chunks per call for engines that support batching
+            'chapter_workers': 2,  # Number of chapters synthesized at once
             'temp_dir': None,  # Default temp directory (None = use system default)
             'keep_temp_files': False,  # Whether to keep temporary files
+            'tts_cache': 'none',  # TTS cache type (none, disk)
+            'tts_cache_dir': None,  # TTS cache directory (None = ~/.cache/epub2tts/tts)
+            'tts_cache_size_mb': 1024,  # Maximum TTS cache size, least recently used entries are evicted
             
             # Output settings
             'output_format': 'mp3',  # Default output format
@@ -68,6 +111,9 @@ class Config:
                 self.load()
             except Exception as e:
                 logger.warning(f"Failed to load configuration: {str(e)}")
+        
+        # Whether values have changed since the file was loaded or saved
+        self._dirty = False
     
     def get(self, key, default=None):
         """
@@ -90,7 +136,11 @@ class Config:
             key (str): Configuration key
             value: Configuration value
         """
+        if key in self.config and self.config[key] == value:
+            return
+        
         self.config[key] = value
+        self._dirty = True
     
     def load(self):
         """
@@ -100,8 +150,8 @@ class Config:
             ConfigError: If configuration file cannot be loaded
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                loaded_config = _loads(f.read())
                 self.config.update(loaded_config)
             logger.debug(f"Configuration loaded from {self.config_file}")
         except Exception as e:
@@ -115,12 +165,23 @@ class Config:
             ConfigError: If configuration file cannot be saved
         """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps(self.config))
+            self._dirty = False
             logger.debug(f"Configuration saved to {self.config_file}")
         except Exception as e:
             raise ConfigError(f"Failed to save configuration: {str(e)}")
     
+    def flush(self):
+        """
+        Save configuration to file if it has changed
+        
+        Raises:
+            ConfigError: If configuration file cannot be saved
+        """
+        if self._dirty:
+            self.save()
+    
     def reset(self):
         """Reset configuration to defaults"""
         self.__init__(self.config_file)
@@ -128,5 +189,5 @@ class Config:
     
     def __str__(self):
         """String representation of configuration"""
-        return json.dumps(self.config, indent=4)
+        return _dumps(self.config).decode('utf-8')
 
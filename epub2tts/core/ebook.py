@@ -4,11 +4,58 @@ Ebook handling for EPUB2TTS
 
 import os
 import logging
+import importlib
+import threading
+import collections
+from functools import cached_property
 from pathlib import Path
 from .exceptions import FileError
 
 logger = logging.getLogger(__name__)
 
+# Processor module and class for each supported file format, imported on demand
+_PROCESSORS = {
+    '.epub': ('..processors.epub_processor', 'EPUBProcessor'),
+    '.pdf': ('..processors.pdf_processor', 'PDFProcessor'),
+    '.txt': ('..processors.text_processor', 'TextProcessor'),
+}
+
+# Metadata of recently opened ebooks, keyed by (path, modification time, size)
+METADATA_CACHE_SIZE = 32
+_metadata_cache = collections.OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+def _get_cached_metadata(key):
+    """
+    Get cached ebook metadata
+    
+    Args:
+        key (tuple): Cache key
+        
+    Returns:
+        dict: Copy of the cached metadata, or None if not cached
+    """
+    with _metadata_cache_lock:
+        metadata = _metadata_cache.get(key)
+        if metadata is None:
+            return None
+        _metadata_cache.move_to_end(key)
+        return dict(metadata)
+
+def _cache_metadata(key, metadata):
+    """
+    Cache ebook metadata, evicting the least recently used entry if full
+    
+    Args:
+        key (tuple): Cache key
+        metadata (dict): Metadata
+    """
+    with _metadata_cache_lock:
+        _metadata_cache[key] = dict(metadata)
+        _metadata_cache.move_to_end(key)
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+
 class Ebook:
     """Ebook class for handling different ebook formats"""
     
@@ -30,54 +77,108 @@ class Ebook:
         
         self.format = self.file_path.suffix.lower()
         
-        if self.format not in ['.epub', '.pdf', '.txt']:
+        if self.format not in _PROCESSORS:
             logger.error(f"Unsupported file format: {self.format}")
             raise FileError(f"Unsupported file format: {self.format}")
         
         self.title = None
         self.author = None
         self.language = None
-        self.chapters = []
-        self.metadata = {}
-        self.processor = None
         
-        self._load_processor()
+        # Files opened before with the same modification time and size
+        # reuse their metadata, and are only parsed once chapters are needed
+        stat = self.file_path.stat()
+        self._cache_key = (str(self.file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        if _get_cached_metadata(self._cache_key) is None:
+            self.processor = self._load_processor()
+        
         self._load_metadata()
     
+    @cached_property
+    def processor(self):
+        """
+        Processor for file format, loaded on first access
+        
+        Returns:
+            Processor instance
+            
+        Raises:
+            FileError: If processor cannot be loaded
+        """
+        return self._load_processor()
+    
     def _load_processor(self):
-        """Load appropriate processor for file format"""
+        """
+        Load appropriate processor for file format
+        
+        Returns:
+            Processor instance
+            
+        Raises:
+            FileError: If processor cannot be loaded
+        """
         try:
-            if self.format == '.epub':
-                from ..processors.epub_processor import EPUBProcessor
-                self.processor = EPUBProcessor(self.file_path)
-            elif self.format == '.pdf':
-                from ..processors.pdf_processor import PDFProcessor
-                self.processor = PDFProcessor(self.file_path)
-            elif self.format == '.txt':
-                from ..processors.text_processor import TextProcessor
-                self.processor = TextProcessor(self.file_path)
+            # Only the processor for this format is imported
+            module_name, class_name = _PROCESSORS[self.format]
+            module = importlib.import_module(module_name, __package__)
+            processor = getattr(module, class_name)(self.file_path)
             
             logger.debug(f"Loaded processor for {self.format} file")
+            return processor
         
         except Exception as e:
             logger.error(f"Error loading processor: {str(e)}")
             raise FileError(f"Error loading processor: {str(e)}")
     
-    def _load_metadata(self):
-        """Load metadata from file"""
+    @cached_property
+    def metadata(self):
+        """
+        Metadata from file, loaded on first access
+        
+        Returns:
+            dict: Metadata, empty if it cannot be loaded
+        """
+        metadata = _get_cached_metadata(self._cache_key)
+        if metadata is not None:
+            logger.debug(f"Loaded cached metadata: {metadata}")
+            return metadata
+        
         try:
-            self.metadata = self.processor.get_metadata()
-            self.title = self.metadata.get('title', os.path.basename(self.file_path))
-            self.author = self.metadata.get('author', 'Unknown')
-            self.language = self.metadata.get('language', 'en')
-            
-            logger.debug(f"Loaded metadata: {self.metadata}")
+            metadata = self.processor.get_metadata()
+            _cache_metadata(self._cache_key, metadata)
+            logger.debug(f"Loaded metadata: {metadata}")
+            return metadata
         
         except Exception as e:
             logger.error(f"Error loading metadata: {str(e)}")
-            self.title = os.path.basename(self.file_path)
-            self.author = 'Unknown'
-            self.language = 'en'
+            return {}
+    
+    @cached_property
+    def chapters(self):
+        """
+        Chapters from file, loaded on first access
+        
+        Returns:
+            list: List of chapters
+            
+        Raises:
+            FileError: If chapters cannot be loaded
+        """
+        try:
+            chapters = self.processor.get_chapters()
+            logger.debug(f"Loaded {len(chapters)} chapters")
+            return chapters
+        
+        except Exception as e:
+            logger.error(f"Error loading chapters: {str(e)}")
+            raise FileError(f"Error loading chapters: {str(e)}")
+    
+    def _load_metadata(self):
+        """Load metadata from file"""
+        self.title = self.metadata.get('title', os.path.basename(self.file_path))
+        self.author = self.metadata.get('author', 'Unknown')
+        self.language = self.metadata.get('language', 'en')
     
     def get_chapters(self):
         """
@@ -86,14 +187,6 @@ class Ebook:
         Returns:
             list: List of chapters
         """
-        if not self.chapters:
-            try:
-                self.chapters = self.processor.get_chapters()
-                logger.debug(f"Loaded {len(self.chapters)} chapters")
-            except Exception as e:
-                logger.error(f"Error loading chapters: {str(e)}")
-                raise FileError(f"Error loading chapters: {str(e)}")
-        
         return self.chapters
     
     def get_chapter_text(self, chapter_index):
@@ -146,10 +239,60 @@ class Ebook:
             logger.error(f"Error getting chapter title: {str(e)}")
             return f"Chapter {chapter_index + 1}"
     
+    def iter_chapters(self):
+        """
+        Iterate over chapters in a single pass
+        
+        Yields:
+            tuple: (chapter index, chapter title, chapter text)
+        """
+        for chapter_index in range(len(self.get_chapters())):
+            yield (
+                chapter_index,
+                self.get_chapter_title(chapter_index),
+                self.get_chapter_text(chapter_index)
+            )
+    
+    def iter_chapter_texts(self):
+        """
+        Iterate over chapter texts, loading each chapter only when requested
+        
+        Yields:
+            str: Chapter text
+        """
+        for chapter_index in range(len(self.get_chapters())):
+            yield self.get_chapter_text(chapter_index)
+    
+    def iter_full_text(self):
+        """
+        Iterate over the full text of ebook in pieces, so it can be written
+        out without building one string for the whole book
+        
+        Yields:
+            str: Consecutive pieces of the full text
+        """
+        try:
+            yield from self.processor.iter_full_text()
+        except Exception as e:
+            logger.error(f"Error getting full text: {str(e)}")
+            raise FileError(f"Error getting full text: {str(e)}")
+    
+    def write_full_text(self, fp):
+        """
+        Write full text of ebook to a file, one piece at a time
+        
+        Args:
+            fp: Text file object to write to
+        """
+        fp.writelines(self.iter_full_text())
+    
     def get_full_text(self):
         """
         Get full text of ebook
         
+        Prefer write_full_text(), iter_full_text() or iter_chapter_texts()
+        for large books.
+        
         Returns:
             str: Full text
         """
@@ -5,8 +5,13 @@ Logging configuration for EPUB2TTS
 import os
 import sys
 import logging
+import functools
+import logging.handlers
 from pathlib import Path
-from datetime import datetime
+
+# Size of the log file before it is rotated, and number of old logs kept
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
 
 def setup_logger(name="epub2tts", level=logging.INFO, log_to_file=True):
     """
@@ -40,11 +45,15 @@ def setup_logger(name="epub2tts", level=logging.INFO, log_to_file=True):
         log_dir = Path.home() / ".epub2tts" / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create log file with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = log_dir / f"epub2tts_{timestamp}.log"
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Use a single rotating log file rather than one file per run, and
+        # delay opening it until the first record is logged
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / "epub2tts.log",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
+        )
         file_handler.setLevel(level)
         file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
@@ -52,9 +61,19 @@ def setup_logger(name="epub2tts", level=logging.INFO, log_to_file=True):
     
     return logger
 
+@functools.lru_cache(maxsize=None)
+def _setup_default_logger():
+    """
+    Set up the default epub2tts logger once
+    
+    Returns:
+        logging.Logger: Configured logger
+    """
+    return setup_logger()
+
 def get_logger(name="epub2tts"):
     """
-    Get logger by name
+    Get logger by name, setting up the default logger on first use
     
     Args:
         name (str): Logger name
@@ -62,5 +81,6 @@ def get_logger(name="epub2tts"):
     Returns:
         logging.Logger: Logger instance
     """
+    _setup_default_logger()
     return logging.getLogger(name)
 
@@ -4,10 +4,33 @@ Text processing utilities for EPUB2TTS
 
 import re
 import logging
+import itertools
+import collections
 from .exceptions import ProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Common Unicode characters and their TTS-friendly replacements
+_UNICODE_REPLACEMENTS = {
+    '\u2018': "'", '\u2019': "'",  # Smart quotes
+    '\u201c': '"', '\u201d': '"',  # Smart double quotes
+    '\u2013': '-', '\u2014': '--',  # En and em dashes
+    '\u2026': '...',  # Ellipsis
+}
+
+# Non-printable control characters, other than whitespace
+_CONTROL_CHARS = tuple(itertools.chain(range(0x00, 0x09), (0x0b, 0x0c), range(0x0e, 0x20), range(0x7f, 0xa0)))
+
+# Unicode replacements and control character removal, applied in one pass
+_CLEAN_TRANSLATION = str.maketrans(_UNICODE_REPLACEMENTS)
+_CLEAN_TRANSLATION.update(dict.fromkeys(_CONTROL_CHARS))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Sentence boundaries, handling common abbreviations and edge cases
+_SENTENCE_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s')
+_WORD_RE = re.compile(r'\b\w+\b')
+
 def clean_text(text):
     """
     Clean text for TTS processing
@@ -23,16 +46,11 @@ def clean_text(text):
     
     try:
         # Replace multiple spaces with a single space
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Replace common Unicode characters
-        text = text.replace('\u2018', "'").replace('\u2019', "'")  # Smart quotes
-        text = text.replace('\u201c', '"').replace('\u201d', '"')  # Smart double quotes
-        text = text.replace('\u2013', '-').replace('\u2014', '--')  # En and em dashes
-        text = text.replace('\u2026', '...')  # Ellipsis
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Remove non-printable characters
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+        # Replace common Unicode characters and remove non-printable
+        # characters in a single pass
+        text = text.translate(_CLEAN_TRANSLATION)
         
         # Normalize whitespace
         text = text.strip()
@@ -43,7 +61,7 @@ def clean_text(text):
         logger.error(f"Error cleaning text: {str(e)}")
         raise ProcessingError(f"Failed to clean text: {str(e)}")
 
-def split_text_into_chunks(text, chunk_size=2000, overlap=50):
+def split_text_into_chunks(text, chunk_size=2000, overlap=50, already_clean=False):
     """
     Split text into chunks of specified size
     
@@ -51,6 +69,7 @@ def split_text_into_chunks(text, chunk_size=2000, overlap=50):
         text (str): Text to split
         chunk_size (int): Maximum chunk size in characters
         overlap (int): Overlap between chunks in characters
+        already_clean (bool): Skip cleaning if the text was already cleaned
         
     Returns:
         list: List of text chunks
@@ -59,45 +78,110 @@ def split_text_into_chunks(text, chunk_size=2000, overlap=50):
         return []
     
     try:
-        # Clean text first
-        text = clean_text(text)
-        
-        # If text is smaller than chunk size, return as is
-        if len(text) <= chunk_size:
-            return [text]
-        
-        # Split text into sentences
-        sentences = split_into_sentences(text)
-        
-        chunks = []
-        current_chunk = ""
+        return list(clean_and_chunk(text, chunk_size, overlap, already_clean))
+    
+    except Exception as e:
+        logger.error(f"Error splitting text into chunks: {str(e)}")
+        raise ProcessingError(f"Failed to split text into chunks: {str(e)}")
+
+def clean_and_chunk(text, chunk_size=2000, overlap=50, already_clean=False):
+    """
+    Clean text and lazily split it into chunks of specified size
+    
+    Sentences are found one at a time and each chunk is yielded as soon as it
+    is complete, so the full sentence list is never built.
+    
+    Args:
+        text (str): Text to split
+        chunk_size (int): Maximum chunk size in characters
+        overlap (int): Overlap between chunks in characters
+        already_clean (bool): Skip cleaning if the text was already cleaned
         
-        for sentence in sentences:
-            # If adding this sentence would exceed chunk size
-            if len(current_chunk) + len(sentence) > chunk_size:
-                # Add current chunk to chunks list
-                chunks.append(current_chunk.strip())
-                
-                # Start new chunk with overlap from previous chunk
-                words = current_chunk.split()
-                overlap_text = " ".join(words[-min(len(words), overlap):])
-                current_chunk = overlap_text + " " + sentence
+    Yields:
+        str: Text chunks
+    """
+    if not already_clean:
+        text = clean_text(text)
+    
+    if not text:
+        return
+    
+    # If text is smaller than chunk size, return as is
+    if len(text) <= chunk_size:
+        yield text
+        return
+    
+    sentences = []
+    length = 0
+    overlap_text = None
+    limit = chunk_size + 2
+    
+    for sentence in iter_sentences(text):
+        # A sentence longer than the chunk size gets a chunk of its own
+        if sentences and length + len(sentence) + 1 > limit:
+            yield _join_chunk(sentences, overlap_text)
+            
+            # Start next chunk with overlap from this chunk
+            if overlap > 0:
+                overlap_text = _get_overlap_text(sentences, 0, len(sentences), overlap_text, overlap)
             else:
-                # Add sentence to current chunk
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
+                overlap_text = ""
+            
+            sentences = []
+            length = 0
+            limit = chunk_size + 1 - len(overlap_text)
         
-        # Add the last chunk if not empty
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        # Running length of the chunk, counting one joining space per sentence
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    
+    if sentences:
+        yield _join_chunk(sentences, overlap_text)
+
+def _join_chunk(sentences, overlap_text):
+    """
+    Join the sentences of a chunk, prefixed by the overlap from the previous one
+    
+    Args:
+        sentences (list): Sentences of the chunk
+        overlap_text (str): Overlap from the previous chunk, or None
         
-        return chunks
+    Returns:
+        str: Chunk text
+    """
+    chunk = " ".join(sentences)
+    if overlap_text is not None:
+        chunk = overlap_text + " " + chunk
+    return chunk.strip()
+
+def _get_overlap_text(sentences, start, end, overlap_text, overlap):
+    """
+    Get the last words of a chunk without re-splitting the whole chunk
     
-    except Exception as e:
-        logger.error(f"Error splitting text into chunks: {str(e)}")
-        raise ProcessingError(f"Failed to split text into chunks: {str(e)}")
+    Args:
+        sentences (list): List of sentences
+        start (int): Index of the first sentence of the chunk
+        end (int): Index after the last sentence of the chunk
+        overlap_text (str): Overlap the chunk started with, or None
+        overlap (int): Number of words to keep
+        
+    Returns:
+        str: Last overlap words of the chunk
+    """
+    tail = collections.deque()
+    
+    # Walk back from the chunk end until enough words are collected
+    pieces = reversed(sentences[start:end])
+    if overlap_text:
+        pieces = itertools.chain(pieces, [overlap_text])
+    
+    for piece in pieces:
+        words = piece.split()
+        tail.extendleft(reversed(words[-(overlap - len(tail)):]))
+        if len(tail) == overlap:
+            break
+    
+    return " ".join(tail)
 
 def split_into_sentences(text):
     """
@@ -113,20 +197,34 @@ def split_into_sentences(text):
         return []
     
     try:
-        # Regular expression for sentence splitting
-        # This handles common abbreviations and edge cases
-        pattern = r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s'
-        sentences = re.split(pattern, text)
-        
-        # Remove empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        return sentences
+        return list(iter_sentences(text))
     
     except Exception as e:
         logger.error(f"Error splitting text into sentences: {str(e)}")
         raise ProcessingError(f"Failed to split text into sentences: {str(e)}")
 
+def iter_sentences(text):
+    """
+    Lazily split text into sentences
+    
+    Args:
+        text (str): Text to split
+        
+    Yields:
+        str: Non-empty sentences
+    """
+    start = 0
+    
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
 def count_words(text):
     """
     Count words in text
@@ -142,8 +240,7 @@ def count_words(text):
     
     try:
         # Split text into words and count
-        words = re.findall(r'\b\w+\b', text)
-        return len(words)
+        return sum(1 for _ in _WORD_RE.finditer(text))
     
     except Exception as e:
         logger.error(f"Error counting words: {str(e)}")
@@ -0,0 +1,264 @@
+"""
+On-disk cache for synthesized speech in EPUB2TTS
+"""
+
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# xxhash is optional, fall back to BLAKE2b from the standard library if it
+# is missing. Keys differ between the two, which only costs cache misses.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Default cache directory
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "epub2tts" / "tts"
+
+# Default maximum cache size in megabytes
+DEFAULT_CACHE_SIZE_MB = 1024
+
+def get_cache_key(text, tts_engine):
+    """
+    Get cache key for text synthesized with TTS engine settings
+    
+    Args:
+        text (str): Text to speak
+        tts_engine: TTS engine object
+        
+    Returns:
+        str: Cache key
+    """
+    params = "|".join(str(value) for value in (
+        getattr(tts_engine, 'name', type(tts_engine).__name__),
+        tts_engine.voice,
+        tts_engine.language,
+        tts_engine.speed,
+        tts_engine.volume,
+        tts_engine.pitch,
+        getattr(tts_engine, 'voice_sample', None),
+        getattr(tts_engine, 'precision', None),
+    ))
+    
+    data = " ".join(text.split()).encode('utf-8') + b"|" + params.encode('utf-8')
+    
+    if xxhash:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _link_or_copy(src, dst):
+    """
+    Hardlink file, falling back to a copy across filesystems
+    
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path
+    """
+    if os.path.exists(dst):
+        os.unlink(dst)
+    
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _get_cache_file(tts_engine, text, output_file, cache_dir=None):
+    """
+    Get cache file path for text synthesized with TTS engine settings
+    
+    Args:
+        tts_engine: TTS engine object
+        text (str): Text to speak
+        output_file (str): Output file path
+        cache_dir (str, optional): Cache directory
+        
+    Returns:
+        Path: Cache file path
+    """
+    engine_name = getattr(tts_engine, 'name', type(tts_engine).__name__)
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    
+    fmt = Path(output_file).suffix
+    return cache_dir / engine_name / f"{get_cache_key(text, tts_engine)}{fmt}"
+
+def _load_from_cache(cache_file, output_file):
+    """
+    Link cached audio into place
+    
+    Args:
+        cache_file (Path): Cache file path
+        output_file (str): Output file path
+        
+    Returns:
+        bool: True if audio was taken from the cache, False otherwise
+    """
+    if not cache_file.exists():
+        return False
+    
+    try:
+        _link_or_copy(str(cache_file), output_file)
+        
+        # Mark the entry as recently used for eviction
+        os.utime(cache_file)
+        
+        logger.debug(f"TTS cache hit: {cache_file}")
+        return True
+    except OSError as e:
+        logger.warning(f"Error reading TTS cache file {cache_file}: {str(e)}")
+        return False
+
+def _store_in_cache(cache_file, output_file):
+    """
+    Store synthesized audio in the cache
+    
+    Args:
+        cache_file (Path): Cache file path
+        output_file (str): Synthesized audio file path
+    """
+    # Store atomically so parallel workers never see partial files
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        _link_or_copy(output_file, temp_file)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Error writing TTS cache file {cache_file}: {str(e)}")
+
+def prune_cache(cache_dir=None, max_size_mb=DEFAULT_CACHE_SIZE_MB):
+    """
+    Evict least recently used cache entries until the cache fits its size limit
+    
+    Args:
+        cache_dir (str, optional): Cache directory
+        max_size_mb (int): Maximum cache size in megabytes
+        
+    Returns:
+        int: Number of evicted entries
+    """
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    
+    if not cache_dir.is_dir():
+        return 0
+    
+    # Collect (last use, size, path) of all entries, one directory per engine
+    entries = []
+    total_size = 0
+    
+    for engine_dir in os.scandir(cache_dir):
+        if not engine_dir.is_dir():
+            continue
+        
+        for entry in os.scandir(engine_dir.path):
+            if not entry.is_file() or entry.name.endswith('.tmp'):
+                continue
+            
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+    
+    max_size = max_size_mb * 1024 * 1024
+    if total_size <= max_size:
+        return 0
+    
+    # Evict oldest entries first
+    entries.sort()
+    evicted = 0
+    
+    for _, size, path in entries:
+        if total_size <= max_size:
+            break
+        
+        try:
+            os.unlink(path)
+            total_size -= size
+            evicted += 1
+        except OSError as e:
+            logger.warning(f"Error evicting TTS cache file {path}: {str(e)}")
+    
+    logger.info(f"Evicted {evicted} entries from TTS cache {cache_dir}")
+    return evicted
+
+def get_or_synthesize(tts_engine, text, output_file, cache_dir=None):
+    """
+    Save text to audio file, reusing cached audio when available
+    
+    Args:
+        tts_engine: TTS engine object
+        text (str): Text to speak
+        output_file (str): Output file path
+        cache_dir (str, optional): Cache directory
+        
+    Returns:
+        bool: True if audio was taken from the cache, False if it was synthesized
+    """
+    cache_file = _get_cache_file(tts_engine, text, output_file, cache_dir)
+    
+    if _load_from_cache(cache_file, output_file):
+        return True
+    
+    # Generate speech
+    tts_engine.save_to_file(text, output_file)
+    
+    _store_in_cache(cache_file, output_file)
+    return False
+
+def get_or_synthesize_many(tts_engine, texts, output_files, cache_dir=None):
+    """
+    Save texts to audio files in one engine call, reusing cached audio when available
+    
+    Args:
+        tts_engine: TTS engine object
+        texts (list): Texts to speak
+        output_files (list): Output file paths, one per text
+        cache_dir (str, optional): Cache directory
+        
+    Returns:
+        int: Number of texts taken from the cache
+    """
+    misses = []
+    for text, output_file in zip(texts, output_files):
+        cache_file = _get_cache_file(tts_engine, text, output_file, cache_dir)
+        if not _load_from_cache(cache_file, output_file):
+            misses.append((text, output_file, cache_file))
+    
+    if misses:
+        # Generate speech for the texts that were not cached
+        tts_engine.save_many_to_files(
+            [text for text, _, _ in misses],
+            [output_file for _, output_file, _ in misses]
+        )
+        
+        for _, output_file, cache_file in misses:
+            _store_in_cache(cache_file, output_file)
+    
+    return len(texts) - len(misses)
+
+async def get_or_synthesize_async(tts_engine, text, output_file, cache_dir=None):
+    """
+    Save text to audio file asynchronously, reusing cached audio when available
+    
+    Args:
+        tts_engine: TTS engine object
+        text (str): Text to speak
+        output_file (str): Output file path
+        cache_dir (str, optional): Cache directory
+        
+    Returns:
+        bool: True if audio was taken from the cache, False if it was synthesized
+    """
+    cache_file = _get_cache_file(tts_engine, text, output_file, cache_dir)
+    
+    if _load_from_cache(cache_file, output_file):
+        return True
+    
+    # Generate speech
+    await tts_engine.save_to_file_async(text, output_file)
+    
+    _store_in_cache(cache_file, output_file)
+    return False
@@ -3,17 +3,230 @@ TTS engines for EPUB2TTS
 """
 
 import os
+import io
+import json
+import time
+import asyncio
 import logging
 import tempfile
-import importlib
+import contextlib
+import importlib.util
+import threading
+import collections
+import concurrent.futures
 from abc import ABC, abstractmethod
+from pathlib import Path
 from .exceptions import TTSEngineError
+from .audio_utils import get_spool_dir
 
 logger = logging.getLogger(__name__)
 
+# Voice lists fetched from online engines, keyed by engine name, and how
+# long they are reused in seconds. Lists are also kept on disk so new
+# processes don't fetch them again.
+VOICES_CACHE_TTL = 24 * 3600
+VOICES_CACHE_DIR = Path.home() / ".cache" / "epub2tts"
+_voices_cache = {}
+
+def _get_cached_voices(engine_name):
+    """
+    Get voice list fetched within the TTL, from memory or from disk
+    
+    Args:
+        engine_name (str): TTS engine name
+        
+    Returns:
+        list: List of voices, or None if not cached or stale
+    """
+    fetched_at, voices = _voices_cache.get(engine_name, (0, None))
+    if voices and time.time() - fetched_at < VOICES_CACHE_TTL:
+        return list(voices)
+    
+    cache_file = VOICES_CACHE_DIR / f"voices-{engine_name}.json"
+    
+    try:
+        fetched_at = cache_file.stat().st_mtime
+        if time.time() - fetched_at >= VOICES_CACHE_TTL:
+            return None
+        voices = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    
+    _voices_cache[engine_name] = (fetched_at, voices)
+    return list(voices)
+
+def _cache_voices(engine_name, voices):
+    """
+    Remember voice list fetched from an online engine, in memory and on disk
+    
+    Args:
+        engine_name (str): TTS engine name
+        voices (list): List of voices
+    """
+    _voices_cache[engine_name] = (time.time(), voices)
+    
+    try:
+        VOICES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (VOICES_CACHE_DIR / f"voices-{engine_name}.json").write_text(json.dumps(voices), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Failed to cache voice list: {str(e)}")
+
+# XTTS model name
+XTTS_MODEL_NAME = "tts_models/multilingual/multi-dataset/xtts_v2"
+
+# Loaded XTTS models shared by engine instances, keyed by
+# (model name, device, precision, compile)
+_xtts_models = {}
+_xtts_models_lock = threading.Lock()
+
+def clear_model_cache():
+    """Release loaded XTTS models shared by engine instances"""
+    with _xtts_models_lock:
+        _xtts_models.clear()
+
+# Synthesized audio for short phrases such as chapter headings, keyed by
+# engine settings and text, most recently used last
+PHRASE_CACHE_SIZE = 256
+PHRASE_CACHE_MAX_CHARS = 100
+_phrase_cache = collections.OrderedDict()
+_phrase_cache_lock = threading.Lock()
+
+def clear_phrase_cache():
+    """Release synthesized audio cached for short phrases"""
+    with _phrase_cache_lock:
+        _phrase_cache.clear()
+
+# Mixer buffer size in samples, large enough to avoid underruns under CPU load
+MIXER_BUFFER_SIZE = 4096
+
+def _modules_available(*module_names):
+    """
+    Check if modules are installed without importing them
+    
+    Args:
+        *module_names (str): Top-level module names
+        
+    Returns:
+        bool: True if all modules can be imported, False otherwise
+    """
+    return all(importlib.util.find_spec(name) is not None for name in module_names)
+
+def _init_mixer(pygame):
+    """
+    Initialize the pygame mixer unless it is already running
+    
+    Args:
+        pygame: pygame module
+    """
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(buffer=MIXER_BUFFER_SIZE)
+
+def _wait_for_music_end(pygame):
+    """
+    Block until pygame music playback ends, sleeping on the event queue
+    instead of polling
+    
+    Args:
+        pygame: pygame module
+    """
+    end_event = pygame.USEREVENT + 1
+    
+    try:
+        # The event queue needs the video subsystem, but no window
+        if not pygame.display.get_init():
+            pygame.display.init()
+        
+        pygame.mixer.music.set_endevent(end_event)
+        
+        # Playback may have ended before the end event was set up
+        while pygame.mixer.music.get_busy():
+            if pygame.event.wait().type == end_event:
+                break
+    
+    except pygame.error:
+        # No event queue available (e.g. headless), fall back to polling
+        while pygame.mixer.music.get_busy():
+            pygame.time.wait(100)
+
+def _run_coroutine(coro):
+    """
+    Run coroutine to completion from synchronous code
+    
+    Uses asyncio.run when no event loop is running in this thread. From
+    inside a running loop (e.g. a notebook or GUI integration) the coroutine
+    runs on a fresh loop in a helper thread, since the running loop can't be
+    blocked on.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+class RateLimiter:
+    """Thread-safe sliding-window limit on requests per second"""
+    
+    def __init__(self, max_per_second):
+        """
+        Initialize rate limiter
+        
+        Args:
+            max_per_second (int): Maximum number of requests started in any one second
+        """
+        self.max_per_second = max_per_second
+        self._starts = collections.deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until another request may start"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                
+                # Forget requests that have left the window
+                while self._starts and now - self._starts[0] >= 1.0:
+                    self._starts.popleft()
+                
+                if len(self._starts) < self.max_per_second:
+                    self._starts.append(now)
+                    return
+                
+                delay = 1.0 - (now - self._starts[0])
+            
+            time.sleep(delay)
+
 class TTSEngine(ABC):
     """Abstract base class for TTS engines"""
     
+    # Engine name as used by get_tts_engine
+    name = None
+    
+    # How chunks are synthesized in parallel: "thread" for I/O-bound engines,
+    # "process" for CPU-bound engines that hold the GIL
+    parallelism_mode = "thread"
+    
+    # Default number of parallel workers
+    default_max_workers = 4
+    
+    # Whether save_to_file_async is natively asynchronous (network-bound engines)
+    supports_async = False
+    
+    # Whether save_many_to_files synthesizes several texts in one call
+    supports_batching = False
+    
+    # Top-level modules the engine needs, and whether they are all installed
+    # (checked once per class)
+    required_modules = ()
+    _available = None
+    
     def __init__(self, config=None):
         """
         Initialize TTS engine
@@ -53,15 +266,144 @@ class TTSEngine(ABC):
         """
         pass
     
-    @abstractmethod
-    def is_available(self):
+    def _phrase_key(self, text, output_file):
+        """
+        Get phrase cache key for text
+        
+        Args:
+            text (str): Text to speak
+            output_file (str): Output file path
+            
+        Returns:
+            tuple: Cache key, or None if text is too long to cache
+        """
+        if len(text) > PHRASE_CACHE_MAX_CHARS:
+            return None
+        
+        return (
+            self.name,
+            self.voice,
+            self.language,
+            self.speed,
+            self.volume,
+            self.pitch,
+            self.config.get('voice_sample'),
+            os.path.splitext(output_file)[1].lower(),
+            text
+        )
+    
+    def _load_cached_phrase(self, text, output_file):
+        """
+        Write previously synthesized audio for a short phrase to file
+        
+        Args:
+            text (str): Text to speak
+            output_file (str): Output file path
+            
+        Returns:
+            bool: True if the phrase was cached, False otherwise
+        """
+        key = self._phrase_key(text, output_file)
+        if key is None:
+            return False
+        
+        with _phrase_cache_lock:
+            data = _phrase_cache.get(key)
+            if data is None:
+                return False
+            _phrase_cache.move_to_end(key)
+        
+        Path(output_file).write_bytes(data)
+        return True
+    
+    def _cache_phrase(self, text, output_file):
+        """
+        Remember audio synthesized to file for a short phrase
+        
+        Args:
+            text (str): Text that was spoken
+            output_file (str): Output file path
+        """
+        key = self._phrase_key(text, output_file)
+        if key is None:
+            return
+        
+        data = Path(output_file).read_bytes()
+        
+        with _phrase_cache_lock:
+            _phrase_cache[key] = data
+            _phrase_cache.move_to_end(key)
+            while len(_phrase_cache) > PHRASE_CACHE_SIZE:
+                _phrase_cache.popitem(last=False)
+    
+    def save_to_bytes(self, text, format="mp3"):
+        """
+        Synthesize text to in-memory audio
+        
+        Engines that can only write files synthesize to tmpfs and read the
+        result back.
+        
+        Args:
+            text (str): Text to speak
+            format (str): Audio format (mp3, wav, etc.)
+            
+        Returns:
+            bytes: Audio data
+        """
+        with tempfile.TemporaryDirectory(prefix="epub2tts_", dir=get_spool_dir()) as temp_dir:
+            temp_file = os.path.join(temp_dir, f"speech.{format}")
+            self.save_to_file(text, temp_file)
+            
+            with open(temp_file, 'rb') as f:
+                return f.read()
+    
+    def save_many_to_files(self, texts, output_files):
+        """
+        Save texts to audio files
+        
+        Engines that support batching override this to synthesize all texts
+        in one call.
+        
+        Args:
+            texts (list): Texts to speak
+            output_files (list): Output file paths, one per text
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        for text, output_file in zip(texts, output_files):
+            self.save_to_file(text, output_file)
+        
+        return True
+    
+    async def save_to_file_async(self, text, output_file):
+        """
+        Save text to audio file asynchronously
+        
+        Engines without a native async API run save_to_file in the default executor.
+        
+        Args:
+            text (str): Text to speak
+            output_file (str): Output file path
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.save_to_file, text, output_file)
+    
+    @classmethod
+    def is_available(cls):
         """
         Check if TTS engine is available
         
         Returns:
             bool: True if available, False otherwise
         """
-        pass
+        if cls._available is None:
+            cls._available = _modules_available(*cls.required_modules)
+        
+        return cls._available
     
     @abstractmethod
     def get_available_voices(self):
@@ -73,6 +415,13 @@ class TTSEngine(ABC):
         """
         pass
     
+    def warmup(self):
+        """
+        Prepare engine for synthesis, e.g. build GPU kernels, so the first
+        chunk doesn't pay for it. Does nothing by default.
+        """
+        pass
+    
     def stop(self):
         """Stop speaking"""
         pass
@@ -98,6 +447,11 @@ class TTSEngine(ABC):
 class EdgeTTSEngine(TTSEngine):
     """Microsoft Edge TTS engine"""
     
+    name = "edge"
+    required_modules = ("edge_tts",)
+    default_max_workers = 16
+    supports_async = True
+    
     def __init__(self, config=None):
         """
         Initialize Edge TTS engine
@@ -145,21 +499,13 @@ class EdgeTTSEngine(TTSEngine):
         Args:
             text (str): Text to speak
         """
-        import asyncio
-        
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
         try:
-            loop.run_until_complete(self._say_async(text))
+            _run_coroutine(self._say_async(text))
         except Exception as e:
             logger.error(f"Edge TTS error: {str(e)}")
             raise TTSEngineError(f"Edge TTS error: {str(e)}")
     
-    async def _save_to_file_async(self, text, output_file):
+    async def save_to_file_async(self, text, output_file):
         """
         Save text to audio file asynchronously
         
@@ -171,13 +517,23 @@ class EdgeTTSEngine(TTSEngine):
             bool: True if successful, False otherwise
         """
         try:
-            self.communicate = self.edge_tts.Communicate(
+            if self._load_cached_phrase(text, output_file):
+                return True
+            
+            communicate = self.edge_tts.Communicate(
                 text,
                 self.voice,
                 rate=f"{self.speed:+d}%",
                 volume=f"{self.volume:d}%"
             )
-            await self.communicate.save(output_file)
+            
+            # Write audio as it arrives instead of buffering the whole file
+            with open(output_file, 'wb') as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
+            
+            self._cache_phrase(text, output_file)
             return True
         except Exception as e:
             logger.error(f"Edge TTS error: {str(e)}")
@@ -194,32 +550,100 @@ class EdgeTTSEngine(TTSEngine):
         Returns:
             bool: True if successful, False otherwise
         """
-        import asyncio
+        try:
+            return _run_coroutine(self.save_to_file_async(text, output_file))
+        except Exception as e:
+            logger.error(f"Edge TTS error: {str(e)}")
+            raise TTSEngineError(f"Edge TTS error: {str(e)}")
+    
+    async def _save_many_async(self, texts, output_files, concurrency):
+        """
+        Save texts to audio files concurrently
+        
+        Args:
+            texts (list): Texts to speak
+            output_files (list): Output file paths, one per text
+            concurrency (int): Maximum number of requests in flight
+            
+        Returns:
+            list: Results in the order of the texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def save(text, output_file):
+            async with semaphore:
+                return await self.save_to_file_async(text, output_file)
+        
+        return await asyncio.gather(*(
+            save(text, output_file) for text, output_file in zip(texts, output_files)
+        ))
+    
+    def save_many_to_files(self, texts, output_files, concurrency=None):
+        """
+        Save texts to audio files, overlapping the network requests
+        
+        Args:
+            texts (list): Texts to speak
+            output_files (list): Output file paths, one per text
+            concurrency (int, optional): Maximum number of requests in flight
+                (default: max_workers setting)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        concurrency = concurrency or self.config.get('max_workers') or self.default_max_workers
         
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            _run_coroutine(self._save_many_async(texts, output_files, concurrency))
+            return True
+        except Exception as e:
+            logger.error(f"Edge TTS error: {str(e)}")
+            raise TTSEngineError(f"Edge TTS error: {str(e)}")
+    
+    async def _save_to_bytes_async(self, text):
+        """
+        Synthesize text to in-memory audio asynchronously
         
+        Args:
+            text (str): Text to speak
+            
+        Returns:
+            bytes: MP3 audio data
+        """
         try:
-            return loop.run_until_complete(self._save_to_file_async(text, output_file))
+            communicate = self.edge_tts.Communicate(
+                text,
+                self.voice,
+                rate=f"{self.speed:+d}%",
+                volume=f"{self.volume:d}%"
+            )
+            
+            audio = bytearray()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio.extend(chunk["data"])
+            
+            return bytes(audio)
         except Exception as e:
             logger.error(f"Edge TTS error: {str(e)}")
             raise TTSEngineError(f"Edge TTS error: {str(e)}")
     
-    def is_available(self):
+    def save_to_bytes(self, text, format="mp3"):
         """
-        Check if Edge TTS engine is available
+        Synthesize text to in-memory audio
         
+        Args:
+            text (str): Text to speak
+            format (str): Audio format, Edge TTS always returns MP3
+            
         Returns:
-            bool: True if available, False otherwise
+            bytes: MP3 audio data
         """
         try:
-            import edge_tts
-            return True
-        except ImportError:
-            return False
+            return _run_coroutine(self._save_to_bytes_async(text))
+        except Exception as e:
+            logger.error(f"Edge TTS error: {str(e)}")
+            raise TTSEngineError(f"Edge TTS error: {str(e)}")
     
     async def _get_voices_async(self):
         """
@@ -242,19 +666,19 @@ class EdgeTTSEngine(TTSEngine):
         Returns:
             list: List of available voices
         """
-        import asyncio
-        
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        # Reuse the voice list fetched within the last day
+        voices = _get_cached_voices(self.name)
+        if voices is not None:
+            return voices
         
         try:
-            return loop.run_until_complete(self._get_voices_async())
+            voices = _run_coroutine(self._get_voices_async())
         except Exception as e:
             logger.error(f"Edge TTS error: {str(e)}")
             return []
+        
+        _cache_voices(self.name, voices)
+        return list(voices)
     
     def stop(self):
         """Stop speaking"""
@@ -275,6 +699,13 @@ class EdgeTTSEngine(TTSEngine):
 class GoogleTTSEngine(TTSEngine):
     """Google Text-to-Speech engine"""
     
+    name = "google"
+    required_modules = ("gtts", "pygame")
+    default_max_workers = 8
+    
+    # Requests per second, kept below the rate at which Google starts refusing them
+    default_rate_limit = 10
+    
     def __init__(self, config=None):
         """
         Initialize Google TTS engine
@@ -289,9 +720,10 @@ class GoogleTTSEngine(TTSEngine):
             import pygame
             self.gTTS = gTTS
             self.pygame = pygame
-            self.pygame.mixer.init()
+            _init_mixer(self.pygame)
             self.is_speaking_flag = False
             self.is_paused = False
+            self.rate_limiter = RateLimiter(self.config.get('tts_rate_limit') or self.default_rate_limit)
         except ImportError:
             logger.error("gtts or pygame not installed. Please install them with 'pip install gtts pygame'.")
             raise TTSEngineError("gtts or pygame not installed. Please install them with 'pip install gtts pygame'.")
@@ -304,26 +736,21 @@ class GoogleTTSEngine(TTSEngine):
             text (str): Text to speak
         """
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                temp_file = f.name
-            
-            # Generate speech
+            # Generate speech in memory
             tts = self.gTTS(text=text, lang=self.language, slow=False)
-            tts.save(temp_file)
+            audio = io.BytesIO()
+            tts.write_to_fp(audio)
+            audio.seek(0)
             
             # Play speech
             self.is_speaking_flag = True
-            self.pygame.mixer.music.load(temp_file)
+            self.pygame.mixer.music.load(audio, "mp3")
             self.pygame.mixer.music.play()
             
             # Wait for playback to finish
-            while self.pygame.mixer.music.get_busy():
-                self.pygame.time.Clock().tick(10)
+            _wait_for_music_end(self.pygame)
             
-            # Clean up
             self.is_speaking_flag = False
-            os.unlink(temp_file)
         
         except Exception as e:
             self.is_speaking_flag = False
@@ -343,32 +770,94 @@ class GoogleTTSEngine(TTSEngine):
         """
         try:
             # Create output directory if it doesn't exist
-            output_dir = os.path.dirname(os.path.abspath(output_file))
-            os.makedirs(output_dir, exist_ok=True)
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            
+            if self._load_cached_phrase(text, output_file):
+                return True
             
             # Generate speech
             tts = self.gTTS(text=text, lang=self.language, slow=False)
-            tts.save(output_file)
+            with open(output_file, "wb") as f:
+                self._write_rate_limited(tts, f)
             
+            self._cache_phrase(text, output_file)
             return True
         
         except Exception as e:
             logger.error(f"Google TTS error: {str(e)}")
             raise TTSEngineError(f"Google TTS error: {str(e)}")
     
-    def is_available(self):
+    def _write_rate_limited(self, tts, fp):
         """
-        Check if Google TTS engine is available
+        Write speech to a file object, one rate-limited request at a time
         
+        gTTS splits the text into pieces of about 100 characters and sends
+        one request per piece, so the limit is applied to each piece.
+        
+        Args:
+            tts (gTTS): Speech to write
+            fp (file): Binary file object to write the MP3 data to
+        """
+        # One request per text part, counted up front so no slot is spent on
+        # the advance that only finds the stream exhausted
+        requests = len(tts._tokenize(tts.text))
+        pieces = tts.stream()
+        
+        for _ in range(requests):
+            # The next request is only sent when the generator is advanced
+            self.rate_limiter.acquire()
+            piece = next(pieces, None)
+            if piece is None:
+                return
+            fp.write(piece)
+        
+        # Finish the generator, which sends no further requests
+        for piece in pieces:
+            fp.write(piece)
+    
+    def save_many_to_files(self, texts, output_files, concurrency=None):
+        """
+        Save texts to audio files, overlapping the network requests
+        
+        Args:
+            texts (list): Texts to speak
+            output_files (list): Output file paths, one per text
+            concurrency (int, optional): Maximum number of requests in flight
+                (default: max_workers setting)
+            
         Returns:
-            bool: True if available, False otherwise
+            bool: True if successful, False otherwise
+        """
+        concurrency = concurrency or self.config.get('max_workers') or self.default_max_workers
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="epub2tts-gtts") as executor:
+            # Consume the results so the first failure is raised here
+            for _ in executor.map(self.save_to_file, texts, output_files):
+                pass
+        
+        return True
+    
+    def save_to_bytes(self, text, format="mp3"):
+        """
+        Synthesize text to in-memory audio
+        
+        Args:
+            text (str): Text to speak
+            format (str): Audio format, Google TTS always returns MP3
+            
+        Returns:
+            bytes: MP3 audio data
         """
         try:
-            from gtts import gTTS
-            import pygame
-            return True
-        except ImportError:
-            return False
+            tts = self.gTTS(text=text, lang=self.language, slow=False)
+            
+            audio = io.BytesIO()
+            self._write_rate_limited(tts, audio)
+            return audio.getvalue()
+        
+        except Exception as e:
+            logger.error(f"Google TTS error: {str(e)}")
+            raise TTSEngineError(f"Google TTS error: {str(e)}")
     
     def get_available_voices(self):
         """
@@ -412,6 +901,11 @@ class GoogleTTSEngine(TTSEngine):
 class XTTSEngine(TTSEngine):
     """XTTS (Coqui TTS) engine"""
     
+    name = "xtts"
+    required_modules = ("torch", "TTS")
+    parallelism_mode = "process"
+    supports_batching = True
+    
     def __init__(self, config=None):
         """
         Initialize XTTS engine
@@ -428,22 +922,177 @@ class XTTSEngine(TTSEngine):
             self.TTS = TTS
             self.model = None
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            
+            # Every worker process loads its own copy of the model, so share
+            # the GPU with a single worker rather than one copy each in VRAM
+            if self.device == "cuda":
+                self.default_max_workers = 1
+            
             self.is_speaking_flag = False
             self.voice_sample = self.config.get('voice_sample', None)
-            self._load_model()
+            self.precision = self.config.get('tts_precision', 'fp32')
+            self.compile = self.config.get('tts_compile', False)
+            self.half_precision = self.config.get('tts_half_precision', True)
+            self.gpt_cond_latent = None
+            self.speaker_embedding = None
         except ImportError:
             logger.error("TTS not installed. Please install it with 'pip install TTS'.")
             raise TTSEngineError("TTS not installed. Please install it with 'pip install TTS'.")
     
+    def _ensure_model(self):
+        """
+        Load XTTS model on first use, so an engine handed to worker
+        processes never loads it in the parent
+        """
+        if self.model is None:
+            self._load_model()
+    
     def _load_model(self):
-        """Load XTTS model"""
+        """Load XTTS model, reusing one already loaded with the same settings"""
+        key = (XTTS_MODEL_NAME, self.device, self.precision, self.compile)
+        
         try:
-            self.model = self.TTS("tts_models/multilingual/multi-dataset/xtts_v2").to(self.device)
-            logger.info(f"XTTS model loaded on {self.device}")
+            # Hold the lock while loading so concurrent engines load the model once
+            with _xtts_models_lock:
+                if key in _xtts_models:
+                    self.model, self.precision = _xtts_models[key]
+                    logger.debug(f"Reusing XTTS model on {self.device} ({self.precision})")
+                else:
+                    self.model = self.TTS(XTTS_MODEL_NAME).to(self.device)
+                    self._apply_precision()
+                    
+                    if self.compile:
+                        self._compile_model()
+                    
+                    # Store the precision actually applied, which may have fallen back
+                    _xtts_models[key] = (self.model, self.precision)
+                    logger.info(f"XTTS model loaded on {self.device} ({self.precision})")
+            
+            # Encode the voice sample once instead of on every chunk
+            if self.voice_sample:
+                with self._inference_context():
+                    self.gpt_cond_latent, self.speaker_embedding = (
+                        self.model.synthesizer.tts_model.get_conditioning_latents(audio_path=[self.voice_sample])
+                    )
         except Exception as e:
             logger.error(f"XTTS error: {str(e)}")
             raise TTSEngineError(f"XTTS error: {str(e)}")
     
+    def _apply_precision(self):
+        """
+        Cast XTTS model weights to the configured precision
+        
+        Raises:
+            TTSEngineError: If precision is unknown
+        """
+        if self.precision == "fp32":
+            return
+        
+        synthesizer = self.model.synthesizer
+        
+        if self.precision == "fp16":
+            # Half precision kernels are only worthwhile on GPU
+            if self.device != "cuda":
+                logger.warning("fp16 requires CUDA, using fp32")
+                self.precision = "fp32"
+                return
+            synthesizer.tts_model = synthesizer.tts_model.half()
+        
+        elif self.precision == "bf16":
+            synthesizer.tts_model = synthesizer.tts_model.to(self.torch.bfloat16)
+        
+        elif self.precision == "int8":
+            # Dynamic quantization only has CPU kernels
+            if self.device != "cpu":
+                logger.warning("int8 is only supported on CPU, using fp32")
+                self.precision = "fp32"
+                return
+            synthesizer.tts_model = self.torch.quantization.quantize_dynamic(
+                synthesizer.tts_model,
+                {self.torch.nn.Linear},
+                dtype=self.torch.qint8
+            )
+        
+        else:
+            raise TTSEngineError(f"Unknown precision: {self.precision}")
+    
+    def _compile_model(self):
+        """Compile the XTTS decoder with torch.compile"""
+        if not hasattr(self.torch, "compile"):
+            logger.warning("torch.compile requires PyTorch 2.0 or later, skipping compilation")
+            return
+        
+        tts_model = self.model.synthesizer.tts_model
+        
+        # The GPT stage runs through generate(), so only the vocoder's forward
+        # pass benefits from compilation
+        if not hasattr(tts_model, "hifigan_decoder"):
+            logger.warning("XTTS model has no HiFi-GAN decoder, skipping compilation")
+            return
+        
+        tts_model.hifigan_decoder = self.torch.compile(
+            tts_model.hifigan_decoder,
+            mode="reduce-overhead",
+            fullgraph=False
+        )
+    
+    def _inference_context(self):
+        """
+        Context for running the model without autograd, with FP16 autocast
+        on CUDA when half precision is enabled
+        
+        Returns:
+            contextlib.ExitStack: Context manager
+        """
+        stack = contextlib.ExitStack()
+        stack.enter_context(self.torch.inference_mode())
+        
+        # Weights already cast by tts_precision run at their own precision
+        if self.half_precision and self.device == "cuda" and self.precision == "fp32":
+            stack.enter_context(self.torch.autocast(device_type="cuda", dtype=self.torch.float16))
+        
+        return stack
+    
+    def _synthesize(self, text):
+        """
+        Synthesize text, reusing the voice sample's conditioning latents
+        when they have been computed
+        
+        Args:
+            text (str): Text to speak
+            
+        Returns:
+            Waveform samples
+        """
+        self._ensure_model()
+        
+        if self.gpt_cond_latent is None:
+            return self.model.tts(
+                text=text,
+                speaker_wav=self.voice_sample,
+                language=self.language
+            )
+        
+        output = self.model.synthesizer.tts_model.inference(
+            text,
+            self.language,
+            self.gpt_cond_latent,
+            self.speaker_embedding,
+            enable_text_splitting=True
+        )
+        return output["wav"]
+    
+    def warmup(self):
+        """Run a short synthesis to build kernels before the first chunk"""
+        try:
+            with self._inference_context():
+                self._synthesize("Hello.")
+            
+            logger.debug("XTTS model warmed up")
+        
+        except Exception as e:
+            logger.warning(f"XTTS warmup failed: {str(e)}")
+    
     def say(self, text):
         """
         Speak text
@@ -458,22 +1107,18 @@ class XTTSEngine(TTSEngine):
             
             # Generate speech
             self.is_speaking_flag = True
-            self.model.tts_to_file(
-                text=text,
-                file_path=temp_file,
-                speaker_wav=self.voice_sample,
-                language=self.language
-            )
+            with self._inference_context():
+                wav = self._synthesize(text)
+            self.model.synthesizer.save_wav(wav, temp_file)
             
             # Play speech
             import pygame
-            pygame.mixer.init()
+            _init_mixer(pygame)
             pygame.mixer.music.load(temp_file)
             pygame.mixer.music.play()
             
             # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
+            _wait_for_music_end(pygame)
             
             # Clean up
             self.is_speaking_flag = False
@@ -500,33 +1145,82 @@ class XTTSEngine(TTSEngine):
             output_dir = os.path.dirname(os.path.abspath(output_file))
             os.makedirs(output_dir, exist_ok=True)
             
+            if self._load_cached_phrase(text, output_file):
+                return True
+            
             # Generate speech
-            self.model.tts_to_file(
-                text=text,
-                file_path=output_file,
-                speaker_wav=self.voice_sample,
-                language=self.language
-            )
+            with self._inference_context():
+                wav = self._synthesize(text)
+            self.model.synthesizer.save_wav(wav, output_file)
             
+            self._cache_phrase(text, output_file)
             return True
         
         except Exception as e:
             logger.error(f"XTTS error: {str(e)}")
             raise TTSEngineError(f"XTTS error: {str(e)}")
     
-    def is_available(self):
+    def save_batch(self, items, max_batch=8):
         """
-        Check if XTTS engine is available
+        Synthesize a batch of texts, writing each waveform to disk in the
+        background while the next one is synthesized
         
+        Args:
+            items (list): (text, output file path) tuples
+            max_batch (int): Maximum number of waveforms waiting to be written
+            
         Returns:
-            bool: True if available, False otherwise
+            bool: True if successful, False otherwise
         """
         try:
-            import torch
-            from TTS.api import TTS
+            # Create output directories if they don't exist
+            for output_dir in {os.path.dirname(os.path.abspath(f)) for _, f in items}:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            self._ensure_model()
+            synthesizer = self.model.synthesizer
+            pending = collections.deque()
+            synthesized = []
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="epub2tts-wav") as writer:
+                # Generate speech without autograd bookkeeping between utterances
+                with self._inference_context():
+                    for text, output_file in items:
+                        if self._load_cached_phrase(text, output_file):
+                            continue
+                        
+                        wav = self._synthesize(text)
+                        synthesized.append((text, output_file))
+                        pending.append(writer.submit(synthesizer.save_wav, wav, output_file))
+                        
+                        # Bound the number of waveforms held in memory
+                        while len(pending) > max_batch:
+                            pending.popleft().result()
+                
+                for future in pending:
+                    future.result()
+            
+            for text, output_file in synthesized:
+                self._cache_phrase(text, output_file)
+            
             return True
-        except ImportError:
-            return False
+        
+        except Exception as e:
+            logger.error(f"XTTS error: {str(e)}")
+            raise TTSEngineError(f"XTTS error: {str(e)}")
+    
+    def save_many_to_files(self, texts, output_files):
+        """
+        Save texts to audio files in one call
+        
+        Args:
+            texts (list): Texts to speak
+            output_files (list): Output file paths, one per text
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_batch(list(zip(texts, output_files)), self.config.get('tts_batch_size', 8))
     
     def get_available_voices(self):
         """
@@ -581,12 +1275,9 @@ def get_tts_engine(engine_name="edge", config=None):
     
     engine_class = engines[engine_name]
     
+    # Constructing the engine imports its modules, proving availability
     try:
-        engine = engine_class(config)
-        if not engine.is_available():
-            logger.error(f"TTS engine {engine_name} is not available")
-            raise TTSEngineError(f"TTS engine {engine_name} is not available")
-        return engine
+        return engine_class(config)
     except Exception as e:
         logger.error(f"Error initializing TTS engine {engine_name}: {str(e)}")
         raise TTSEngineError(f"Error initializing TTS engine {engine_name}: {str(e)}")
@@ -598,31 +1289,12 @@ def list_engines():
     Returns:
         list: List of available TTS engines
     """
-    engines = []
-    
-    # Check Edge TTS
-    try:
-        import edge_tts
-        engines.append("edge")
-    except ImportError:
-        pass
-    
-    # Check Google TTS
-    try:
-        from gtts import gTTS
-        engines.append("google")
-    except ImportError:
-        pass
-    
-    # Check XTTS
-    try:
-        import torch
-        from TTS.api import TTS
-        engines.append("xtts")
-    except ImportError:
-        pass
-    
-    return engines
+    # Check installed packages only, importing torch alone takes seconds
+    return [
+        engine_class.name
+        for engine_class in (EdgeTTSEngine, GoogleTTSEngine, XTTSEngine)
+        if engine_class.is_available()
+    ]
 
 def list_voices(engine_name="edge"):
     """
@@ -634,6 +1306,11 @@ def list_voices(engine_name="edge"):
     Returns:
         list: List of available voices
     """
+    # Skip creating the engine when its voice list is cached
+    voices = _get_cached_voices(engine_name)
+    if voices is not None:
+        return voices
+    
     try:
         engine = get_tts_engine(engine_name)
         return engine.get_available_voices()
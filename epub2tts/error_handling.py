@@ -4,7 +4,10 @@ Error handling utilities for EPUB2TTS
 
 import os
 import sys
+import time
+import shutil
 import logging
+import functools
 import traceback
 import platform
 from pathlib import Path
@@ -38,6 +41,32 @@ class ConfigError(EPUB2TTSError):
     """Configuration errors"""
     pass
 
+# User-friendly message formats for known error types
+_ERROR_MESSAGES = {
+    FileNotFoundError: "File not found: {}",
+    PermissionError: "Permission denied: {}",
+    TTSEngineError: "TTS engine error: {}",
+    WhisperError: "Whisper error: {}",
+    ResourceError: "Resource error: {}",
+    ConfigError: "Configuration error: {}",
+}
+
+def _get_error_message_format(error_class):
+    """
+    Get message format for error type, looking up its base classes too
+    
+    Args:
+        error_class (type): Exception class
+        
+    Returns:
+        str: Message format, or None if the error type is not known
+    """
+    for cls in error_class.__mro__:
+        message_format = _ERROR_MESSAGES.get(cls)
+        if message_format:
+            return message_format
+    return None
+
 # Error handler
 def handle_error(error, gui_mode=False):
     """
@@ -59,18 +88,10 @@ def handle_error(error, gui_mode=False):
     logger.debug(error_traceback)
     
     # Create user-friendly message
-    if isinstance(error, FileNotFoundError):
-        user_message = f"File not found: {error_message}"
-    elif isinstance(error, PermissionError):
-        user_message = f"Permission denied: {error_message}"
-    elif isinstance(error, TTSEngineError):
-        user_message = f"TTS engine error: {error_message}"
-    elif isinstance(error, WhisperError):
-        user_message = f"Whisper error: {error_message}"
-    elif isinstance(error, ResourceError):
-        user_message = f"Resource error: {error_message}"
-    elif isinstance(error, ConfigError):
-        user_message = f"Configuration error: {error_message}"
+    message_format = _get_error_message_format(type(error))
+    
+    if message_format:
+        user_message = message_format.format(error_message)
     elif "No module named" in error_message:
         missing_module = error_message.split("'")[1]
         user_message = f"Missing module: {missing_module}. Please install it with 'pip install {missing_module}'."
@@ -84,15 +105,24 @@ def handle_error(error, gui_mode=False):
     # Return user-friendly message
     return user_message
 
+# Resource information is reused for this many seconds
+RESOURCE_CACHE_TTL = 1.0
+_resource_cache = {'timestamp': 0.0, 'resources': None}
+
 def check_system_resources():
     """
     Check system resources
     
+    Results are cached for RESOURCE_CACHE_TTL seconds.
+    
     Returns:
         dict: Resource information
     """
     import psutil
     
+    if _resource_cache['resources'] and time.monotonic() - _resource_cache['timestamp'] < RESOURCE_CACHE_TTL:
+        return dict(_resource_cache['resources'])
+    
     try:
         # Get memory info
         memory = psutil.virtual_memory()
@@ -106,8 +136,9 @@ def check_system_resources():
         disk_total_gb = disk.total / (1024 * 1024 * 1024)
         disk_percent = disk.percent
         
-        # Get CPU info
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # Get CPU info. Only the first call blocks to take a sample, later
+        # calls measure usage since the previous call without sleeping.
+        cpu_percent = psutil.cpu_percent(interval=None if _resource_cache['resources'] else 0.1)
         cpu_count = psutil.cpu_count(logical=True)
         
         # Check if resources are sufficient
@@ -131,7 +162,10 @@ def check_system_resources():
             'resources_ok': resources_ok
         }
         
-        return resource_info
+        _resource_cache['timestamp'] = time.monotonic()
+        _resource_cache['resources'] = resource_info
+        
+        return dict(resource_info)
     
     except Exception as e:
         logger.warning(f"Failed to check system resources: {str(e)}")
@@ -140,13 +174,23 @@ def check_system_resources():
             'error': str(e)
         }
 
-def check_ffmpeg():
+@functools.lru_cache(maxsize=None)
+def check_ffmpeg(verify=False):
     """
     Check if FFmpeg is installed
     
+    The result is cached, since it does not change during a run.
+    
+    Args:
+        verify (bool): Run FFmpeg to check that it works, rather than only
+            looking it up on PATH
+    
     Returns:
         bool: True if FFmpeg is installed
     """
+    if not verify:
+        return shutil.which("ffmpeg") is not None
+    
     import subprocess
     
     try:
@@ -160,6 +204,22 @@ def check_ffmpeg():
     except (subprocess.SubprocessError, FileNotFoundError):
         return False
 
+@functools.lru_cache(maxsize=1)
+def _get_installed_packages():
+    """
+    Get installed packages once per process
+    
+    Returns:
+        tuple: Sorted "name==version" strings
+    """
+    import importlib.metadata
+    
+    return tuple(sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+        if dist.metadata['Name']
+    ))
+
 def create_error_report(error, system_info=True):
     """
     Create detailed error report
@@ -219,16 +279,13 @@ def create_error_report(error, system_info=True):
     
     # Add installed packages
     try:
-        import pkg_resources
-        installed_packages = sorted([f"{pkg.key}=={pkg.version}" for pkg in pkg_resources.working_set])
-        
         report.extend([
             "Installed Packages:",
-            *installed_packages,
+            *_get_installed_packages(),
             ""
         ])
     except ImportError:
-        report.append("Installed Packages: pkg_resources not available")
+        report.append("Installed Packages: importlib.metadata not available")
         report.append("")
     
     # Check FFmpeg
@@ -251,23 +308,18 @@ def save_error_report(error, output_path=None):
     """
     report = create_error_report(error)
     
-    if output_path is None:
-        # Use user's home directory
-        home_dir = str(Path.home())
-        output_dir = os.path.join(home_dir, ".epub2tts", "logs")
-        
-        # Create directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        # Create filename with timestamp
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(output_dir, f"error_report_{timestamp}.txt")
-    
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        if output_path is None:
+            # Use user's home directory
+            output_dir = Path.home() / ".epub2tts" / "logs"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create filename with timestamp
+            import datetime
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = str(output_dir / f"error_report_{timestamp}.txt")
+        
+        Path(output_path).write_text(report, encoding='utf-8')
         
         logger.info(f"Error report saved to {output_path}")
         return output_path
@@ -6,22 +6,101 @@ import os
 import sys
 import time
 import logging
+import queue
+import asyncio
 import threading
+import collections
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from pathlib import Path
 
 from . import __version__
-from .core.logger import setup_logger
+from .core.logger import get_logger
 from .core.config import Config
-from .core.ebook import Ebook
-from .core.tts_engines import get_tts_engine, list_engines, list_voices
-from .converters.book_converter import BookConverter
-from .whisper.transcriber import WhisperTranscriber
+from .core.audio_utils import record_audio
 from .core.exceptions import EPUB2TTSError
 
+# darkdetect is optional, the system theme falls back to light if it is missing
+try:
+    import darkdetect
+except ImportError:
+    darkdetect = None
+
 # Setup logger
-logger = setup_logger()
+logger = get_logger(__name__)
+
+# Number of parsed ebooks, and of their extracted texts, kept for reuse
+EBOOK_CACHE_SIZE = 4
+
+# Number of loaded Whisper models kept for reuse, each can take hundreds of MB
+TRANSCRIBER_CACHE_SIZE = 2
+
+# ttk theme used for the dark theme, built once on top of "clam"
+DARK_THEME_NAME = "epub2tts_dark"
+DARK_THEME_SETTINGS = {
+    "TLabel": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TFrame": {"configure": {"background": '#2d2d2d'}},
+    "TButton": {"configure": {"background": '#4d4d4d', "foreground": '#ffffff'}},
+    "TCheckbutton": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TRadiobutton": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TLabelframe": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TLabelframe.Label": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TNotebook": {"configure": {"background": '#2d2d2d', "foreground": '#ffffff'}},
+    "TNotebook.Tab": {"configure": {"background": '#4d4d4d', "foreground": '#ffffff'}},
+}
+
+# File type filters for file dialogs
+EBOOK_FILETYPES = (
+    ("Ebook files", "*.epub *.pdf *.txt"),
+    ("EPUB files", "*.epub"),
+    ("PDF files", "*.pdf"),
+    ("Text files", "*.txt"),
+    ("All files", "*.*"),
+)
+OUTPUT_FILETYPES = (
+    ("MP3 files", "*.mp3"),
+    ("WAV files", "*.wav"),
+    ("OGG files", "*.ogg"),
+    ("Text files", "*.txt"),
+    ("All files", "*.*"),
+)
+AUDIO_FILETYPES = (
+    ("Audio files", "*.wav *.mp3 *.ogg"),
+    ("WAV files", "*.wav"),
+    ("MP3 files", "*.mp3"),
+    ("OGG files", "*.ogg"),
+    ("All files", "*.*"),
+)
+WAV_FILETYPES = (("WAV files", "*.wav"), ("All files", "*.*"))
+TEXT_FILETYPES = (("Text files", "*.txt"), ("All files", "*.*"))
+
+# Grid sticky option for widgets that stretch horizontally
+STICKY_WE = tk.W + tk.E
+
+# TTS engines that clone a voice from a sample file
+VOICE_SAMPLE_ENGINES = frozenset({"xtts"})
+
+# Choices offered in the settings tab
+OUTPUT_FORMATS = ('mp3', 'wav', 'ogg')
+OUTPUT_QUALITIES = (64, 128, 192, 256, 320)
+OUTPUT_SAMPLE_RATES = (8000, 16000, 22050, 44100, 48000)
+WHISPER_MODELS = ('tiny', 'base', 'small', 'medium', 'large')
+
+# Minimum time in seconds between progress bar updates during conversion
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Characters inserted into the text area per idle callback
+TEXT_INSERT_CHUNK_SIZE = 65536
+
+# Threads shared by conversions and voice loading for blocking work
+GUI_EXECUTOR_WORKERS = 2
+
+# Minimum interval in seconds between forced redraws of the status bar
+STATUS_FLUSH_INTERVAL = 0.1
+
+# Interval in milliseconds at which updates from the conversion loop are
+# applied to widgets
+UI_POLL_INTERVAL_MS = 50
 
 class EPUB2TTSGUI:
     """Main GUI class for EPUB2TTS"""
@@ -46,12 +125,37 @@ class EPUB2TTSGUI:
         
         # Initialize variables
         self.ebook = None
+        self._ebook_cache = collections.OrderedDict()
+        self._ebook_cache_lock = threading.Lock()
+        self._text_cache = collections.OrderedDict()
+        self._transcriber_cache = collections.OrderedDict()
+        self._transcriber_cache_lock = threading.Lock()
         self.tts_engine = None
         self.converter = None
         self.transcriber = None
-        self.conversion_thread = None
+        self.conversion_future = None
         self.is_converting = False
+        self._full_text = None
+        self._text_load_id = 0
+        self._voice_sample_state = None
         self.stop_requested = False
+        self._dark_theme_created = False
+        self._applied_theme = None
+        self._last_status_flush = 0.0
+        
+        # Conversions and other slow work run on one long-lived event loop
+        # thread, and widget updates are queued back to the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        self._loop = asyncio.new_event_loop()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=GUI_EXECUTOR_WORKERS, thread_name_prefix="epub2tts-gui"
+        )
+        self._loop.set_default_executor(self._executor)
+        threading.Thread(target=self._loop.run_forever, name="epub2tts-conversion", daemon=True).start()
+        self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        
+        # Theme variable is needed by the menu
+        self.theme_var = tk.StringVar(value=self.config.get('theme', 'system'))
         
         # Create GUI elements
         self.create_menu()
@@ -59,7 +163,6 @@ class EPUB2TTSGUI:
         self.create_status_bar()
         
         # Apply theme
-        self.theme_var = tk.StringVar(value=self.config.get('theme', 'system'))
         self.apply_theme()
         
         # Load engines and voices
@@ -121,101 +224,134 @@ class EPUB2TTSGUI:
         self.create_text_tab()
         self.create_settings_tab()
     
+    def _add_file_row(self, parent, row, label, variable, command, width=None):
+        """
+        Add a labelled file path entry with a Browse button to a grid
+        
+        Args:
+            parent: Parent widget
+            row (int): Grid row
+            label (str): Label text
+            variable (tk.StringVar): Variable holding the path
+            command (callable): Browse button command
+            width (int, optional): Entry width in characters
+            
+        Returns:
+            tuple: (entry, button)
+        """
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        entry = ttk.Entry(parent, textvariable=variable, width=width)
+        entry.grid(row=row, column=1, sticky=STICKY_WE, padx=5, pady=5)
+        
+        button = ttk.Button(parent, text="Browse", command=command)
+        button.grid(row=row, column=2, sticky=tk.W, padx=5, pady=5)
+        
+        return entry, button
+    
+    def _add_combobox_row(self, parent, row, label, variable, values=(), sticky=tk.W):
+        """
+        Add a labelled read-only combobox to a grid
+        
+        Args:
+            parent: Parent widget
+            row (int): Grid row
+            label (str): Label text
+            variable (tk.Variable): Variable holding the selection
+            values (sequence): Choices
+            sticky (str): Grid sticky option for the combobox
+            
+        Returns:
+            ttk.Combobox: Combobox
+        """
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+        
+        combobox = ttk.Combobox(parent, textvariable=variable, values=list(values), state="readonly")
+        combobox.grid(row=row, column=1, sticky=sticky, padx=5, pady=5)
+        
+        return combobox
+    
     def create_convert_tab(self):
         """Create convert tab"""
         self.convert_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.convert_tab, text="Convert")
         
-        # Input file
-        ttk.Label(self.convert_tab, text="Input File:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
+        # Input and output files
         self.input_file_var = tk.StringVar()
-        self.input_file_entry = ttk.Entry(self.convert_tab, textvariable=self.input_file_var, width=50)
-        self.input_file_entry.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
-        
-        self.browse_button = ttk.Button(self.convert_tab, text="Browse", command=self.browse_input_file)
-        self.browse_button.grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        
-        # Output file
-        ttk.Label(self.convert_tab, text="Output File:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.input_file_entry, _ = self._add_file_row(
+            self.convert_tab, 0, "Input File:", self.input_file_var, self.browse_input_file, width=50
+        )
         
         self.output_file_var = tk.StringVar()
-        self.output_file_entry = ttk.Entry(self.convert_tab, textvariable=self.output_file_var, width=50)
-        self.output_file_entry.grid(row=1, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
-        
-        self.output_browse_button = ttk.Button(self.convert_tab, text="Browse", command=self.browse_output_file)
-        self.output_browse_button.grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        self.output_file_entry, _ = self._add_file_row(
+            self.convert_tab, 1, "Output File:", self.output_file_var, self.browse_output_file, width=50
+        )
         
         # TTS Engine
-        ttk.Label(self.convert_tab, text="TTS Engine:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        
         self.engine_var = tk.StringVar(value=self.config.get('tts_engine', 'edge'))
-        self.engine_combobox = ttk.Combobox(self.convert_tab, textvariable=self.engine_var, state="readonly")
-        self.engine_combobox.grid(row=2, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.engine_combobox = self._add_combobox_row(
+            self.convert_tab, 2, "TTS Engine:", self.engine_var, sticky=STICKY_WE
+        )
         self.engine_combobox.bind("<<ComboboxSelected>>", self.on_engine_change)
         
         # Voice
-        ttk.Label(self.convert_tab, text="Voice:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        
         self.voice_var = tk.StringVar(value=self.config.get('voice', ''))
-        self.voice_combobox = ttk.Combobox(self.convert_tab, textvariable=self.voice_var, state="readonly")
-        self.voice_combobox.grid(row=3, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.voice_combobox = self._add_combobox_row(
+            self.convert_tab, 3, "Voice:", self.voice_var, sticky=STICKY_WE
+        )
         
         # Language
         ttk.Label(self.convert_tab, text="Language:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.language_var = tk.StringVar(value=self.config.get('language', 'en'))
-        self.language_entry = ttk.Entry(self.convert_tab, textvariable=self.language_var)
-        self.language_entry.grid(row=4, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        language_entry = ttk.Entry(self.convert_tab, textvariable=self.language_var)
+        language_entry.grid(row=4, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         # Voice sample (for XTTS)
-        ttk.Label(self.convert_tab, text="Voice Sample:").grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
-        
         self.voice_sample_var = tk.StringVar(value=self.config.get('voice_sample', ''))
-        self.voice_sample_entry = ttk.Entry(self.convert_tab, textvariable=self.voice_sample_var)
-        self.voice_sample_entry.grid(row=5, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
-        
-        self.voice_sample_button = ttk.Button(self.convert_tab, text="Browse", command=self.browse_voice_sample)
-        self.voice_sample_button.grid(row=5, column=2, sticky=tk.W, padx=5, pady=5)
+        self.voice_sample_entry, self.voice_sample_button = self._add_file_row(
+            self.convert_tab, 5, "Voice Sample:", self.voice_sample_var, self.browse_voice_sample
+        )
         
         # Options frame
         self.options_frame = ttk.LabelFrame(self.convert_tab, text="Options")
-        self.options_frame.grid(row=6, column=0, columnspan=3, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.options_frame.grid(row=6, column=0, columnspan=3, sticky=STICKY_WE, padx=5, pady=5)
         
         # Chunk size
         ttk.Label(self.options_frame, text="Chunk Size:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.chunk_size_var = tk.IntVar(value=self.config.get('chunk_size', 2000))
-        self.chunk_size_spinbox = ttk.Spinbox(self.options_frame, from_=100, to=10000, increment=100, textvariable=self.chunk_size_var)
-        self.chunk_size_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        chunk_size_spinbox = ttk.Spinbox(self.options_frame, from_=100, to=10000, increment=100, textvariable=self.chunk_size_var)
+        chunk_size_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Processes
-        ttk.Label(self.options_frame, text="Processes:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(self.options_frame, text="Processes (0 = auto):").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
         
-        self.processes_var = tk.IntVar(value=self.config.get('max_workers', 4))
-        self.processes_spinbox = ttk.Spinbox(self.options_frame, from_=1, to=16, increment=1, textvariable=self.processes_var)
-        self.processes_spinbox.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
+        # 0 leaves the number of workers to the TTS engine
+        self.processes_var = tk.IntVar(value=self.config.get('max_workers') or 0)
+        processes_spinbox = ttk.Spinbox(self.options_frame, from_=0, to=16, increment=1, textvariable=self.processes_var)
+        processes_spinbox.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Text only checkbox
         self.text_only_var = tk.BooleanVar(value=False)
-        self.text_only_check = ttk.Checkbutton(self.options_frame, text="Extract Text Only", variable=self.text_only_var)
-        self.text_only_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        text_only_check = ttk.Checkbutton(self.options_frame, text="Extract Text Only", variable=self.text_only_var)
+        text_only_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
         # Keep temp files checkbox
         self.keep_temp_var = tk.BooleanVar(value=self.config.get('keep_temp_files', False))
-        self.keep_temp_check = ttk.Checkbutton(self.options_frame, text="Keep Temporary Files", variable=self.keep_temp_var)
-        self.keep_temp_check.grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        keep_temp_check = ttk.Checkbutton(self.options_frame, text="Keep Temporary Files", variable=self.keep_temp_var)
+        keep_temp_check.grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
         # Progress bar
         ttk.Label(self.convert_tab, text="Progress:").grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_var = tk.IntVar(value=0)
         self.progress_bar = ttk.Progressbar(self.convert_tab, variable=self.progress_var, maximum=100)
-        self.progress_bar.grid(row=7, column=1, columnspan=2, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.progress_bar.grid(row=7, column=1, columnspan=2, sticky=STICKY_WE, padx=5, pady=5)
         
         # Buttons frame
         self.buttons_frame = ttk.Frame(self.convert_tab)
-        self.buttons_frame.grid(row=8, column=0, columnspan=3, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.buttons_frame.grid(row=8, column=0, columnspan=3, sticky=STICKY_WE, padx=5, pady=5)
         
         # Convert button
         self.convert_button = ttk.Button(self.buttons_frame, text="Convert", command=self.convert)
@@ -234,13 +370,35 @@ class EPUB2TTSGUI:
         self.notebook.add(self.text_tab, text="Text")
         
         # Text area
-        self.text_area = tk.Text(self.text_tab, wrap=tk.WORD)
+        self.text_area = tk.Text(self.text_tab, wrap=tk.WORD, undo=False)
         self.text_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Scrollbar
-        self.text_scrollbar = ttk.Scrollbar(self.text_area, command=self.text_area.yview)
-        self.text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text_area.config(yscrollcommand=self.text_scrollbar.set)
+        text_scrollbar = ttk.Scrollbar(self.text_area, command=self.text_area.yview)
+        text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_area.config(yscrollcommand=text_scrollbar.set)
+    
+    def _bind_value_label(self, variable, label):
+        """
+        Show an integer variable's value in a label whenever it changes
+        
+        Args:
+            variable (tk.IntVar): Variable to show
+            label (ttk.Label): Label to update
+        """
+        shown = variable.get()
+        
+        def update(*args):
+            nonlocal shown
+            
+            # Scales write fractional values while dragging, only redraw
+            # when the integer value changes
+            value = variable.get()
+            if value != shown:
+                shown = value
+                label.config(text=str(value))
+        
+        variable.trace_add('write', update)
     
     def create_settings_tab(self):
         """Create settings tab"""
@@ -255,83 +413,75 @@ class EPUB2TTSGUI:
         ttk.Label(self.tts_frame, text="Speed:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.speed_var = tk.IntVar(value=self.config.get('speed', 150))
-        self.speed_scale = ttk.Scale(self.tts_frame, from_=50, to=300, variable=self.speed_var, orient=tk.HORIZONTAL)
-        self.speed_scale.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        speed_scale = ttk.Scale(self.tts_frame, from_=50, to=300, variable=self.speed_var, orient=tk.HORIZONTAL)
+        speed_scale.grid(row=0, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
-        self.speed_label = ttk.Label(self.tts_frame, text=  padx=5, pady=5)
-        
-        self.speed_label = ttk.Label(self.tts_frame, text=str(self.speed_var.get()))
-        self.speed_label.grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        self.speed_scale.config(command=lambda val: self.speed_label.config(text=str(int(float(val)))))
+        speed_label = ttk.Label(self.tts_frame, text=str(self.speed_var.get()))
+        speed_label.grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
+        self._bind_value_label(self.speed_var, speed_label)
         
         # Volume
         ttk.Label(self.tts_frame, text="Volume:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.volume_var = tk.IntVar(value=self.config.get('volume', 100))
-        self.volume_scale = ttk.Scale(self.tts_frame, from_=0, to=200, variable=self.volume_var, orient=tk.HORIZONTAL)
-        self.volume_scale.grid(row=1, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        volume_scale = ttk.Scale(self.tts_frame, from_=0, to=200, variable=self.volume_var, orient=tk.HORIZONTAL)
+        volume_scale.grid(row=1, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
-        self.volume_label = ttk.Label(self.tts_frame, text=str(self.volume_var.get()))
-        self.volume_label.grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
-        self.volume_scale.config(command=lambda val: self.volume_label.config(text=str(int(float(val)))))
+        volume_label = ttk.Label(self.tts_frame, text=str(self.volume_var.get()))
+        volume_label.grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        self._bind_value_label(self.volume_var, volume_label)
         
         # Pitch
         ttk.Label(self.tts_frame, text="Pitch:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.pitch_var = tk.IntVar(value=self.config.get('pitch', 0))
-        self.pitch_scale = ttk.Scale(self.tts_frame, from_=-50, to=50, variable=self.pitch_var, orient=tk.HORIZONTAL)
-        self.pitch_scale.grid(row=2, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        pitch_scale = ttk.Scale(self.tts_frame, from_=-50, to=50, variable=self.pitch_var, orient=tk.HORIZONTAL)
+        pitch_scale.grid(row=2, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
-        self.pitch_label = ttk.Label(self.tts_frame, text=str(self.pitch_var.get()))
-        self.pitch_label.grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
-        self.pitch_scale.config(command=lambda val: self.pitch_label.config(text=str(int(float(val)))))
+        pitch_label = ttk.Label(self.tts_frame, text=str(self.pitch_var.get()))
+        pitch_label.grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
+        self._bind_value_label(self.pitch_var, pitch_label)
         
         # Output Settings
         self.output_frame = ttk.LabelFrame(self.settings_tab, text="Output Settings")
         self.output_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Output format
-        ttk.Label(self.output_frame, text="Format:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
+        # Output format, quality and sample rate
         self.format_var = tk.StringVar(value=self.config.get('output_format', 'mp3'))
-        self.format_combobox = ttk.Combobox(self.output_frame, textvariable=self.format_var, values=['mp3', 'wav', 'ogg'], state="readonly")
-        self.format_combobox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Output quality
-        ttk.Label(self.output_frame, text="Quality (kbps):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self._add_combobox_row(
+            self.output_frame, 0, "Format:", self.format_var, OUTPUT_FORMATS
+        )
         
         self.quality_var = tk.IntVar(value=self.config.get('output_quality', 192))
-        self.quality_combobox = ttk.Combobox(self.output_frame, textvariable=self.quality_var, values=[64, 128, 192, 256, 320], state="readonly")
-        self.quality_combobox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        # Sample rate
-        ttk.Label(self.output_frame, text="Sample Rate (Hz):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self._add_combobox_row(
+            self.output_frame, 1, "Quality (kbps):", self.quality_var, OUTPUT_QUALITIES
+        )
         
         self.sample_rate_var = tk.IntVar(value=self.config.get('output_sample_rate', 44100))
-        self.sample_rate_combobox = ttk.Combobox(self.output_frame, textvariable=self.sample_rate_var, values=[8000, 16000, 22050, 44100, 48000], state="readonly")
-        self.sample_rate_combobox.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        self._add_combobox_row(
+            self.output_frame, 2, "Sample Rate (Hz):", self.sample_rate_var, OUTPUT_SAMPLE_RATES
+        )
         
         # Whisper Settings
         self.whisper_frame = ttk.LabelFrame(self.settings_tab, text="Whisper Settings")
         self.whisper_frame.pack(fill=tk.X, padx=5, pady=5)
         
         # Whisper model
-        ttk.Label(self.whisper_frame, text="Model:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
         self.whisper_model_var = tk.StringVar(value=self.config.get('whisper_model', 'base'))
-        self.whisper_model_combobox = ttk.Combobox(self.whisper_frame, textvariable=self.whisper_model_var, values=['tiny', 'base', 'small', 'medium', 'large'], state="readonly")
-        self.whisper_model_combobox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        self._add_combobox_row(
+            self.whisper_frame, 0, "Model:", self.whisper_model_var, WHISPER_MODELS
+        )
         
         # Whisper language
         ttk.Label(self.whisper_frame, text="Language:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.whisper_language_var = tk.StringVar(value=self.config.get('whisper_language', ''))
-        self.whisper_language_entry = ttk.Entry(self.whisper_frame, textvariable=self.whisper_language_var)
-        self.whisper_language_entry.grid(row=1, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        whisper_language_entry = ttk.Entry(self.whisper_frame, textvariable=self.whisper_language_var)
+        whisper_language_entry.grid(row=1, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         # Save button
-        self.save_settings_button = ttk.Button(self.settings_tab, text="Save Settings", command=self.save_settings)
-        self.save_settings_button.pack(padx=5, pady=5)
+        save_settings_button = ttk.Button(self.settings_tab, text="Save Settings", command=self.save_settings)
+        save_settings_button.pack(padx=5, pady=5)
         
         # Configure grid
         self.tts_frame.columnconfigure(1, weight=1)
@@ -341,21 +491,23 @@ class EPUB2TTSGUI:
     def create_status_bar(self):
         """Create status bar"""
         self.status_var = tk.StringVar(value="Ready")
-        self.status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
     def apply_theme(self):
         """Apply theme to GUI"""
         theme = self.theme_var.get()
         
         if theme == "system":
-            # Try to detect system theme
-            try:
-                import darkdetect
-                theme = "dark" if darkdetect.isDark() else "light"
-            except ImportError:
-                # Default to light theme if darkdetect is not available
-                theme = "light"
+            # Detect system theme, defaulting to light
+            theme = "dark" if darkdetect and darkdetect.isDark() else "light"
+        
+        # Save theme setting, Config.set ignores unchanged values
+        self.config.set('theme', self.theme_var.get())
+        
+        # Nothing to restyle if the effective theme is already applied
+        if theme == self._applied_theme:
+            return
         
         if theme == "dark":
             # Apply dark theme
@@ -366,26 +518,18 @@ class EPUB2TTSGUI:
                 activeForeground='#ffffff'
             )
             
-            # Configure ttk styles
+            # Switch to the prebuilt dark ttk theme, building it on first use
             style = ttk.Style()
             
-            # Try to use a dark theme if available
             try:
-                style.theme_use("clam")
+                if not self._dark_theme_created:
+                    # Settings are sent to Tcl as one script
+                    style.theme_create(DARK_THEME_NAME, parent="clam", settings=DARK_THEME_SETTINGS)
+                    self._dark_theme_created = True
+                style.theme_use(DARK_THEME_NAME)
             except tk.TclError:
                 pass
             
-            # Configure colors
-            style.configure("TLabel", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TFrame", background='#2d2d2d')
-            style.configure("TButton", background='#4d4d4d', foreground='#ffffff')
-            style.configure("TCheckbutton", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TRadiobutton", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TLabelframe", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TLabelframe.Label", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TNotebook", background='#2d2d2d', foreground='#ffffff')
-            style.configure("TNotebook.Tab", background='#4d4d4d', foreground='#ffffff')
-            
             # Configure text area
             if hasattr(self, 'text_area'):
                 self.text_area.config(bg='#2d2d2d', fg='#ffffff', insertbackground='#ffffff')
@@ -406,12 +550,13 @@ class EPUB2TTSGUI:
             if hasattr(self, 'text_area'):
                 self.text_area.config(bg='white', fg='black', insertbackground='black')
         
-        # Save theme setting
-        self.config.set('theme', self.theme_var.get())
+        self._applied_theme = theme
     
     def load_engines(self):
         """Load available TTS engines"""
         try:
+            from .core.tts_engines import list_engines
+            
             engines = list_engines()
             self.engine_combobox['values'] = engines
             
@@ -425,45 +570,63 @@ class EPUB2TTSGUI:
             self.set_status(f"Error loading TTS engines: {str(e)}")
     
     def load_voices(self):
-        """Load available voices for selected TTS engine"""
+        """Load available voices for selected TTS engine in the background"""
+        engine = self.engine_var.get()
+        asyncio.run_coroutine_threadsafe(self._load_voices_coro(engine), self._loop)
+    
+    async def _load_voices_coro(self, engine):
+        """
+        Fetch voices for TTS engine on the conversion loop, which may need
+        a network request or loading the engine
+        
+        Args:
+            engine (str): TTS engine name
+        """
         try:
-            engine = self.engine_var.get()
-            voices = list_voices(engine)
-            self.voice_combobox['values'] = voices
+            from .core.tts_engines import list_voices
             
-            if not voices:
-                self.set_status(f"No voices found for {engine}")
-            elif self.voice_var.get() not in voices and voices:
-                self.voice_var.set(voices[0])
+            voices = await asyncio.get_running_loop().run_in_executor(None, list_voices, engine)
+            self._post_ui(self._set_voices, engine, voices)
         except Exception as e:
             logger.error(f"Error loading voices: {str(e)}")
-            self.set_status(f"Error loading voices: {str(e)}")
+            self._post_ui(self.set_status, f"Error loading voices: {str(e)}")
+    
+    def _set_voices(self, engine, voices):
+        """
+        Show voices fetched for TTS engine
+        
+        Args:
+            engine (str): TTS engine name
+            voices (list): List of voices
+        """
+        # Ignore voices for an engine that is no longer selected
+        if engine != self.engine_var.get():
+            return
+        
+        self.voice_combobox['values'] = voices
+        
+        if not voices:
+            self.set_status(f"No voices found for {engine}")
+        elif self.voice_var.get() not in voices:
+            self.voice_var.set(voices[0])
     
     def on_engine_change(self, event=None):
         """Handle TTS engine change"""
         self.load_voices()
         
-        # Show/hide voice sample field based on engine
-        if self.engine_var.get() == "xtts":
-            self.voice_sample_entry.config(state=tk.NORMAL)
-            self.voice_sample_button.config(state=tk.NORMAL)
-        else:
-            self.voice_sample_entry.config(state=tk.DISABLED)
-            self.voice_sample_button.config(state=tk.DISABLED)
+        # Enable voice sample field only for engines that use one
+        state = tk.NORMAL if self.engine_var.get() in VOICE_SAMPLE_ENGINES else tk.DISABLED
+        
+        if state != self._voice_sample_state:
+            self._voice_sample_state = state
+            self.voice_sample_entry.config(state=state)
+            self.voice_sample_button.config(state=state)
     
     def browse_input_file(self):
         """Browse for input file"""
-        filetypes = [
-            ("Ebook files", "*.epub *.pdf *.txt"),
-            ("EPUB files", "*.epub"),
-            ("PDF files", "*.pdf"),
-            ("Text files", "*.txt"),
-            ("All files", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="Select Ebook File",
-            filetypes=filetypes,
+            filetypes=EBOOK_FILETYPES,
             initialdir=self.config.get('last_directory')
         )
         
@@ -471,52 +634,34 @@ class EPUB2TTSGUI:
             self.input_file_var.set(filename)
             
             # Set default output file
-            input_path = Path(filename)
-            output_path = input_path.with_suffix(f".{self.format_var.get()}")
-            self.output_file_var.set(str(output_path))
+            self.output_file_var.set(f"{os.path.splitext(filename)[0]}.{self.format_var.get()}")
             
             # Save last directory
-            self.config.set('last_directory', str(input_path.parent))
+            self.config.set('last_directory', os.path.dirname(filename))
             
             # Load ebook
             self.load_ebook(filename)
     
     def browse_output_file(self):
         """Browse for output file"""
-        filetypes = [
-            ("MP3 files", "*.mp3"),
-            ("WAV files", "*.wav"),
-            ("OGG files", "*.ogg"),
-            ("Text files", "*.txt"),
-            ("All files", "*.*")
-        ]
-        
         filename = filedialog.asksaveasfilename(
             title="Select Output File",
-            filetypes=filetypes,
+            filetypes=OUTPUT_FILETYPES,
             initialdir=self.config.get('last_directory'),
-            initialfile=Path(self.output_file_var.get()).name if self.output_file_var.get() else None
+            initialfile=os.path.basename(self.output_file_var.get()) if self.output_file_var.get() else None
         )
         
         if filename:
             self.output_file_var.set(filename)
             
             # Save last directory
-            self.config.set('last_directory', str(Path(filename).parent))
+            self.config.set('last_directory', os.path.dirname(filename))
     
     def browse_voice_sample(self):
         """Browse for voice sample file"""
-        filetypes = [
-            ("Audio files", "*.wav *.mp3 *.ogg"),
-            ("WAV files", "*.wav"),
-            ("MP3 files", "*.mp3"),
-            ("OGG files", "*.ogg"),
-            ("All files", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="Select Voice Sample",
-            filetypes=filetypes,
+            filetypes=AUDIO_FILETYPES,
             initialdir=self.config.get('last_directory')
         )
         
@@ -524,17 +669,114 @@ class EPUB2TTSGUI:
             self.voice_sample_var.set(filename)
             
             # Save last directory
-            self.config.set('last_directory', str(Path(filename).parent))
+            self.config.set('last_directory', os.path.dirname(filename))
+    
+    def _get_ebook(self, filename):
+        """
+        Get ebook for file, reusing one already parsed if the file hasn't changed
+        
+        Args:
+            filename (str): Ebook file path
+            
+        Returns:
+            Ebook: Ebook object
+        """
+        from .core.ebook import Ebook
+        
+        try:
+            key = self._ebook_key(filename)
+        except OSError:
+            # Let Ebook report the missing file
+            return Ebook(filename)
+        
+        with self._ebook_cache_lock:
+            ebook = self._ebook_cache.get(key)
+            if ebook is not None:
+                self._ebook_cache.move_to_end(key)
+                return ebook
+        
+        ebook = Ebook(filename)
+        
+        with self._ebook_cache_lock:
+            self._ebook_cache[key] = ebook
+            while len(self._ebook_cache) > EBOOK_CACHE_SIZE:
+                self._ebook_cache.popitem(last=False)
+        
+        return ebook
+    
+    def _ebook_key(self, filename):
+        """
+        Get cache key for an ebook file, changing when the file is modified
+        
+        Args:
+            filename (str): Ebook file path
+            
+        Returns:
+            tuple: (absolute path, modification time)
+            
+        Raises:
+            OSError: If the file can't be accessed
+        """
+        return (os.path.abspath(filename), os.path.getmtime(filename))
+    
+    def _get_cached_full_text(self, ebook):
+        """
+        Get full text of ebook if it has already been extracted
+        
+        Args:
+            ebook (Ebook): Ebook object
+            
+        Returns:
+            str: Full text, or None if not extracted yet
+        """
+        try:
+            key = self._ebook_key(ebook.file_path)
+        except OSError:
+            return None
+        
+        with self._ebook_cache_lock:
+            text = self._text_cache.get(key)
+            if text is not None:
+                self._text_cache.move_to_end(key)
+            return text
+    
+    def _get_full_text(self, ebook):
+        """
+        Get full text of ebook, extracting it only once per ebook file
+        
+        Args:
+            ebook (Ebook): Ebook object
+            
+        Returns:
+            str: Full text
+        """
+        text = self._get_cached_full_text(ebook)
+        if text is not None:
+            return text
+        
+        text = ebook.get_full_text()
+        
+        try:
+            key = self._ebook_key(ebook.file_path)
+        except OSError:
+            return text
+        
+        with self._ebook_cache_lock:
+            self._text_cache[key] = text
+            while len(self._text_cache) > EBOOK_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        
+        return text
     
     def load_ebook(self, filename):
         """Load ebook file"""
         try:
             self.set_status(f"Loading {filename}...")
-            self.ebook = Ebook(filename)
+            self.ebook = self._get_ebook(filename)
             
             # Display ebook metadata
             metadata = self.ebook.get_metadata()
-            title = metadata.get('title', Path(filename).name)
+            title = metadata.get('title', os.path.basename(filename))
             author = metadata.get('author', 'Unknown')
             
             self.set_status(f"Loaded {title} by {author}")
@@ -557,11 +799,10 @@ class EPUB2TTSGUI:
         
         try:
             self.set_status("Extracting text...")
-            text = self.ebook.get_full_text()
+            text = self._get_full_text(self.ebook)
             
             # Display text
-            self.text_area.delete(1.0, tk.END)
-            self.text_area.insert(tk.END, text)
+            self._load_text(text)
             
             self.set_status("Text extracted successfully")
             
@@ -576,33 +817,87 @@ class EPUB2TTSGUI:
             messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {str(e)}")
             self.set_status(f"Unexpected error: {str(e)}")
     
+    def _load_text(self, text):
+        """
+        Replace text area contents, inserting the text in chunks from idle
+        callbacks so a long book doesn't block the event loop
+        
+        Args:
+            text (str): Text to display
+        """
+        self._full_text = text
+        
+        # Abandon any load still in progress
+        self._text_load_id += 1
+        
+        self.text_area.config(state=tk.NORMAL)
+        self.text_area.delete(1.0, tk.END)
+        self.text_area.config(state=tk.DISABLED)
+        
+        self._append_text_chunk(self._text_load_id, 0)
+    
+    def _append_text_chunk(self, load_id, start):
+        """
+        Insert the next chunk of text being loaded into the text area
+        
+        Args:
+            load_id (int): Load the chunk belongs to
+            start (int): Offset of the chunk in the text
+        """
+        if load_id != self._text_load_id:
+            return
+        
+        end = start + TEXT_INSERT_CHUNK_SIZE
+        
+        self.text_area.config(state=tk.NORMAL)
+        self.text_area.insert(tk.END, self._full_text[start:end])
+        
+        if end < len(self._full_text):
+            # Keep the text read-only until it is fully loaded
+            self.text_area.config(state=tk.DISABLED)
+            self.root.after_idle(self._append_text_chunk, load_id, end)
+        else:
+            # Track user edits from here on
+            self.text_area.edit_modified(False)
+    
+    def _get_text(self):
+        """
+        Get text area contents, without reading them back from the widget
+        unless the user has edited them
+        
+        Returns:
+            str: Text
+        """
+        if self._full_text is not None and not self.text_area.edit_modified():
+            return self._full_text
+        
+        return self.text_area.get(1.0, tk.END)
+    
     def save_text(self):
         """Save extracted text to file"""
-        if not self.text_area.get(1.0, tk.END).strip():
+        text = self._get_text()
+        
+        if not text.strip():
             messagebox.showwarning("No Text", "No text to save.")
             return
         
-        filetypes = [
-            ("Text files", "*.txt"),
-            ("All files", "*.*")
-        ]
-        
         filename = filedialog.asksaveasfilename(
             title="Save Text",
-            filetypes=filetypes,
+            filetypes=TEXT_FILETYPES,
             initialdir=self.config.get('last_directory'),
             defaultextension=".txt"
         )
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.text_area.get(1.0, tk.END))
+                # One encode and one write, without newline translation
+                with open(filename, 'wb') as f:
+                    f.write(text.encode('utf-8'))
                 
                 self.set_status(f"Text saved to {filename}")
                 
                 # Save last directory
-                self.config.set('last_directory', str(Path(filename).parent))
+                self.config.set('last_directory', os.path.dirname(filename))
             except Exception as e:
                 logger.error(f"Error saving text: {str(e)}")
                 messagebox.showerror("Error Saving Text", f"Error saving text: {str(e)}")
@@ -625,105 +920,205 @@ class EPUB2TTSGUI:
         # Update configuration from GUI
         self.update_config_from_gui()
         
-        # Start conversion in a separate thread
-        self.conversion_thread = threading.Thread(target=self.conversion_worker)
-        self.conversion_thread.daemon = True
-        self.conversion_thread.start()
+        # Read settings here, Tk variables must not be touched from other threads
+        job = self._snapshot_settings()
+        
+        # Start conversion on the conversion loop
+        self.conversion_future = asyncio.run_coroutine_threadsafe(self._conversion_coro(job), self._loop)
         
         # Update UI
         self.is_converting = True
         self.stop_requested = False
+        self.progress_var.set(0)
         self.convert_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.set_status("Converting...")
     
-    def conversion_worker(self):
-        """Worker function for conversion thread"""
+    def _snapshot_settings(self):
+        """
+        Read conversion settings from the GUI, on the Tk thread
+        
+        Returns:
+            dict: Conversion job settings
+        """
+        return {
+            'input_file': self.input_file_var.get(),
+            'output_file': self.output_file_var.get(),
+            'text_only': self.text_only_var.get(),
+            'engine': self.engine_var.get(),
+            'engine_config': {
+                'voice': self.voice_var.get(),
+                'language': self.language_var.get(),
+                'voice_sample': self.voice_sample_var.get(),
+                'speed': self.speed_var.get(),
+                'volume': self.volume_var.get(),
+                'pitch': self.pitch_var.get()
+            },
+            'converter_config': {
+                'chunk_size': self.chunk_size_var.get(),
+                'max_workers': self.processes_var.get() or None,
+                'chapter_workers': self.config.get('chapter_workers', 2),
+                'keep_temp_files': self.keep_temp_var.get(),
+                'output_format': self.format_var.get(),
+                'output_quality': self.quality_var.get(),
+                'output_sample_rate': self.sample_rate_var.get()
+            }
+        }
+    
+    def _post_ui(self, func, *args):
+        """
+        Queue a widget update to run on the Tk thread
+        
+        Args:
+            func (callable): Function to call
+            *args: Arguments for the function
+        """
+        self._ui_queue.put((func, args))
+    
+    def _drain_ui_queue(self):
+        """Apply widget updates queued by background work, then poll again"""
+        self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            func(*args)
+    
+    async def _conversion_coro(self, job):
+        """
+        Convert ebook to audiobook on the conversion loop
+        
+        Blocking steps run in the loop's default executor, since the converter
+        runs event loops of its own. Widgets are only updated through the UI queue.
+        
+        Args:
+            job (dict): Conversion settings read from the GUI
+        """
+        loop = asyncio.get_running_loop()
+        
         try:
-            # Load ebook if not already loaded
-            if not self.ebook or self.ebook.file_path != Path(self.input_file_var.get()):
-                self.ebook = Ebook(self.input_file_var.get())
+            from .core.tts_engines import get_tts_engine
+            from .converters.book_converter import BookConverter
+            
+            # Load ebook, reusing it if already parsed
+            self.ebook = await loop.run_in_executor(None, self._get_ebook, job['input_file'])
             
             # Get TTS engine
-            self.tts_engine = get_tts_engine(
-                self.engine_var.get(),
-                {
-                    'voice': self.voice_var.get(),
-                    'language': self.language_var.get(),
-                    'voice_sample': self.voice_sample_var.get(),
-                    'speed': self.speed_var.get(),
-                    'volume': self.volume_var.get(),
-                    'pitch': self.pitch_var.get()
-                }
+            self.tts_engine = await loop.run_in_executor(
+                None, get_tts_engine, job['engine'], job['engine_config']
             )
             
             # Create converter
-            self.converter = BookConverter(
-                self.ebook,
-                self.tts_engine,
-                {
-                    'chunk_size': self.chunk_size_var.get(),
-                    'max_workers': self.processes_var.get(),
-                    'keep_temp_files': self.keep_temp_var.get(),
-                    'output_format': self.format_var.get(),
-                    'output_quality': self.quality_var.get(),
-                    'output_sample_rate': self.sample_rate_var.get()
-                }
-            )
+            self.converter = BookConverter(self.ebook, self.tts_engine, job['converter_config'])
+            
+            # Define progress callback, called from the converter's chapter threads
+            progress_lock = threading.Lock()
+            last_progress_update = 0.0
+            shown_percent = 0
             
-            # Define progress callback
             def progress_callback(progress):
-                if not self.stop_requested:
-                    self.progress_var.set(progress)
+                nonlocal last_progress_update, shown_percent
+                
+                if self.stop_requested:
+                    return
+                
+                # Only whole percents are shown, and drop updates faster
+                # than the screen can show them
+                percent = int(progress)
+                now = time.monotonic()
+                with progress_lock:
+                    if percent == shown_percent:
+                        return
+                    if percent < 100 and now - last_progress_update < PROGRESS_UPDATE_INTERVAL:
+                        return
+                    shown_percent = percent
+                    last_progress_update = now
+                
+                self._post_ui(self.progress_var.set, percent)
             
             # Define status callback
             def status_callback(status):
                 if not self.stop_requested:
-                    self.set_status(status)
+                    self._post_ui(self.set_status, status)
             
-            if self.text_only_var.get():
-                # Extract text only
-                text = self.ebook.get_full_text()
+            if job['text_only']:
+                # Extract text only, reusing text already extracted for the
+                # text tab or else writing one chapter at a time
+                def write_text():
+                    with open(job['output_file'], 'w', encoding='utf-8') as f:
+                        text = self._get_cached_full_text(self.ebook)
+                        if text is None:
+                            self.ebook.write_full_text(f)
+                        else:
+                            f.write(text)
                 
-                with open(self.output_file_var.get(), 'w', encoding='utf-8') as f:
-                    f.write(text)
+                await loop.run_in_executor(None, write_text)
                 
-                self.set_status(f"Text extracted to {self.output_file_var.get()}")
+                self._post_ui(self.set_status, f"Text extracted to {job['output_file']}")
             else:
                 # Convert to audio
-                self.converter.convert_book(
-                    self.output_file_var.get(),
+                work = loop.run_in_executor(
+                    None,
+                    self.converter.convert_book,
+                    job['output_file'],
                     progress_callback,
                     status_callback
                 )
                 
-                self.set_status(f"Conversion completed: {self.output_file_var.get()}")
+                try:
+                    await asyncio.shield(work)
+                except asyncio.CancelledError:
+                    # The converter can't be interrupted, let it wind down
+                    # now that the TTS engine has been stopped
+                    await work
+                    raise
+                
+                # The last update may have been dropped
+                self._post_ui(self.progress_var.set, 100)
+                self._post_ui(self.set_status, f"Conversion completed: {job['output_file']}")
             
             # Show success message
             if not self.stop_requested:
-                messagebox.showinfo("Conversion Complete", "Conversion completed successfully.")
+                self._post_ui(messagebox.showinfo, "Conversion Complete", "Conversion completed successfully.")
+        
+        except asyncio.CancelledError:
+            logger.info("Conversion stopped")
         
         except EPUB2TTSError as e:
             logger.error(f"Error during conversion: {str(e)}")
             if not self.stop_requested:
-                messagebox.showerror("Conversion Error", str(e))
-                self.set_status(f"Error: {str(e)}")
+                self._post_ui(messagebox.showerror, "Conversion Error", str(e))
+                self._post_ui(self.set_status, f"Error: {str(e)}")
         
         except Exception as e:
             logger.error(f"Unexpected error during conversion: {str(e)}")
             if not self.stop_requested:
-                messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {str(e)}")
-                self.set_status(f"Unexpected error: {str(e)}")
+                self._post_ui(messagebox.showerror, "Unexpected Error", f"An unexpected error occurred: {str(e)}")
+                self._post_ui(self.set_status, f"Unexpected error: {str(e)}")
         
         finally:
-            # Reset UI
-            self.is_converting = False
-            self.convert_button.config(state=tk.NORMAL)
-            self.stop_button.config(state=tk.DISABLED)
+            # Release the converter's worker pool, the conversion has finished by now
+            if self.converter:
+                try:
+                    self.converter.close()
+                except Exception as e:
+                    logger.warning(f"Error closing converter: {str(e)}")
             
-            if self.stop_requested:
-                self.set_status("Conversion stopped")
-                self.stop_requested = False
+            self._post_ui(self._conversion_finished)
+    
+    def _conversion_finished(self):
+        """Reset UI after conversion has finished or stopped"""
+        self.is_converting = False
+        self.conversion_future = None
+        self.convert_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        
+        if self.stop_requested:
+            self.set_status("Conversion stopped")
+            self.stop_requested = False
     
     def stop_conversion(self):
         """Stop conversion"""
@@ -733,12 +1128,21 @@ class EPUB2TTSGUI:
         self.stop_requested = True
         self.set_status("Stopping conversion...")
         
+        # Have the converter skip the remaining chapters and chunks, its
+        # worker threads would otherwise keep the process alive after quitting
+        if self.converter:
+            self.converter.cancel()
+        
         # Stop TTS engine
         if self.tts_engine:
             try:
                 self.tts_engine.stop()
             except Exception as e:
                 logger.error(f"Error stopping TTS engine: {str(e)}")
+        
+        # Cancel the remaining conversion steps
+        if self.conversion_future:
+            self.conversion_future.cancel()
     
     def update_config_from_gui(self):
         """Update configuration from GUI values"""
@@ -750,7 +1154,7 @@ class EPUB2TTSGUI:
         self.config.set('volume', self.volume_var.get())
         self.config.set('pitch', self.pitch_var.get())
         self.config.set('chunk_size', self.chunk_size_var.get())
-        self.config.set('max_workers', self.processes_var.get())
+        self.config.set('max_workers', self.processes_var.get() or None)
         self.config.set('keep_temp_files', self.keep_temp_var.get())
         self.config.set('output_format', self.format_var.get())
         self.config.set('output_quality', self.quality_var.get())
@@ -785,14 +1189,14 @@ class EPUB2TTSGUI:
         
         output_var = tk.StringVar()
         output_entry = ttk.Entry(dialog, textvariable=output_var, width=30)
-        output_entry.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        output_entry.grid(row=0, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         browse_button = ttk.Button(
             dialog, 
             text="Browse", 
             command=lambda: output_var.set(filedialog.asksaveasfilename(
                 title="Save Recording",
-                filetypes=[("WAV files", "*.wav"), ("All files", "*.*")],
+                filetypes=WAV_FILETYPES,
                 initialdir=self.config.get('last_directory'),
                 defaultextension=".wav"
             ))
@@ -847,62 +1251,60 @@ class EPUB2TTSGUI:
         # Disable record button
         record_button.config(state=tk.DISABLED)
         
+        # Whisper settings are read here, widgets are only touched on the Tk thread
+        whisper_settings = (self.whisper_model_var.get(), self.whisper_language_var.get())
+        
         # Start recording in a separate thread
         threading.Thread(
             target=self._record_audio_thread,
-            args=(output_file, duration, transcribe, status_var, record_button),
+            args=(output_file, duration, transcribe, whisper_settings, status_var, record_button),
             daemon=True
         ).start()
     
-    def _record_audio_thread(self, output_file, duration, transcribe, status_var, record_button):
-        """Thread function for audio recording"""
+    def _record_audio_thread(self, output_file, duration, transcribe, whisper_settings, status_var, record_button):
+        """Thread function for audio recording, widget updates go through the UI queue"""
         try:
-            from .core.audio_utils import record_audio
-            
             # Update status
-            status_var.set(f"Recording for {duration} seconds...")
+            self._post_ui(status_var.set, f"Recording for {duration} seconds...")
             
             # Record audio
             record_audio(output_file, duration)
             
             # Transcribe if requested
             if transcribe:
-                status_var.set("Transcribing...")
+                self._post_ui(status_var.set, "Transcribing...")
                 
-                # Initialize transcriber
-                transcriber = WhisperTranscriber(
-                    self.whisper_model_var.get(),
-                    self.whisper_language_var.get()
-                )
+                # Get transcriber, reusing a loaded model
+                transcriber = self._get_transcriber(*whisper_settings)
                 
                 # Transcribe audio
                 text = transcriber.transcribe(output_file)
                 
                 # Save transcription
-                text_file = Path(output_file).with_suffix('.txt')
+                text_file = os.path.splitext(output_file)[0] + '.txt'
                 with open(text_file, 'w', encoding='utf-8') as f:
                     f.write(text)
                 
-                status_var.set(f"Transcription saved to {text_file}")
+                self._post_ui(status_var.set, f"Transcription saved to {text_file}")
             else:
-                status_var.set(f"Recording saved to {output_file}")
+                self._post_ui(status_var.set, f"Recording saved to {output_file}")
             
             # Save last directory
-            self.config.set('last_directory', str(Path(output_file).parent))
+            self.config.set('last_directory', os.path.dirname(output_file))
         
         except EPUB2TTSError as e:
             logger.error(f"Error recording audio: {str(e)}")
-            status_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Recording Error", str(e))
+            self._post_ui(status_var.set, f"Error: {str(e)}")
+            self._post_ui(messagebox.showerror, "Recording Error", str(e))
         
         except Exception as e:
             logger.error(f"Unexpected error recording audio: {str(e)}")
-            status_var.set(f"Unexpected error: {str(e)}")
-            messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {str(e)}")
+            self._post_ui(status_var.set, f"Unexpected error: {str(e)}")
+            self._post_ui(messagebox.showerror, "Unexpected Error", f"An unexpected error occurred: {str(e)}")
         
         finally:
             # Enable record button
-            record_button.config(state=tk.NORMAL)
+            self._post_ui(record_button.config, {'state': tk.NORMAL})
     
     def transcribe_audio(self):
         """Transcribe audio file"""
@@ -919,7 +1321,7 @@ class EPUB2TTSGUI:
         
         input_var = tk.StringVar()
         input_entry = ttk.Entry(dialog, textvariable=input_var, width=30)
-        input_entry.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        input_entry.grid(row=0, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         browse_button = ttk.Button(
             dialog, 
@@ -927,13 +1329,7 @@ class EPUB2TTSGUI:
             command=lambda: input_var.set(filedialog.askopenfilename(
 
                 title="Select Audio File",
-                filetypes=[
-                    ("Audio files", "*.wav *.mp3 *.ogg"),
-                    ("WAV files", "*.wav"),
-                    ("MP3 files", "*.mp3"),
-                    ("OGG files", "*.ogg"),
-                    ("All files", "*.*")
-                ],
+                filetypes=AUDIO_FILETYPES,
                 initialdir=self.config.get('last_directory')
             ))
         )
@@ -944,14 +1340,14 @@ class EPUB2TTSGUI:
         
         output_var = tk.StringVar()
         output_entry = ttk.Entry(dialog, textvariable=output_var, width=30)
-        output_entry.grid(row=1, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        output_entry.grid(row=1, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         output_browse_button = ttk.Button(
             dialog, 
             text="Browse", 
             command=lambda: output_var.set(filedialog.asksaveasfilename(
                 title="Save Transcription",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+                filetypes=TEXT_FILETYPES,
                 initialdir=self.config.get('last_directory'),
                 defaultextension=".txt"
             ))
@@ -962,7 +1358,7 @@ class EPUB2TTSGUI:
         ttk.Label(dialog, text="Model:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         
         model_var = tk.StringVar(value=self.whisper_model_var.get())
-        model_combobox = ttk.Combobox(dialog, textvariable=model_var, values=['tiny', 'base', 'small', 'medium', 'large'], state="readonly")
+        model_combobox = ttk.Combobox(dialog, textvariable=model_var, values=WHISPER_MODELS, state="readonly")
         model_combobox.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Language
@@ -970,7 +1366,7 @@ class EPUB2TTSGUI:
         
         language_var = tk.StringVar(value=self.whisper_language_var.get())
         language_entry = ttk.Entry(dialog, textvariable=language_var)
-        language_entry.grid(row=3, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        language_entry.grid(row=3, column=1, sticky=STICKY_WE, padx=5, pady=5)
         
         # Status label
         status_var = tk.StringVar(value="Ready to transcribe")
@@ -1017,58 +1413,95 @@ class EPUB2TTSGUI:
         ).start()
     
     def _transcribe_audio_thread(self, input_file, output_file, model, language, status_var, transcribe_button):
-        """Thread function for audio transcription"""
+        """Thread function for audio transcription, widget updates go through the UI queue"""
         try:
             # Update status
-            status_var.set("Transcribing...")
+            self._post_ui(status_var.set, "Transcribing...")
             
-            # Initialize transcriber
-            transcriber = WhisperTranscriber(model, language)
+            # Get transcriber, reusing a loaded model
+            transcriber = self._get_transcriber(model, language)
             
             # Transcribe audio
             text = transcriber.transcribe(input_file, output_file)
             
             if output_file:
-                status_var.set(f"Transcription saved to {output_file}")
+                self._post_ui(status_var.set, f"Transcription saved to {output_file}")
             else:
-                # Create a dialog to display the transcription
-                result_dialog = tk.Toplevel(self.root)
-                result_dialog.title("Transcription Result")
-                result_dialog.geometry("600x400")
-                result_dialog.transient(self.root)
-                result_dialog.grab_set()
-                
-                # Text area
-                text_area = tk.Text(result_dialog, wrap=tk.WORD)
-                text_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-                text_area.insert(tk.END, text)
-                
-                # Scrollbar
-                scrollbar = ttk.Scrollbar(text_area, command=text_area.yview)
-                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                text_area.config(yscrollcommand=scrollbar.set)
-                
-                # Close button
-                ttk.Button(result_dialog, text="Close", command=result_dialog.destroy).pack(pady=5)
-                
-                status_var.set("Transcription completed")
+                self._post_ui(self._show_transcription, text)
+                self._post_ui(status_var.set, "Transcription completed")
             
             # Save last directory
-            self.config.set('last_directory', str(Path(input_file).parent))
+            self.config.set('last_directory', os.path.dirname(input_file))
         
         except EPUB2TTSError as e:
             logger.error(f"Error transcribing audio: {str(e)}")
-            status_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Transcription Error", str(e))
+            self._post_ui(status_var.set, f"Error: {str(e)}")
+            self._post_ui(messagebox.showerror, "Transcription Error", str(e))
         
         except Exception as e:
             logger.error(f"Unexpected error transcribing audio: {str(e)}")
-            status_var.set(f"Unexpected error: {str(e)}")
-            messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {str(e)}")
+            self._post_ui(status_var.set, f"Unexpected error: {str(e)}")
+            self._post_ui(messagebox.showerror, "Unexpected Error", f"An unexpected error occurred: {str(e)}")
         
         finally:
             # Enable transcribe button
-            transcribe_button.config(state=tk.NORMAL)
+            self._post_ui(transcribe_button.config, {'state': tk.NORMAL})
+    
+    def _get_transcriber(self, model, language):
+        """
+        Get Whisper transcriber, loading the model only if it isn't cached
+        
+        Args:
+            model (str): Whisper model name
+            language (str): Language code
+            
+        Returns:
+            WhisperTranscriber: Transcriber
+        """
+        from .whisper.transcriber import WhisperTranscriber
+        
+        key = (model, language)
+        
+        with self._transcriber_cache_lock:
+            transcriber = self._transcriber_cache.get(key)
+            if transcriber is not None:
+                self._transcriber_cache.move_to_end(key)
+                return transcriber
+        
+        transcriber = WhisperTranscriber(model, language)
+        
+        with self._transcriber_cache_lock:
+            self._transcriber_cache[key] = transcriber
+            while len(self._transcriber_cache) > TRANSCRIBER_CACHE_SIZE:
+                self._transcriber_cache.popitem(last=False)
+        
+        return transcriber
+    
+    def _show_transcription(self, text):
+        """
+        Show transcription result in a dialog
+        
+        Args:
+            text (str): Transcribed text
+        """
+        result_dialog = tk.Toplevel(self.root)
+        result_dialog.title("Transcription Result")
+        result_dialog.geometry("600x400")
+        result_dialog.transient(self.root)
+        result_dialog.grab_set()
+        
+        # Text area
+        text_area = tk.Text(result_dialog, wrap=tk.WORD)
+        text_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text_area.insert(tk.END, text)
+        
+        # Scrollbar
+        scrollbar = ttk.Scrollbar(text_area, command=text_area.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text_area.config(yscrollcommand=scrollbar.set)
+        
+        # Close button
+        ttk.Button(result_dialog, text="Close", command=result_dialog.destroy).pack(pady=5)
     
     def show_about(self):
         """Show about dialog"""
@@ -1088,9 +1521,15 @@ License: MIT
         messagebox.showinfo("About EPUB2TTS", about_text)
     
     def set_status(self, status):
-        """Set status bar text"""
+        """Set status bar text, redrawing right away at most every STATUS_FLUSH_INTERVAL"""
         self.status_var.set(status)
-        self.root.update_idletasks()
+        
+        # A forced redraw shows the status before blocking work on the Tk
+        # thread, other updates are drawn when Tk is next idle
+        now = time.monotonic()
+        if now - self._last_status_flush >= STATUS_FLUSH_INTERVAL:
+            self._last_status_flush = now
+            self.root.update_idletasks()
     
     def handle_exception(self, exc_type, exc_value, exc_traceback):
         """Handle uncaught exceptions"""
@@ -1099,12 +1538,25 @@ License: MIT
     
     def on_closing(self):
         """Handle window closing"""
+        # Persist settings changed during the session, e.g. theme and last directory
+        try:
+            self.config.flush()
+        except Exception as e:
+            logger.warning(f"Error saving settings: {str(e)}")
+        
         if self.is_converting:
             if messagebox.askyesno("Quit", "A conversion is in progress. Are you sure you want to quit?"):
                 self.stop_conversion()
+                self._shutdown_executor()
                 self.root.destroy()
         else:
+            self._shutdown_executor()
             self.root.destroy()
+    
+    def _shutdown_executor(self):
+        """Stop the conversion loop and release its worker threads without waiting"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._executor.shutdown(wait=False)
 
 def main():
     """Main entry point for GUI"""
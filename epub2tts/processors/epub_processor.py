@@ -4,15 +4,132 @@ EPUB processor for EPUB2TTS
 
 import os
 import logging
+import zipfile
+import posixpath
+import threading
+import importlib.util
+import collections
+import multiprocessing
+import concurrent.futures
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from urllib.parse import unquote
 from ..core.exceptions import FileError, ProcessingError
 from ..core.text_utils import clean_text
 
 logger = logging.getLogger(__name__)
 
+# HTML parser for chapter content, the C-based lxml parser when installed
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Number of parsed chapters kept for reuse between title and text lookups
+SOUP_CACHE_SIZE = 32
+
+# XML namespaces used by the EPUB container and package documents
+CONTAINER_NS = {'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
+OPF_NS = {'opf': 'http://www.idpf.org/2007/opf', 'dc': 'http://purl.org/dc/elements/1.1/'}
+
+# Manifest media types read as chapters
+DOCUMENT_MEDIA_TYPES = ('application/xhtml+xml', 'text/html')
+
+# Books with fewer chapters are parsed inline rather than in worker processes
+PARALLEL_MIN_CHAPTERS = 4
+
+# Most worker processes used to parse chapters
+PARSE_MAX_WORKERS = 4
+
+def _parse_html(content):
+    """
+    Parse chapter HTML, removing script and style elements
+    
+    Args:
+        content (bytes): Chapter XHTML content
+        
+    Returns:
+        BeautifulSoup: Parsed chapter
+    """
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(content.decode('utf-8'), HTML_PARSER)
+    
+    for element in soup(['script', 'style']):
+        element.decompose()
+    
+    return soup
+
+def _find_heading(soup):
+    """
+    Find first non-empty h1, h2 or h3 heading in parsed chapter
+    
+    Args:
+        soup (BeautifulSoup): Parsed chapter
+        
+    Returns:
+        str: Heading text, or None if there is none
+    """
+    for heading in soup.find_all(['h1', 'h2', 'h3']):
+        if heading.text.strip():
+            return heading.text.strip()
+    
+    return None
+
+def _chapter_title(heading, chapter, chapter_index):
+    """
+    Get chapter title from its heading, falling back to chapter ID or number
+    
+    Args:
+        heading (str): Chapter heading, or None
+        chapter (EPUBChapter): Chapter
+        chapter_index (int): Chapter index
+        
+    Returns:
+        str: Chapter title
+    """
+    return heading or chapter.id or f"Chapter {chapter_index + 1}"
+
+def _parse_chapter(content):
+    """
+    Extract heading and cleaned text from chapter HTML, run in worker processes
+    
+    Args:
+        content (bytes): Chapter XHTML content
+        
+    Returns:
+        tuple: (heading or None, chapter text)
+    """
+    soup = _parse_html(content)
+    return _find_heading(soup), clean_text(soup.get_text())
+
+class EPUBChapter:
+    """Chapter document in an EPUB file, read from the archive on demand"""
+    
+    def __init__(self, archive, item_id, path):
+        """
+        Initialize chapter
+        
+        Args:
+            archive (zipfile.ZipFile): Open EPUB archive
+            item_id (str): Manifest item ID
+            path (str): Path of the document in the archive
+        """
+        self._archive = archive
+        self.id = item_id
+        self.path = path
+    
+    def get_content(self):
+        """
+        Read chapter content from the archive
+        
+        Returns:
+            bytes: Chapter XHTML content
+        """
+        return self._archive.read(self.path)
+
 class EPUBProcessor:
     """Processor for EPUB files"""
     
+    _zip = None
+    
     def __init__(self, file_path):
         """
         Initialize EPUB processor
@@ -33,28 +150,54 @@ class EPUBProcessor:
             logger.error(f"Not an EPUB file: {self.file_path}")
             raise FileError(f"Not an EPUB file: {self.file_path}")
         
-        self.book = None
+        self._zip = None
+        self.opf = None
         self.spine = []
-        self.toc = []
+        self.manifest = {}
         self.metadata = {}
         
+        self._chapters = []
+        self._soup_cache = collections.OrderedDict()
+        self._soup_cache_lock = threading.Lock()
+        
         self._load_epub()
     
     def _load_epub(self):
-        """Load EPUB file"""
+        """
+        Load EPUB file, reading only the package document up front
+        
+        Chapter documents stay in the archive until they are needed.
+        """
         try:
-            import ebooklib
-            from ebooklib import epub
-            from bs4 import BeautifulSoup
+            import bs4
+            
+            self._zip = zipfile.ZipFile(self.file_path)
+            
+            # Find package document
+            container = ET.fromstring(self._zip.read('META-INF/container.xml'))
+            rootfile = container.find('.//container:rootfile', CONTAINER_NS)
+            opf_path = rootfile.get('full-path')
+            opf_dir = posixpath.dirname(opf_path)
             
-            self.book = epub.read_epub(self.file_path)
+            self.opf = ET.fromstring(self._zip.read(opf_path))
+            
+            # Get manifest, resolving hrefs against the package document
+            for item in self.opf.iterfind('opf:manifest/opf:item', OPF_NS):
+                path = posixpath.normpath(posixpath.join(opf_dir, unquote(item.get('href'))))
+                self.manifest[item.get('id')] = (
+                    path,
+                    item.get('media-type'),
+                    (item.get('properties') or '').split(),
+                )
             
             # Get spine (reading order)
-            self.spine = [item for item in self.book.spine if item[0] == 'nav']
-            self.spine.extend([item for item in self.book.spine if item[0] != 'nav'])
+            self.spine = [
+                (itemref.get('idref'), itemref.get('linear', 'yes'))
+                for itemref in self.opf.iterfind('opf:spine/opf:itemref', OPF_NS)
+            ]
             
-            # Get table of contents
-            self.toc = self.book.toc
+            # Resolve chapters once, so lookups don't walk the spine
+            self._chapters = self._find_chapters()
             
             # Get metadata
             self._extract_metadata()
@@ -62,8 +205,8 @@ class EPUBProcessor:
             logger.debug(f"Loaded EPUB file: {self.file_path}")
         
         except ImportError:
-            logger.error("ebooklib and beautifulsoup4 are required for EPUB processing")
-            raise FileError("ebooklib and beautifulsoup4 are required for EPUB processing. Please install them with 'pip install ebooklib beautifulsoup4'.")
+            logger.error("beautifulsoup4 is required for EPUB processing")
+            raise FileError("beautifulsoup4 is required for EPUB processing. Please install it with 'pip install beautifulsoup4'.")
         
         except Exception as e:
             logger.error(f"Error loading EPUB file: {str(e)}")
@@ -72,27 +215,22 @@ class EPUBProcessor:
     def _extract_metadata(self):
         """Extract metadata from EPUB file"""
         try:
-            # Get basic metadata
-            self.metadata = {
-                'title': self.book.get_metadata('DC', 'title'),
-                'author': self.book.get_metadata('DC', 'creator'),
-                'language': self.book.get_metadata('DC', 'language'),
-                'identifier': self.book.get_metadata('DC', 'identifier'),
-                'publisher': self.book.get_metadata('DC', 'publisher'),
-                'date': self.book.get_metadata('DC', 'date'),
-                'rights': self.book.get_metadata('DC', 'rights'),
-                'description': self.book.get_metadata('DC', 'description'),
+            fields = {
+                'title': 'title',
+                'author': 'creator',
+                'language': 'language',
+                'identifier': 'identifier',
+                'publisher': 'publisher',
+                'date': 'date',
+                'rights': 'rights',
+                'description': 'description',
             }
             
-            # Clean up metadata
-            for key, value in self.metadata.items():
-                if isinstance(value, list) and value:
-                    if isinstance(value[0], tuple) and len(value[0]) > 0:
-                        self.metadata[key] = value[0][0]
-                    else:
-                        self.metadata[key] = value[0]
-                elif not value:
-                    self.metadata[key] = None
+            # Use the first value of each Dublin Core element
+            self.metadata = {}
+            for key, element in fields.items():
+                value = self.opf.findtext(f'opf:metadata/dc:{element}', None, OPF_NS)
+                self.metadata[key] = value.strip() if value and value.strip() else None
             
             logger.debug(f"Extracted metadata: {self.metadata}")
         
@@ -120,15 +258,29 @@ class EPUBProcessor:
         Returns:
             list: List of chapter items
         """
-        try:
-            from ebooklib import epub
+        return self._chapters
+    
+    def _find_chapters(self):
+        """
+        Find chapter documents in spine order
+        
+        Returns:
+            list: List of chapter items
             
-            # Get all HTML items
+        Raises:
+            ProcessingError: If spine cannot be resolved
+        """
+        try:
+            # Get all HTML items, skipping the navigation document
             chapters = []
-            for item_id in self.spine:
-                item = self.book.get_item_with_id(item_id[0])
-                if item and item.get_type() == ebooklib.ITEM_DOCUMENT:
-                    chapters.append(item)
+            for item_id, _ in self.spine:
+                item = self.manifest.get(item_id)
+                if item is None:
+                    continue
+                
+                path, media_type, properties = item
+                if media_type in DOCUMENT_MEDIA_TYPES and 'nav' not in properties:
+                    chapters.append(EPUBChapter(self._zip, item_id, path))
             
             logger.debug(f"Found {len(chapters)} chapters")
             return chapters
@@ -137,6 +289,50 @@ class EPUBProcessor:
             logger.error(f"Error getting chapters: {str(e)}")
             raise ProcessingError(f"Error getting chapters: {str(e)}")
     
+    def close(self):
+        """Close EPUB archive"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+    
+    def __del__(self):
+        """Close EPUB archive when processor is garbage collected"""
+        self.close()
+    
+    def _get_soup(self, chapter_index):
+        """
+        Get parsed HTML for chapter, with script and style elements removed
+        
+        Args:
+            chapter_index (int): Chapter index
+            
+        Returns:
+            BeautifulSoup: Parsed chapter, shared between callers
+            
+        Raises:
+            IndexError: If chapter index is out of range
+        """
+        with self._soup_cache_lock:
+            soup = self._soup_cache.get(chapter_index)
+            if soup is not None:
+                self._soup_cache.move_to_end(chapter_index)
+                return soup
+        
+        chapters = self.get_chapters()
+        
+        if chapter_index < 0 or chapter_index >= len(chapters):
+            logger.error(f"Chapter index out of range: {chapter_index}")
+            raise IndexError(f"Chapter index out of range: {chapter_index}")
+        
+        soup = _parse_html(chapters[chapter_index].get_content())
+        
+        with self._soup_cache_lock:
+            self._soup_cache[chapter_index] = soup
+            while len(self._soup_cache) > SOUP_CACHE_SIZE:
+                self._soup_cache.popitem(last=False)
+        
+        return soup
+    
     def get_chapter_text(self, chapter_index):
         """
         Get text for specific chapter
@@ -151,23 +347,7 @@ class EPUBProcessor:
             IndexError: If chapter index is out of range
         """
         try:
-            from bs4 import BeautifulSoup
-            
-            chapters = self.get_chapters()
-            
-            if chapter_index < 0 or chapter_index >= len(chapters):
-                logger.error(f"Chapter index out of range: {chapter_index}")
-                raise IndexError(f"Chapter index out of range: {chapter_index}")
-            
-            chapter = chapters[chapter_index]
-            content = chapter.get_content().decode('utf-8')
-            
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Remove script and style elements
-            for element in soup(['script', 'style']):
-                element.decompose()
+            soup = self._get_soup(chapter_index)
             
             # Get text
             text = soup.get_text()
@@ -195,34 +375,62 @@ class EPUBProcessor:
             IndexError: If chapter index is out of range
         """
         try:
-            from bs4 import BeautifulSoup
-            
-            chapters = self.get_chapters()
-            
-            if chapter_index < 0 or chapter_index >= len(chapters):
-                logger.error(f"Chapter index out of range: {chapter_index}")
-                raise IndexError(f"Chapter index out of range: {chapter_index}")
+            soup = self._get_soup(chapter_index)
             
-            chapter = chapters[chapter_index]
-            content = chapter.get_content().decode('utf-8')
-            
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
+            # Try to find title in heading elements, then use chapter ID or default title
+            return _chapter_title(_find_heading(soup), self._chapters[chapter_index], chapter_index)
+        
+        except Exception as e:
+            logger.error(f"Error getting chapter title: {str(e)}")
+            return f"Chapter {chapter_index + 1}"
+    
+    def _iter_chapter_sections(self):
+        """
+        Iterate over chapter titles and texts in order, parsing chapters of
+        larger books in parallel worker processes
+        
+        Yields:
+            tuple: (chapter title, chapter text)
+        """
+        chapters = self._chapters
+        
+        try:
+            if len(chapters) < PARALLEL_MIN_CHAPTERS:
+                # Title and text come from the same parse
+                for i, chapter in enumerate(chapters):
+                    soup = self._get_soup(i)
+                    yield _chapter_title(_find_heading(soup), chapter, i), clean_text(soup.get_text())
+                return
             
-            # Try to find title in heading elements
-            for heading in soup.find_all(['h1', 'h2', 'h3']):
-                if heading.text.strip():
-                    return heading.text.strip()
+            contents = [chapter.get_content() for chapter in chapters]
             
-            # If no heading found, use chapter ID or default title
-            if chapter.id:
-                return chapter.id
+            max_workers = min(PARSE_MAX_WORKERS, os.cpu_count() or 1, len(chapters))
             
-            return f"Chapter {chapter_index + 1}"
+            # Spawn rather than fork, callers such as the GUI have threads running
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                results = executor.map(_parse_chapter, contents, chunksize=4)
+                for i, (heading, text) in enumerate(results):
+                    yield _chapter_title(heading, chapters[i], i), text
         
         except Exception as e:
-            logger.error(f"Error getting chapter title: {str(e)}")
-            return f"Chapter {chapter_index + 1}"
+            logger.error(f"Error parsing chapters: {str(e)}")
+            raise ProcessingError(f"Error parsing chapters: {str(e)}")
+    
+    def iter_full_text(self):
+        """
+        Iterate over the full text of EPUB file, one chapter at a time
+        
+        Yields:
+            str: Chapter heading, chapter text and separators, as separate
+                pieces so chapter text is never copied
+        """
+        for i, (chapter_title, chapter_text) in enumerate(self._iter_chapter_sections()):
+            yield f"Chapter: {chapter_title}\n\n" if i == 0 else f"\nChapter: {chapter_title}\n\n"
+            yield chapter_text
+            yield "\n\n"
     
     def get_full_text(self):
         """
@@ -232,16 +440,7 @@ class EPUBProcessor:
             str: Full text
         """
         try:
-            chapters = self.get_chapters()
-            texts = []
-            
-            for i in range(len(chapters)):
-                chapter_title = self.get_chapter_title(i)
-                chapter_text = self.get_chapter_text(i)
-                
-                texts.append(f"Chapter: {chapter_title}\n\n{chapter_text}\n\n")
-            
-            return "\n".join(texts)
+            return "".join(self.iter_full_text())
         
         except Exception as e:
             logger.error(f"Error getting full text: {str(e)}")
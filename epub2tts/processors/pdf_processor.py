@@ -285,6 +285,20 @@ class PDFProcessor:
             logger.error(f"Error getting chapter title: {str(e)}")
             return f"Chapter {chapter_index + 1}"
     
+    def iter_full_text(self):
+        """
+        Iterate over the full text of PDF file, one chapter at a time
+        
+        Yields:
+            str: Chapter text with its heading
+        """
+        for i in range(len(self.chapters)):
+            chapter_title = self.get_chapter_title(i)
+            chapter_text = self.get_chapter_text(i)
+            
+            section = f"Chapter: {chapter_title}\n\n{chapter_text}\n\n"
+            yield section if i == 0 else "\n" + section
+    
     def get_full_text(self):
         """
         Get full text of PDF file
@@ -293,15 +307,7 @@ class PDFProcessor:
             str: Full text
         """
         try:
-            texts = []
-            
-            for i in range(len(self.chapters)):
-                chapter_title = self.get_chapter_title(i)
-                chapter_text = self.get_chapter_text(i)
-                
-                texts.append(f"Chapter: {chapter_title}\n\n{chapter_text}\n\n")
-            
-            return "\n".join(texts)
+            return "".join(self.iter_full_text())
         
         except Exception as e:
             logger.error(f"Error getting full text: {str(e)}")
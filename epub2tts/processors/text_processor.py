@@ -257,6 +257,15 @@ class TextProcessor:
             logger.error(f"Error getting chapter title: {str(e)}")
             return f"Chapter {chapter_index + 1}"
     
+    def iter_full_text(self):
+        """
+        Iterate over the full text of text file
+        
+        Yields:
+            str: Full text
+        """
+        yield self.get_full_text()
+    
     def get_full_text(self):
         """
         Get full text of text file
@@ -73,10 +73,8 @@ def main():
         # Extract text only if requested
         if args.text_only:
             print("Extracting text...")
-            text = ebook.get_full_text()
-            
             with open(args.output_file, 'w', encoding='utf-8') as f:
-                f.write(text)
+                ebook.write_full_text(f)
             
             print(f"Text extracted to {args.output_file}")
             return 0
@@ -14,8 +14,8 @@ setup(
         ],
     },
     install_requires=[
-        "ebooklib",
         "beautifulsoup4",
+        "lxml",
     ],
     extras_require={
         "pdf": ["pdfplumber"],
@@ -36,6 +36,8 @@ setup(
             "sounddevice",
             "soundfile",
             "psutil",
+            "orjson",
+            "xxhash",
         ],
     },
     classifiers=[